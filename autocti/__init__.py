@@ -42,6 +42,7 @@ from .extract.two_d.serial.eper import Extract2DSerialEPER
 from .extract.two_d.parallel.calibration import Extract2DParallelCalibration
 from .extract.two_d.serial.calibration import Extract2DSerialCalibration
 from .extract.two_d.master import Extract2DMaster
+from .extract.two_d.accumulator import Extract2DAccumulator
 from .instruments import euclid
 from .instruments import acs
 from .charge_injection.fit import FitImagingCI
@@ -56,13 +57,22 @@ from .extract.one_d.eper import Extract1DEPER
 from .extract.one_d.master import Extract1DMaster
 from .layout.one_d import Layout1D
 from .dataset_1d.dataset_1d.dataset_1d import Dataset1D
+from .dataset_1d.dataset_1d.packed import Dataset1DPacked
 from .dataset_1d.dataset_1d.simulator import SimulatorDataset1D
 from .dataset_1d.fit import FitDataset1D
 from .dataset_1d.model.analysis import AnalysisDataset1D
+from .dataset_1d.model.analysis_packed import AnalysisDataset1DPacked
 from .dataset_1d.model.result import ResultDataset1D
 from .charge_injection.model.analysis import AnalysisImagingCI
+from .charge_injection.model.analysis_combined import AnalysisImagingCICombined
 from .charge_injection.model.result import ResultImagingCI
 from .model.analysis import AnalysisCTI
+from .model.adaptive_express import AdaptiveExpress
+from .model.emulator import Emulator
+from .model.pre_check import PreCheckCCDWellFill
+from .model.pre_check import PreCheckPipeline
+from .model.pre_check import PreCheckTrapTimescales
+from .model.profiler import LikelihoodProfiler
 from .model.model_util import CTI1D
 from .model.model_util import CTI2D
 from .model.settings import SettingsCTI1D
@@ -1,5 +1,6 @@
 import copy
-from typing import Dict, Optional
+import numpy as np
+from typing import Dict, List, Optional, Tuple
 
 
 import autoarray as aa
@@ -37,6 +38,8 @@ class FitImagingCI(aa.FitImaging):
         self.noise_scaling_map_dict = dataset.noise_scaling_map_dict
         self.preloads = preloads
 
+        self._chi_squared_and_noise_normalization_hyper = None
+
     @property
     def imaging_ci(self) -> ImagingCI:
         return self.dataset
@@ -78,8 +81,30 @@ class FitImagingCI(aa.FitImaging):
 
         This function computes the `chi_squared` directly from the data, avoiding the need to store the data in memory
         and offering faster tune times.
+
+        If the noise-map is fixed and the `preloads` contain the flat indexes, data and inverse variances of the
+        unmasked pixels (e.g. as set up by `AnalysisImagingCI.modify_before_fit`), the `chi_squared` is computed
+        from only the unmasked pixels of the model data via `chi_squared_unmasked_from`.
+
+        If the noise-map is scaled by hyper noise and the `preloads` contain the stacked noise-scaling maps of the
+        unmasked pixels, the `chi_squared` is computed alongside the `noise_normalization` in a single pass via
+        `chi_squared_and_noise_normalization_hyper_from`.
         """
 
+        if self.use_hyper_noise_preloads:
+            return self.chi_squared_and_noise_normalization_hyper[0]
+
+        if (
+            self.hyper_noise_scalar_dict is None
+            and self.preloads.inverse_variance_unmasked is not None
+        ):
+            return chi_squared_unmasked_from(
+                model_data=self.model_data,
+                unmasked_index_array=self.preloads.unmasked_index_array,
+                data_unmasked=self.preloads.data_unmasked,
+                inverse_variance_unmasked=self.preloads.inverse_variance_unmasked,
+            )
+
         return aa.util.fit.chi_squared_with_mask_fast_from(
             data=self.dataset.data,
             noise_map=self.noise_map,
@@ -95,6 +120,9 @@ class FitImagingCI(aa.FitImaging):
         [Noise_Term] = sum(log(2*pi*[Noise]**2.0))
         """
 
+        if self.use_hyper_noise_preloads:
+            return self.chi_squared_and_noise_normalization_hyper[1]
+
         if self.preloads.noise_normalization is not None:
             return self.preloads.noise_normalization
 
@@ -102,6 +130,45 @@ class FitImagingCI(aa.FitImaging):
             noise_map=self.noise_map, mask=self.mask
         )
 
+    @property
+    def use_hyper_noise_preloads(self) -> bool:
+        """
+        Returns whether the `chi_squared` and `noise_normalization` of a fit with hyper noise are computed from the
+        stacked noise-scaling maps of the `preloads`, which requires that every hyper noise scalar of the fit has a
+        noise-scaling map in the stack.
+        """
+        return use_hyper_noise_preloads_from(
+            hyper_noise_scalar_dict=self.hyper_noise_scalar_dict,
+            preloads=self.preloads,
+        )
+
+    @property
+    def chi_squared_and_noise_normalization_hyper(self) -> Tuple[float, float]:
+        """
+        Returns the `chi_squared` and `noise_normalization` of a fit with hyper noise, computed from the stacked
+        noise-scaling maps of the unmasked pixels in the `preloads` via
+        `chi_squared_and_noise_normalization_hyper_from`.
+
+        Both terms are computed in the same pass, therefore they are stored after the first call such that
+        computing the `log_likelihood` does not compute the scaled noise-map twice.
+        """
+        if self._chi_squared_and_noise_normalization_hyper is None:
+            self._chi_squared_and_noise_normalization_hyper = (
+                chi_squared_and_noise_normalization_hyper_from(
+                    model_data=self.model_data,
+                    unmasked_index_array=self.preloads.unmasked_index_array,
+                    data_unmasked=self.preloads.data_unmasked,
+                    noise_map_unmasked=self.preloads.noise_map_unmasked,
+                    noise_scaling_stack=self.preloads.noise_scaling_stack,
+                    scale_factor_array=scale_factor_array_from(
+                        hyper_noise_scalar_dict=self.hyper_noise_scalar_dict,
+                        noise_scaling_key_list=self.preloads.noise_scaling_key_list,
+                    ),
+                )
+            )
+
+        return self._chi_squared_and_noise_normalization_hyper
+
     @property
     def chi_squared_map_of_regions_ci(self):
         return self.layout.extract.regions_array_2d_from(array=self.chi_squared_map)
@@ -144,3 +211,234 @@ def hyper_noise_map_from(hyper_noise_scalar_dict, noise_scaling_map_dict, noise_
         )
 
     return noise_map
+
+
+def unmasked_arrays_from(
+    data: aa.Array2D, noise_map: aa.Array2D, mask: aa.Mask2D
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the flat (1D) index of every unmasked pixel of a 2D dataset in its native array, alongside contiguous
+    arrays of the data and inverse variance (1.0 / noise**2.0) of these pixels.
+
+    If the noise-map is fixed these do not change during a model-fit, and are preloaded such that the chi-squared of
+    every fit is computed only from the unmasked pixels of the model data via `chi_squared_unmasked_from`.
+
+    Parameters
+    ----------
+    data
+        The data of the dataset.
+    noise_map
+        The noise-map of the dataset.
+    mask
+        The 2D mask of the dataset, where `True` entries are masked.
+
+    Returns
+    -------
+    The flat indexes of the unmasked pixels (as an `np.int64` array) and the data and inverse variance of the
+    unmasked pixels.
+    """
+    unmasked_index_array = np.flatnonzero(~np.asarray(mask, dtype="bool"))
+
+    data_unmasked = np.asarray(data.native, dtype="float").reshape(-1)[
+        unmasked_index_array
+    ]
+    noise_map_unmasked = np.asarray(noise_map.native, dtype="float").reshape(-1)[
+        unmasked_index_array
+    ]
+
+    return unmasked_index_array, data_unmasked, 1.0 / noise_map_unmasked**2.0
+
+
+def chi_squared_unmasked_from(
+    model_data: aa.Array2D,
+    unmasked_index_array: np.ndarray,
+    data_unmasked: np.ndarray,
+    inverse_variance_unmasked: np.ndarray,
+    residual_buffer: Optional[np.ndarray] = None,
+) -> float:
+    """
+    Returns the chi-squared of a fit from only the unmasked pixels of the model data, using the flat indexes, data
+    and inverse variances of the unmasked pixels computed via `unmasked_arrays_from`.
+
+    The unmasked pixels of the model data are gathered into a contiguous array and the chi-squared is a single dot
+    product of the residuals weighted by the inverse variances, avoiding the creation of any temporary array the
+    size of the full 2D image.
+
+    Parameters
+    ----------
+    model_data
+        The model data of the fit (e.g. the post-CTI data output by a clocker).
+    unmasked_index_array
+        The flat index of every unmasked pixel in the native 2D array.
+    data_unmasked
+        The data of every unmasked pixel.
+    inverse_variance_unmasked
+        The inverse variance (1.0 / noise**2.0) of every unmasked pixel.
+    residual_buffer
+        An optional preallocated array of the same shape as `data_unmasked`, which the residuals are written into
+        such that no temporary arrays are created (e.g. when the chi-squared is computed repeatedly in a model-fit).
+    """
+    model_data = np.asarray(getattr(model_data, "native", model_data)).reshape(-1)
+
+    if residual_buffer is not None:
+        np.take(model_data, unmasked_index_array, out=residual_buffer)
+        np.subtract(data_unmasked, residual_buffer, out=residual_buffer)
+        np.multiply(residual_buffer, residual_buffer, out=residual_buffer)
+
+        return float(np.dot(residual_buffer, inverse_variance_unmasked))
+
+    residual_unmasked = data_unmasked - model_data[unmasked_index_array]
+
+    return float(
+        np.dot(residual_unmasked * inverse_variance_unmasked, residual_unmasked)
+    )
+
+
+def noise_scaling_stack_from(
+    noise_scaling_map_dict: Dict[str, aa.Array2D], unmasked_index_array: np.ndarray
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Returns the noise-scaling maps of a dataset stacked into a single 2D array of shape (K, n_unmasked), where K is
+    the number of noise-scaling maps and n_unmasked the number of unmasked pixels, alongside the list of keys giving
+    the order of the maps in the stack.
+
+    The noise-scaling maps do not change during a model-fit, therefore they are stacked and masked once and
+    preloaded, such that the scaled noise-map of every fit is a single matrix-vector product of the stack with the
+    hyper noise scale factors (see `chi_squared_and_noise_normalization_hyper_from`).
+
+    Parameters
+    ----------
+    noise_scaling_map_dict
+        The noise-scaling maps of the dataset, where every key corresponds to a `HyperCINoiseScalar`.
+    unmasked_index_array
+        The flat index of every unmasked pixel in the native 2D array.
+    """
+    noise_scaling_key_list = list(noise_scaling_map_dict.keys())
+
+    noise_scaling_stack = np.zeros(
+        shape=(len(noise_scaling_key_list), unmasked_index_array.shape[0])
+    )
+
+    for index, key in enumerate(noise_scaling_key_list):
+        noise_scaling_stack[index, :] = np.asarray(
+            noise_scaling_map_dict[key].native, dtype="float"
+        ).reshape(-1)[unmasked_index_array]
+
+    return noise_scaling_key_list, noise_scaling_stack
+
+
+def use_hyper_noise_preloads_from(
+    hyper_noise_scalar_dict: Optional[Dict], preloads: Preloads
+) -> bool:
+    """
+    Returns whether the chi-squared and noise normalization of a fit with hyper noise can be computed from the
+    stacked noise-scaling maps of the preloads, which requires that every hyper noise scalar has a noise-scaling map
+    in the stack.
+
+    Parameters
+    ----------
+    hyper_noise_scalar_dict
+        The hyper noise scalars which multiply the noise-scaling maps to scale the noise-map.
+    preloads
+        The preloads of the model-fit, which contain the stacked noise-scaling maps if hyper noise is on.
+    """
+    if hyper_noise_scalar_dict is None or preloads.noise_scaling_stack is None:
+        return False
+
+    return all(
+        key in preloads.noise_scaling_key_list for key in hyper_noise_scalar_dict
+    )
+
+
+def scale_factor_array_from(
+    hyper_noise_scalar_dict: Dict, noise_scaling_key_list: List[str]
+) -> np.ndarray:
+    """
+    Returns the scale factor of every hyper noise scalar in the order of the keys of a stack of noise-scaling maps
+    (see `noise_scaling_stack_from`), where noise-scaling maps without a hyper noise scalar have a scale factor of
+    zero.
+
+    Parameters
+    ----------
+    hyper_noise_scalar_dict
+        The hyper noise scalars which multiply the noise-scaling maps to scale the noise-map.
+    noise_scaling_key_list
+        The keys of the noise-scaling maps in the order of the stack.
+    """
+    return np.array(
+        [float(hyper_noise_scalar_dict.get(key, 0.0)) for key in noise_scaling_key_list]
+    )
+
+
+def chi_squared_and_noise_normalization_hyper_from(
+    model_data: aa.Array2D,
+    unmasked_index_array: np.ndarray,
+    data_unmasked: np.ndarray,
+    noise_map_unmasked: np.ndarray,
+    noise_scaling_stack: np.ndarray,
+    scale_factor_array: np.ndarray,
+    residual_buffer: Optional[np.ndarray] = None,
+    noise_variance_buffer: Optional[np.ndarray] = None,
+) -> Tuple[float, float]:
+    """
+    Returns the chi-squared and noise normalization of a fit whose noise-map is scaled by hyper noise, using only the
+    unmasked pixels.
+
+    The scaled noise-map of the unmasked pixels is the preloaded noise-map plus a single matrix-vector product of
+    the scale factors with the stacked noise-scaling maps, such that no full 2D noise-map is created. The
+    chi-squared and noise normalization are then computed from this scaled noise-map in the same pass:
+
+    [Chi_Squared] = sum(([Data] - [Model])**2.0 / [Noise]**2.0)
+
+    [Noise_Term] = sum(log(2*pi*[Noise]**2.0))
+
+    Parameters
+    ----------
+    model_data
+        The model data of the fit (e.g. the post-CTI data output by a clocker).
+    unmasked_index_array
+        The flat index of every unmasked pixel in the native 2D array.
+    data_unmasked
+        The data of every unmasked pixel.
+    noise_map_unmasked
+        The noise-map of every unmasked pixel, before it is scaled.
+    noise_scaling_stack
+        The noise-scaling maps of every unmasked pixel, stacked into a 2D array of shape (K, n_unmasked).
+    scale_factor_array
+        The K hyper noise scale factors, in the order of the stacked noise-scaling maps.
+    residual_buffer
+        An optional preallocated array of the same shape as `data_unmasked`, which the residuals are written into.
+    noise_variance_buffer
+        An optional preallocated array of the same shape as `data_unmasked`, which the scaled noise variances are
+        written into. If both buffers are input no temporary arrays are created.
+    """
+    model_data = np.asarray(getattr(model_data, "native", model_data)).reshape(-1)
+
+    if residual_buffer is not None and noise_variance_buffer is not None:
+        np.dot(scale_factor_array, noise_scaling_stack, out=noise_variance_buffer)
+        np.add(noise_variance_buffer, noise_map_unmasked, out=noise_variance_buffer)
+        np.multiply(
+            noise_variance_buffer, noise_variance_buffer, out=noise_variance_buffer
+        )
+
+        np.take(model_data, unmasked_index_array, out=residual_buffer)
+        np.subtract(data_unmasked, residual_buffer, out=residual_buffer)
+        np.multiply(residual_buffer, residual_buffer, out=residual_buffer)
+        np.divide(residual_buffer, noise_variance_buffer, out=residual_buffer)
+
+        chi_squared = float(np.sum(residual_buffer))
+
+        np.multiply(noise_variance_buffer, 2.0 * np.pi, out=noise_variance_buffer)
+        np.log(noise_variance_buffer, out=noise_variance_buffer)
+
+        return chi_squared, float(np.sum(noise_variance_buffer))
+
+    noise_map_scaled = noise_map_unmasked + scale_factor_array @ noise_scaling_stack
+    noise_variance = noise_map_scaled**2.0
+
+    residual_unmasked = data_unmasked - model_data[unmasked_index_array]
+
+    chi_squared = float(np.dot(residual_unmasked / noise_variance, residual_unmasked))
+    noise_normalization = float(np.sum(np.log(2.0 * np.pi * noise_variance)))
+
+    return chi_squared, noise_normalization
@@ -7,6 +7,7 @@ import autoarray as aa
 from autocti.charge_injection.imaging.settings import SettingsImagingCI
 from autocti.charge_injection.layout import Layout2DCI
 from autocti.extract.settings import SettingsExtract
+from autocti.extract.two_d import extract_2d_util
 from autocti.mask import mask_2d
 from autocti import exc
 
@@ -24,6 +25,45 @@ class ImagingCI(aa.Imaging):
         fpr_value: Optional[float] = None,
         settings_dict: Optional[Dict] = None,
     ):
+        """
+        A charge injection imaging dataset, containing the data, noise-map and pre-CTI data of charge injection
+        imaging and the layout of its charge injection regions.
+
+        Quantities derived from the data (the `fpr_value`, `norm_columns_list` and `pre_cti_data_residual_map`)
+        are computed the first time they are accessed and cached thereafter. The cache is cleared if the `data` or
+        `pre_cti_data` are changed (the mask is changed by creating a new dataset via `apply_mask`). Creating a
+        dataset (e.g. loading many datasets from the database) therefore does not compute quantities which may never
+        be used.
+
+        Parameters
+        ----------
+        data
+            The charge injection image data.
+        noise_map
+            The noise-map of the data.
+        pre_cti_data
+            The charge injection image before CTI is added, which is clocked by arctic to fit a CTI model.
+        layout
+            The layout of the charge injection, containing information like where the parallel and serial FPR and
+            EPER are located.
+        cosmic_ray_map
+            The locations of cosmic rays on the data.
+        mask_persistence
+            The mask of pixels affected by persistence.
+        noise_scaling_map_dict
+            The noise-scaling maps of the hyper noise components of a CTI model.
+        fpr_value
+            The charge level of the parallel FPR, which if not input is estimated from the median of the end of the
+            parallel FPRs of the data when it is first accessed.
+        settings_dict
+            A dictionary of settings associated with the charge injeciton imaging (e.g. voltage settings) which is
+            used for visualization.
+        """
+        self._fpr_value = fpr_value
+        self._fpr_value_data = None
+        self._fpr_value_layout = None
+        self._derived_dict = {}
+
         super().__init__(data=data, noise_map=noise_map)
 
         self.data = self.data.native
@@ -46,24 +86,97 @@ class ImagingCI(aa.Imaging):
 
         self.layout = layout
 
-        if fpr_value is None:
-            fpr_value = np.round(
-                np.mean(
-                    self.layout.extract.parallel_fpr.median_list_from(
-                        array=self.data,
-                        settings=SettingsExtract(
-                            pixels_from_end=min(
-                                10, self.layout.smallest_parallel_rows_within_ci_regions
-                            )
-                        ),
-                    )
-                ),
-                2,
-            )
-
-        self.fpr_value = fpr_value
         self.settings_dict = settings_dict
 
+    @property
+    def data(self) -> aa.Array2D:
+        return self._data
+
+    @data.setter
+    def data(self, data: aa.Array2D):
+        self._data = data
+        self._fpr_value_data = None
+        self._fpr_value_layout = None
+        self._derived_dict = {}
+
+    @property
+    def pre_cti_data(self) -> aa.Array2D:
+        return self._pre_cti_data
+
+    @pre_cti_data.setter
+    def pre_cti_data(self, pre_cti_data: aa.Array2D):
+        self._pre_cti_data = pre_cti_data
+        self._derived_dict.pop("pre_cti_data_residual_map", None)
+
+    @property
+    def fpr_value(self) -> float:
+        """
+        The charge level of the parallel FPR, estimated as the mean of the median of every column of the last 10
+        rows of the parallel FPRs (or fewer rows if the charge injection regions are smaller).
+
+        If an `fpr_value` is input it is returned, otherwise it is computed the first time it is accessed. For a
+        dataset created via `apply_mask` or `apply_settings` it is computed from the data and layout before the mask
+        was applied or the calibration region extracted, such that it is the same for every dataset.
+        """
+        if self._fpr_value is not None:
+            return self._fpr_value
+
+        try:
+            return self._derived_dict["fpr_value"]
+        except KeyError:
+            pass
+
+        data = self.data if self._fpr_value_data is None else self._fpr_value_data
+        layout = (
+            self.layout if self._fpr_value_layout is None else self._fpr_value_layout
+        )
+
+        fpr_value = np.round(
+            np.mean(
+                layout.extract.parallel_fpr.median_list_from(
+                    array=data,
+                    settings=SettingsExtract(
+                        pixels_from_end=min(
+                            10, layout.smallest_parallel_rows_within_ci_regions
+                        )
+                    ),
+                )
+            ),
+            2,
+        )
+
+        self._derived_dict["fpr_value"] = fpr_value
+
+        return fpr_value
+
+    @fpr_value.setter
+    def fpr_value(self, fpr_value: float):
+        self._fpr_value = fpr_value
+
+    def _carry_fpr_value_to(self, dataset: "ImagingCI"):
+        """
+        Carry the `fpr_value` of this dataset over to a dataset created from it (e.g. via `apply_mask` or the
+        extraction of a calibration region) without computing it.
+
+        If the `fpr_value` was input or has already been computed it is reused, otherwise the data and layout it is
+        computed from are passed to the new dataset, which computes it if it is accessed.
+
+        Parameters
+        ----------
+        dataset
+            The dataset created from this dataset which the `fpr_value` is carried over to.
+        """
+        if self._fpr_value is not None:
+            dataset._fpr_value = self._fpr_value
+        elif "fpr_value" in self._derived_dict:
+            dataset._derived_dict["fpr_value"] = self._derived_dict["fpr_value"]
+        elif self._fpr_value_data is None:
+            dataset._fpr_value_data = self.data
+            dataset._fpr_value_layout = self.layout
+        else:
+            dataset._fpr_value_data = self._fpr_value_data
+            dataset._fpr_value_layout = self._fpr_value_layout
+
     @property
     def mask(self):
         return self.data.mask
@@ -83,17 +196,30 @@ class ImagingCI(aa.Imaging):
         This function estimates the normalization of every column of data in the 2D regions, by taking the median
         of each column. If a mask is applied (e.g. to remove cosmic rays) these pixels are omitted from the median.
 
+        The columns of all regions with the same number of rows are stacked into a single array whose medians are
+        computed at once (see `extract_2d_util.region_column_median_list_from`), where a column whose pixels are all
+        masked has a normalization of NaN.
+
+        The list is computed the first time it is accessed and cached thereafter.
+
         Returns
         -------
         A list of the normalization of every column of the charge regions
         """
-        masked_image = np.ma.array(data=self.data, mask=self.data.mask)
+        try:
+            return self._derived_dict["norm_columns_list"]
+        except KeyError:
+            pass
+
+        norm_columns_list = extract_2d_util.region_column_median_list_from(
+            array_2d=self.data.native,
+            mask_2d=self.data.mask,
+            region_list=self.region_list,
+        )
+
+        self._derived_dict["norm_columns_list"] = norm_columns_list
 
-        return [
-            np.ma.median(masked_image[region.y0 : region.y1, column_index])
-            for region in self.region_list
-            for column_index in range(region.x0, region.x1)
-        ]
+        return norm_columns_list
 
     @property
     def pre_cti_data_residual_map(self) -> aa.Array2D:
@@ -103,13 +229,36 @@ class ImagingCI(aa.Imaging):
         This is used to assess whether the pre CTI data has been estimated accurately (e.g. from the FPR of the
         data) and includes e specific set of visualization functions.
 
+        The residual map is computed the first time it is accessed and cached thereafter.
+
         Returns
         -------
         The residual map of the data and pre CTI data.
         """
-        return self.data - self.pre_cti_data
+        try:
+            return self._derived_dict["pre_cti_data_residual_map"]
+        except KeyError:
+            pass
+
+        pre_cti_data_residual_map = self.data - self.pre_cti_data
+
+        self._derived_dict["pre_cti_data_residual_map"] = pre_cti_data_residual_map
+
+        return pre_cti_data_residual_map
 
     def apply_mask(self, mask: mask_2d.Mask2D) -> "ImagingCI":
+        """
+        Returns a new dataset with a mask applied to its data, noise-map, cosmic ray map and noise-scaling maps.
+
+        Derived quantities are carried over to the masked dataset without being computed: the `fpr_value` is
+        computed from the unmasked data if it is accessed, and if the mask is the same as the current mask the
+        cached `norm_columns_list` and `pre_cti_data_residual_map` are reused.
+
+        Parameters
+        ----------
+        mask
+            The mask applied to the dataset.
+        """
         image = aa.Array2D(values=self.data.native, mask=mask)
         noise_map = aa.Array2D(values=self.noise_map.native, mask=mask)
 
@@ -128,7 +277,7 @@ class ImagingCI(aa.Imaging):
         else:
             noise_scaling_map_dict = None
 
-        return ImagingCI(
+        dataset = ImagingCI(
             data=image,
             noise_map=noise_map,
             pre_cti_data=self.pre_cti_data.native,
@@ -136,10 +285,23 @@ class ImagingCI(aa.Imaging):
             cosmic_ray_map=cosmic_ray_map,
             mask_persistence=self.mask_persistence,
             noise_scaling_map_dict=noise_scaling_map_dict,
-            fpr_value=self.fpr_value,
+            fpr_value=self._fpr_value,
             settings_dict=self.settings_dict,
         )
 
+        self._carry_fpr_value_to(dataset=dataset)
+
+        if np.array_equal(np.asarray(mask), np.asarray(self.mask)):
+            dataset._derived_dict.update(
+                {
+                    key: value
+                    for key, value in self._derived_dict.items()
+                    if key != "fpr_value"
+                }
+            )
+
+        return dataset
+
     def apply_settings(self, settings: SettingsImagingCI):
         if settings.parallel_pixels is not None:
             dataset = self.layout.extract.parallel_calibration.imaging_ci_from(
@@ -1,5 +1,7 @@
+import copy
 import logging
-from typing import List, Optional
+import numpy as np
+from typing import List, Optional, Tuple
 
 from autoconf import conf
 from autoconf.dictable import to_dict
@@ -9,16 +11,28 @@ import autofit as af
 
 from autocti.charge_injection.imaging.imaging import ImagingCI
 from autocti.charge_injection.fit import FitImagingCI
+from autocti.charge_injection.fit import chi_squared_and_noise_normalization_hyper_from
+from autocti.charge_injection.fit import chi_squared_unmasked_from
+from autocti.charge_injection.fit import noise_scaling_stack_from
+from autocti.charge_injection.fit import scale_factor_array_from
+from autocti.charge_injection.fit import unmasked_arrays_from
+from autocti.charge_injection.fit import use_hyper_noise_preloads_from
 from autocti.charge_injection.model.visualizer import VisualizerImagingCI
 from autocti.charge_injection.model.result import ResultImagingCI
+from autocti.clocker.cache import array_fingerprint_from
 from autocti.clocker.two_d import Clocker2D
+from autocti.clocker import clocker_util
 from autocti.charge_injection.hyper import HyperCINoiseCollection
+from autocti import exc
+from autocti.model.adaptive_express import AdaptiveExpress
 from autocti.model.analysis import AnalysisCTI
+from autocti.model.emulator import Emulator
+from autocti.model.emulator import parameter_vector_from
+from autocti.model.pre_check import PreCheckPipeline
+from autocti.model.profiler import LikelihoodProfiler
 from autocti.model.settings import SettingsCTI2D
 from autocti.preloads import Preloads
 
-from autocti import exc
-
 logger = logging.getLogger(__name__)
 
 logger.setLevel(level="INFO")
@@ -34,6 +48,10 @@ class AnalysisImagingCI(AnalysisCTI):
         clocker: Clocker2D,
         settings_cti: SettingsCTI2D = SettingsCTI2D(),
         dataset_full: Optional[ImagingCI] = None,
+        adaptive_express: Optional[AdaptiveExpress] = None,
+        profiler: Optional[LikelihoodProfiler] = None,
+        pre_check: Optional[PreCheckPipeline] = None,
+        emulator: Optional[Emulator] = None,
     ):
         """
         Fits a CTI model to a charge injection imaging dataset via a non-linear search.
@@ -58,46 +76,96 @@ class AnalysisImagingCI(AnalysisCTI):
         dataset_full
             The full dataset, which is visualized separate from the `dataset` that is fitted, which for example may
             not have the FPR masked and thus enable visualization of the FPR.
+        adaptive_express
+            If input, the log likelihood function first evaluates every proposal using a coarse arctic express and
+            only re-evaluates proposals close to the best fit using the clocker's express (see `AdaptiveExpress`).
+        profiler
+            If input, the run time of every stage of the log likelihood function (e.g. the density check, arctic
+            parallel and serial clocking, the chi-squared) is recorded and output to the `files` folder of the search
+            when the model-fit finishes (see `LikelihoodProfiler`).
+        pre_check
+            If input, inexpensive checks of the physical plausibility of every CTI model (e.g. its CCD well filling
+            and trap release timescales) which reject non-physical models before they are clocked via arctic (see
+            `PreCheckPipeline`).
+        emulator
+            If input, an emulator of the binned FPR and EPER profiles of the post-CTI data is trained on the
+            proposals evaluated via arctic, and proposals whose emulated profiles are far from the best fit are
+            rejected without calling arctic by raising a `PriorException` (see `Emulator`, including how wrongly
+            rejected proposals bias the posterior).
         """
         super().__init__(
             dataset=dataset,
             clocker=clocker,
             settings_cti=settings_cti,
             dataset_full=dataset_full,
+            profiler=profiler,
+            pre_check=pre_check,
         )
 
+        self.adaptive_express = adaptive_express
+        self.emulator = emulator
+
+        self._emulator_data_profile = None
+        self._emulator_inverse_noise_profile = None
+
+        self.clocker_coarse = None
+
+        if adaptive_express is not None:
+            self.clocker_coarse = adaptive_express.clocker_from(clocker=self.clocker)
+
         self.preloads = Preloads()
 
-        parallel_fast_index_list = None
-        parallel_fast_column_lists = None
+        parallel_fast_index_array = None
+        parallel_fast_inverse_array = None
 
-        serial_fast_index_list = None
-        serial_fast_row_lists = None
+        serial_fast_index_array = None
+        serial_fast_inverse_array = None
 
-        if self.clocker.parallel_fast_mode and not self.clocker.serial_fast_mode:
+        if self.clocker.parallel_fast_mode:
             (
-                parallel_fast_index_list,
-                parallel_fast_column_lists,
-            ) = clocker.fast_indexes_from(data=dataset.pre_cti_data, for_parallel=True)
+                parallel_fast_index_array,
+                parallel_fast_inverse_array,
+            ) = clocker_util.fast_index_array_and_inverse_from(
+                array=dataset.pre_cti_data, for_parallel=True
+            )
 
-        elif not self.clocker.parallel_fast_mode and self.clocker.serial_fast_mode:
-            serial_fast_index_list, serial_fast_row_lists = clocker.fast_indexes_from(
-                data=dataset.pre_cti_data, for_parallel=False
+        if self.clocker.serial_fast_mode:
+            (
+                serial_fast_index_array,
+                serial_fast_inverse_array,
+            ) = clocker_util.fast_index_array_and_inverse_from(
+                array=dataset.pre_cti_data, for_parallel=False
             )
 
-        elif self.clocker.parallel_fast_mode and self.clocker.serial_fast_mode:
-            raise exc.ClockerException(
-                "Both parallel fast model and serial fast mode cannot be turned on.\n"
-                "Only switch on parallel fast mode for parallel + serial clocking."
+        window_row_index_array = None
+        window_column_index_array = None
+
+        if self.clocker.window_from_mask:
+            (
+                window_row_index_array,
+                window_column_index_array,
+            ) = clocker_util.window_index_arrays_from(mask=dataset.mask)
+
+        data_fingerprint = None
+
+        if self.clocker.cache is not None:
+            data_fingerprint = array_fingerprint_from(
+                np.asarray(dataset.pre_cti_data.native_skip_mask)
             )
 
         self.preloads = Preloads(
-            parallel_fast_index_list=parallel_fast_index_list,
-            parallel_fast_column_lists=parallel_fast_column_lists,
-            serial_fast_index_list=serial_fast_index_list,
-            serial_fast_row_lists=serial_fast_row_lists,
+            parallel_fast_index_array=parallel_fast_index_array,
+            parallel_fast_inverse_array=parallel_fast_inverse_array,
+            serial_fast_index_array=serial_fast_index_array,
+            serial_fast_inverse_array=serial_fast_inverse_array,
+            window_row_index_array=window_row_index_array,
+            window_column_index_array=window_column_index_array,
+            data_fingerprint=data_fingerprint,
         )
 
+        self.residual_buffer = None
+        self.noise_variance_buffer = None
+
     def region_list_from(self, model: af.Collection) -> List:
         """
         Inspects the CTI model and determines which regions are fitted for and therefore should be visualized.
@@ -137,6 +205,13 @@ class AnalysisImagingCI(AnalysisCTI):
          2) Checks if the noise-map is fixed (it is not if hyper functionality is on), and if it is fixed it
             sets the noise-normalization to the preloads for computational speed.
 
+         3) If the noise-map is fixed, preloads the flat indexes, data and inverse variances of the unmasked pixels,
+            such that the chi-squared of every fit is a single dot product over the unmasked pixels.
+
+         4) If the noise-map is scaled by hyper noise, preloads the noise-map and noise-scaling maps of the unmasked
+            pixels, with the noise-scaling maps stacked into a single array, such that the scaled noise-map of every
+            fit is a single matrix-vector product and no full 2D noise-map is created.
+
         Parameters
         ----------
         paths
@@ -150,6 +225,9 @@ class AnalysisImagingCI(AnalysisCTI):
         if paths.is_complete:
             return self
 
+        if self.emulator is not None and self.emulator.region_list is None:
+            self.emulator.region_list = self.region_list_from(model=model)
+
         if not model.has(HyperCINoiseCollection):
             noise_normalization = aa.util.fit.noise_normalization_with_mask_from(
                 noise_map=self.dataset.noise_map, mask=self.dataset.mask
@@ -161,6 +239,75 @@ class AnalysisImagingCI(AnalysisCTI):
                 "PRELOADS - Noise Normalization preloaded for model-fit (noise-map is fixed)."
             )
 
+            (
+                self.preloads.unmasked_index_array,
+                self.preloads.data_unmasked,
+                self.preloads.inverse_variance_unmasked,
+            ) = unmasked_arrays_from(
+                data=self.dataset.data,
+                noise_map=self.dataset.noise_map,
+                mask=self.dataset.mask,
+            )
+
+            logger.info(
+                "PRELOADS - Unmasked data and inverse variances preloaded for model-fit (noise-map is fixed)."
+            )
+
+        elif self.dataset.noise_scaling_map_dict is not None:
+            (
+                self.preloads.unmasked_index_array,
+                self.preloads.data_unmasked,
+                _,
+            ) = unmasked_arrays_from(
+                data=self.dataset.data,
+                noise_map=self.dataset.noise_map,
+                mask=self.dataset.mask,
+            )
+
+            self.preloads.noise_map_unmasked = np.asarray(
+                self.dataset.noise_map.native, dtype="float"
+            ).reshape(-1)[self.preloads.unmasked_index_array]
+
+            (
+                self.preloads.noise_scaling_key_list,
+                self.preloads.noise_scaling_stack,
+            ) = noise_scaling_stack_from(
+                noise_scaling_map_dict=self.dataset.noise_scaling_map_dict,
+                unmasked_index_array=self.preloads.unmasked_index_array,
+            )
+
+            logger.info(
+                "PRELOADS - Unmasked noise-map and stacked noise-scaling maps preloaded for model-fit (hyper noise)."
+            )
+
+        return self
+
+    def modify_after_fit(
+        self, paths: af.DirectoryPaths, model: af.Collection, result: af.Result
+    ):
+        """
+        This function is called immediately after the non-linear search finishes.
+
+        In addition to the outputs of `AnalysisCTI.modify_after_fit`, if the analysis has an `emulator` its
+        accuracy diagnostics (e.g. the number of proposals it rejected and the error of its emulated log
+        likelihoods) are output to the file `emulator.json` in the `files` folder of the search.
+
+        Parameters
+        ----------
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored.
+        model
+            The model object, which includes model components representing the CTI model that is fitted.
+        result
+            The result of the model-fit.
+        """
+        super().modify_after_fit(paths=paths, model=model, result=result)
+
+        if self.emulator is not None and self.emulator.total_exact > 0:
+            paths._files_path.mkdir(parents=True, exist_ok=True)
+
+            self.emulator.output_to_json(file_path=paths._files_path / "emulator.json")
+
         return self
 
     def log_likelihood_function(self, instance: af.ModelInstance) -> float:
@@ -177,39 +324,446 @@ class AnalysisImagingCI(AnalysisCTI):
             How fit the model is and the model
         """
 
-        self.settings_cti.check_total_density_within_range(
-            parallel_traps=instance.cti.parallel_trap_list,
-            serial_traps=instance.cti.serial_trap_list,
+        with self.profile_call():
+            with self.profile_stage(name="density_check"):
+                self.settings_cti.check_total_density_within_range(
+                    parallel_traps=instance.cti.parallel_trap_list,
+                    serial_traps=instance.cti.serial_trap_list,
+                )
+
+            self.pre_check_instance(instance=instance)
+
+            if self.emulator is not None:
+                return self.emulator.log_likelihood_from(
+                    parameter_vector=parameter_vector_from(cti=instance.cti),
+                    profile_log_likelihood_func=self.emulator_profile_log_likelihood_from,
+                    log_likelihood_exact_func=lambda: self.log_likelihood_and_emulator_profile_from(
+                        instance=instance
+                    ),
+                )
+
+            if self.adaptive_express is not None:
+                return self.adaptive_express.log_likelihood_from(
+                    log_likelihood_coarse_func=lambda: self.figure_of_merit_from(
+                        instance=instance,
+                        post_cti_data=self.clocker_coarse.add_cti(
+                            data=self.dataset.pre_cti_data,
+                            cti=instance.cti,
+                            preloads=self.preloads,
+                        ),
+                    ),
+                    log_likelihood_exact_func=lambda: self.figure_of_merit_from(
+                        instance=instance,
+                        post_cti_data=self.clocker.add_cti(
+                            data=self.dataset.pre_cti_data,
+                            cti=instance.cti,
+                            preloads=self.preloads,
+                        ),
+                    ),
+                )
+
+            post_cti_data = self.clocker.add_cti(
+                data=self.dataset.pre_cti_data,
+                cti=instance.cti,
+                preloads=self.preloads,
+            )
+
+            return self.figure_of_merit_from(
+                instance=instance, post_cti_data=post_cti_data
+            )
+
+    def emulator_profile_from(self, array: aa.Array2D) -> np.ndarray:
+        """
+        Returns the binned 1D profiles of the regions of the `emulator` (e.g. the parallel FPR and EPER) of an
+        array, concatenated into a single 1D vector, which is the quantity the emulator learns.
+
+        Parameters
+        ----------
+        array
+            The array (e.g. the post-CTI data of a model) whose binned 1D profiles are returned.
+        """
+        if self.emulator.region_list is None:
+            raise exc.FittingException(
+                "The region_list of the emulator must be input or set via modify_before_fit before it is used."
+            )
+
+        return np.concatenate(
+            [
+                np.asarray(
+                    self.dataset.layout.extract_region_from(array=array, region=region),
+                    dtype="float",
+                )
+                for region in self.emulator.region_list
+            ]
+        )
+
+    def emulator_profile_log_likelihood_from(self, profile: np.ndarray) -> float:
+        """
+        Returns the log likelihood of binned 1D profiles (see `emulator_profile_from`) given the binned data and
+        binned noise-map of the dataset, which the `emulator` uses to decide whether a proposal is evaluated via
+        arctic.
+
+        The binned data and inverse binned noise-map are computed on the first call and reused thereafter, where
+        bins whose noise is zero (e.g. because every pixel in them is masked) are excluded.
+
+        Parameters
+        ----------
+        profile
+            The binned 1D profiles of the post-CTI data of a model.
+        """
+        if self._emulator_data_profile is None:
+            self._emulator_data_profile = self.emulator_profile_from(
+                array=self.dataset.data
+            )
+
+            noise_profile = np.concatenate(
+                [
+                    np.asarray(
+                        self.dataset.layout.extract_region_noise_map_from(
+                            array=self.dataset.noise_map, region=region
+                        ),
+                        dtype="float",
+                    )
+                    for region in self.emulator.region_list
+                ]
+            )
+
+            self._emulator_inverse_noise_profile = np.divide(
+                1.0,
+                noise_profile,
+                out=np.zeros_like(noise_profile),
+                where=noise_profile > 0.0,
+            )
+
+        chi = (
+            self._emulator_data_profile - profile
+        ) * self._emulator_inverse_noise_profile
+
+        return float(-0.5 * np.dot(chi, chi))
+
+    def log_likelihood_and_emulator_profile_from(
+        self, instance: af.ModelInstance
+    ) -> Tuple[float, np.ndarray]:
+        """
+        Returns the log likelihood of a model instance computed via arctic and the binned 1D profiles of its
+        post-CTI data, which the `emulator` adds to its training set.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been
+            set via a non-linear search).
+        """
+        post_cti_data = self.clocker.add_cti(
+            data=self.dataset.pre_cti_data,
+            cti=instance.cti,
+            preloads=self.preloads,
+        )
+
+        log_likelihood = self.figure_of_merit_from(
+            instance=instance, post_cti_data=post_cti_data
         )
 
-        fit = self.fit_via_instance_and_dataset_from(
-            instance=instance, dataset=self.dataset, hyper_noise_scale=True
+        return log_likelihood, self.emulator_profile_from(array=post_cti_data)
+
+    def figure_of_merit_from(
+        self, instance: af.ModelInstance, post_cti_data: aa.Array2D
+    ) -> float:
+        """
+        Returns the figure of merit (log likelihood) of the fit of the post-CTI data of a model instance to the
+        dataset, which is the only quantity of a fit the non-linear search uses.
+
+        If the quantities of the unmasked pixels are in the `preloads` (see `modify_before_fit`), the figure of merit
+        is computed directly from the NumPy arrays of the unmasked pixels and no `FitImagingCI` object is created.
+        The unmasked pixels of the model data, their residuals and chi-squared values are written into the
+        analysis's preallocated `residual_buffer` and, if the noise-map is scaled by hyper noise, the scaled noise
+        variances into its preallocated `noise_variance_buffer`, such that computing the figure of merit creates no
+        temporary arrays. The post-CTI data itself is output by arctic, which allocates a new image every call.
+
+        A `FitImagingCI` object is only created if these preloads are not available (e.g. if `modify_before_fit`
+        has not been called), with the fit objects used for visualization created via
+        `fit_via_instance_and_dataset_from`.
+
+        Parameters
+        ----------
+        instance
+            The model instance whose CTI model was used to compute the post-CTI data.
+        post_cti_data
+            The `pre_cti_data` of the dataset with CTI added to it via the clocker and the instance's CTI model.
+        """
+        hyper_noise_scalar_dict = None
+
+        if hasattr(instance, "hyper_noise"):
+            hyper_noise_scalar_dict = instance.hyper_noise.as_dict
+
+        if use_hyper_noise_preloads_from(
+            hyper_noise_scalar_dict=hyper_noise_scalar_dict, preloads=self.preloads
+        ):
+            with self.profile_stage(name="noise_map"):
+                scale_factor_array = scale_factor_array_from(
+                    hyper_noise_scalar_dict=hyper_noise_scalar_dict,
+                    noise_scaling_key_list=self.preloads.noise_scaling_key_list,
+                )
+
+            with self.profile_stage(name="chi_squared"):
+                chi_squared, noise_normalization = (
+                    chi_squared_and_noise_normalization_hyper_from(
+                        model_data=post_cti_data,
+                        unmasked_index_array=self.preloads.unmasked_index_array,
+                        data_unmasked=self.preloads.data_unmasked,
+                        noise_map_unmasked=self.preloads.noise_map_unmasked,
+                        noise_scaling_stack=self.preloads.noise_scaling_stack,
+                        scale_factor_array=scale_factor_array,
+                        residual_buffer=self.residual_buffer_from(
+                            data_unmasked=self.preloads.data_unmasked
+                        ),
+                        noise_variance_buffer=self.noise_variance_buffer_from(
+                            data_unmasked=self.preloads.data_unmasked
+                        ),
+                    )
+                )
+
+            return -0.5 * (chi_squared + noise_normalization)
+
+        if (
+            hyper_noise_scalar_dict is None
+            and self.preloads.inverse_variance_unmasked is not None
+            and self.preloads.noise_normalization is not None
+        ):
+            with self.profile_stage(name="chi_squared"):
+                chi_squared = chi_squared_unmasked_from(
+                    model_data=post_cti_data,
+                    unmasked_index_array=self.preloads.unmasked_index_array,
+                    data_unmasked=self.preloads.data_unmasked,
+                    inverse_variance_unmasked=self.preloads.inverse_variance_unmasked,
+                    residual_buffer=self.residual_buffer_from(
+                        data_unmasked=self.preloads.data_unmasked
+                    ),
+                )
+
+            return -0.5 * (chi_squared + self.preloads.noise_normalization)
+
+        with self.profile_stage(name="chi_squared"):
+            return FitImagingCI(
+                dataset=self.dataset,
+                post_cti_data=post_cti_data,
+                hyper_noise_scalar_dict=hyper_noise_scalar_dict,
+                preloads=self.preloads,
+            ).figure_of_merit
+
+    def residual_buffer_from(self, data_unmasked: np.ndarray) -> np.ndarray:
+        """
+        Returns the preallocated buffer the residuals of the unmasked pixels are written into when the chi-squared
+        is computed, which is allocated on the first call and reused by every subsequent likelihood evaluation.
+
+        The buffer is shared by every call of the analysis, therefore the likelihood evaluations of one analysis
+        object must not run concurrently over threads (parallelization over processes gives every process its
+        own copy of the analysis).
+
+        Parameters
+        ----------
+        data_unmasked
+            The data of the unmasked pixels, whose shape and type the buffer matches.
+        """
+        if (
+            self.residual_buffer is None
+            or self.residual_buffer.shape != data_unmasked.shape
+        ):
+            self.residual_buffer = np.empty_like(data_unmasked)
+
+        return self.residual_buffer
+
+    def noise_variance_buffer_from(self, data_unmasked: np.ndarray) -> np.ndarray:
+        """
+        Returns the preallocated buffer the hyper noise scaled noise variances of the unmasked pixels are written
+        into when the chi-squared and noise normalization are computed, which is allocated on the first call and
+        reused by every subsequent likelihood evaluation (see `residual_buffer_from`).
+
+        Parameters
+        ----------
+        data_unmasked
+            The data of the unmasked pixels, whose shape and type the buffer matches.
+        """
+        if (
+            self.noise_variance_buffer is None
+            or self.noise_variance_buffer.shape != data_unmasked.shape
+        ):
+            self.noise_variance_buffer = np.empty_like(data_unmasked)
+
+        return self.noise_variance_buffer
+
+    def log_likelihood_batch(
+        self,
+        instances: List[af.ModelInstance],
+        resample_figure_of_merit: float = -np.inf,
+    ) -> List[float]:
+        """
+        Determine the fitness of a batch of model instances, for example the many points proposed at once by an
+        ensemble or batch sampler.
+
+        The CTI models of every instance are clocked together via `Clocker2D.add_cti_batch`, which shares the
+        fast-mode indexes of the data over the batch and clocks the models concurrently over the clocker's
+        `n_threads` threads.
+
+        For instances without hyper noise components the noise-map is fixed, therefore the unmasked data,
+        inverse noise-map and noise normalization are computed once for the batch and the log likelihood of every
+        instance is computed directly from the unmasked pixels of its post-CTI data, without creating a
+        `FitImagingCI` object. Instances with hyper noise components scale the noise-map and are fitted via
+        `figure_of_merit_from`, as in `log_likelihood_function`.
+
+        An instance which `log_likelihood_function` rejects by raising a `PriorException` (its trap densities are
+        outside the range allowed by `settings_cti` or it fails the `pre_check`) cannot be resampled individually
+        within a batch. It is instead given the `resample_figure_of_merit`, which by default is `-np.inf` (a
+        likelihood of zero) such that a batch sampler discards it, and every other instance of the batch has the
+        same log likelihood as `log_likelihood_function`.
+
+        The emulator, adaptive express and profiler are only performed by `log_likelihood_function`, therefore an
+        `AnalysisException` is raised if the analysis uses any of them, as their log likelihoods would differ
+        between the two functions.
+
+        Parameters
+        ----------
+        instances
+            The model instances whose log likelihoods are computed.
+        resample_figure_of_merit
+            The value returned for instances which `log_likelihood_function` rejects by raising a `PriorException`.
+
+        Returns
+        -------
+        The figure of merit (log likelihood) of every instance, in the same order as `instances`.
+        """
+        if (
+            self.emulator is not None
+            or self.adaptive_express is not None
+            or self.profiler is not None
+        ):
+            raise exc.AnalysisException(
+                "The log likelihood of a batch cannot be computed if the analysis uses an emulator, adaptive "
+                "express or a profiler, use log_likelihood_function instead."
+            )
+
+        figure_of_merit_list = [resample_figure_of_merit] * len(instances)
+
+        index_list = []
+
+        for index, instance in enumerate(instances):
+            try:
+                self.settings_cti.check_total_density_within_range(
+                    parallel_traps=instance.cti.parallel_trap_list,
+                    serial_traps=instance.cti.serial_trap_list,
+                )
+                self.pre_check_instance(instance=instance)
+                index_list.append(index)
+            except exc.PriorException:
+                pass
+
+        if not index_list:
+            return figure_of_merit_list
+
+        post_cti_data_list = self.clocker.add_cti_batch(
+            data=self.dataset.pre_cti_data,
+            cti_list=[instances[index].cti for index in index_list],
+            preloads=self.preloads,
         )
 
-        return fit.figure_of_merit
+        unmasked_index_array = self.preloads.unmasked_index_array
+        data_unmasked = self.preloads.data_unmasked
+        inverse_variance_unmasked = self.preloads.inverse_variance_unmasked
+
+        noise_normalization = None
+
+        for index, post_cti_data in zip(index_list, post_cti_data_list):
+            instance = instances[index]
+
+            if hasattr(instance, "hyper_noise"):
+                figure_of_merit_list[index] = self.figure_of_merit_from(
+                    instance=instance, post_cti_data=post_cti_data
+                )
+
+                continue
+
+            if unmasked_index_array is None:
+                (
+                    unmasked_index_array,
+                    data_unmasked,
+                    inverse_variance_unmasked,
+                ) = unmasked_arrays_from(
+                    data=self.dataset.data,
+                    noise_map=self.dataset.noise_map,
+                    mask=self.dataset.mask,
+                )
+
+            if noise_normalization is None:
+                noise_normalization = self.preloads.noise_normalization
+
+                if noise_normalization is None:
+                    noise_normalization = (
+                        aa.util.fit.noise_normalization_with_mask_from(
+                            noise_map=self.dataset.noise_map, mask=self.dataset.mask
+                        )
+                    )
+
+            chi_squared = chi_squared_unmasked_from(
+                model_data=post_cti_data,
+                unmasked_index_array=unmasked_index_array,
+                data_unmasked=data_unmasked,
+                inverse_variance_unmasked=inverse_variance_unmasked,
+                residual_buffer=self.residual_buffer_from(data_unmasked=data_unmasked),
+            )
+
+            figure_of_merit_list[index] = -0.5 * (chi_squared + noise_normalization)
+
+        return figure_of_merit_list
 
     def fit_via_instance_and_dataset_from(
         self,
         instance: af.ModelInstance,
         dataset: ImagingCI,
         hyper_noise_scale: bool = True,
+        clocker: Optional[Clocker2D] = None,
     ) -> FitImagingCI:
         hyper_noise_scalar_dict = None
 
+        clocker = clocker or self.clocker
+
         if hyper_noise_scale and hasattr(instance, "hyper_noise"):
             hyper_noise_scalar_dict = instance.hyper_noise.as_dict
 
-        post_cti_data = self.clocker.add_cti(
+        preloads = self.preloads
+        fit_preloads = self.preloads
+
+        if dataset is not self.dataset and (
+            preloads.window_row_index_array is not None
+            or preloads.data_fingerprint is not None
+        ):
+            preloads = copy.copy(preloads)
+            preloads.window_row_index_array = None
+            preloads.window_column_index_array = None
+            preloads.data_fingerprint = None
+
+        if (
+            dataset is not self.dataset
+            and fit_preloads.unmasked_index_array is not None
+        ):
+            fit_preloads = copy.copy(fit_preloads)
+            fit_preloads.unmasked_index_array = None
+            fit_preloads.data_unmasked = None
+            fit_preloads.inverse_variance_unmasked = None
+            fit_preloads.noise_map_unmasked = None
+            fit_preloads.noise_scaling_key_list = None
+            fit_preloads.noise_scaling_stack = None
+
+        post_cti_data = clocker.add_cti(
             data=dataset.pre_cti_data,
             cti=instance.cti,
-            preloads=self.preloads,
+            preloads=preloads,
         )
 
         return FitImagingCI(
             dataset=dataset,
             post_cti_data=post_cti_data,
             hyper_noise_scalar_dict=hyper_noise_scalar_dict,
-            preloads=self.preloads,
+            preloads=fit_preloads,
         )
 
     def fit_via_instance_from(
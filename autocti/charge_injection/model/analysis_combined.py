@@ -0,0 +1,212 @@
+import logging
+from typing import Optional
+
+from autoconf.dictable import to_dict
+
+import autofit as af
+
+from autocti.charge_injection.model.analysis import AnalysisImagingCI
+from autocti.clocker.two_d import Clocker2D
+from autocti.model.analysis_pool import SharedMemoryAnalysisPool
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisImagingCICombined(af.CombinedAnalysis):
+    def __init__(self, *analyses: AnalysisImagingCI, n_processes: int = 1):
+        """
+        Fits a CTI model to multiple charge injection imaging datasets simultaneously (e.g. charge injection images
+        taken at different injection levels), where the log likelihood is the sum of the log likelihoods of every
+        dataset.
+
+        This behaves identically to summing the `AnalysisImagingCI` objects of every dataset (e.g.
+        `sum(analysis_list)`), with outputting results to hard-disk, visualization, etc performed separately for
+        every analysis. However, if every analysis uses the same clocker, the log likelihood function clocks the
+        `pre_cti_data` of every dataset via a single call to arctic using `Clocker2D.add_cti_stacked`, which stacks
+        the (unique) columns and rows of every dataset into one image, instead of calling arctic once per dataset.
+
+        The figure of merit of every dataset is then computed from its post-CTI data via
+        `AnalysisImagingCI.figure_of_merit_from` and summed.
+
+        If the analyses use different clockers, use adaptive express, an emulator or a profiler or the likelihood is
+        parallelized over processes (`n_cores` above 1), the log likelihood of every analysis is computed separately
+        and summed.
+
+        If `n_processes` is above 1, the log likelihood of every analysis is instead computed in parallel over a
+        pool of worker processes (see `SharedMemoryAnalysisPool` and `use_pool_from`), where the datasets of the
+        analyses are stored once in shared memory and only the model instance is sent to the workers on every call.
+        The pool is created on the first call of the log likelihood function (e.g. after `modify_before_fit` has set
+        up the preloads of every analysis) and is released via `close_pool`.
+
+        Parameters
+        ----------
+        analyses
+            The charge injection imaging analyses of every dataset that is fitted.
+        n_processes
+            If above 1, the number of worker processes the log likelihoods of the analyses are computed over.
+        """
+        super().__init__(*analyses)
+
+        self.clocker = self.clocker_stacked_from(analyses=analyses)
+
+        self.n_processes = n_processes
+        self.analysis_pool = None
+
+        self.use_pool = self.use_pool_from(analyses=analyses, n_processes=n_processes)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["analysis_pool"] = None
+        return state
+
+    @staticmethod
+    def clocker_stacked_from(analyses) -> Optional[Clocker2D]:
+        """
+        Returns the clocker shared by every analysis, which is used to clock every dataset via a single call to
+        arctic, or `None` if the analyses cannot be stacked.
+
+        Analyses can be stacked if they are all `AnalysisImagingCI` objects without adaptive express, an emulator or
+        a profiler (which stacked clocking would skip) whose clockers are the same object or have identical settings.
+
+        Parameters
+        ----------
+        analyses
+            The charge injection imaging analyses of every dataset that is fitted.
+        """
+        if not all(isinstance(analysis, AnalysisImagingCI) for analysis in analyses):
+            return None
+
+        if any(
+            analysis.adaptive_express is not None
+            or analysis.emulator is not None
+            or analysis.profiler is not None
+            for analysis in analyses
+        ):
+            return None
+
+        clocker = analyses[0].clocker
+        clocker_dict = to_dict(clocker)
+
+        for analysis in analyses[1:]:
+            if (
+                analysis.clocker is not clocker
+                and to_dict(analysis.clocker) != clocker_dict
+            ):
+                return None
+
+        return clocker
+
+    @staticmethod
+    def use_pool_from(analyses, n_processes: int) -> bool:
+        """
+        Returns whether the log likelihood of every analysis is computed in a pool of worker processes, which requires
+        `n_processes` to be above 1 and that no analysis uses adaptive express, an emulator, a profiler or a pre-check.
+
+        These keep state in the analysis (e.g. the training set of the emulator, the timings of the profiler and the
+        rejection counts of the pre-check) which a worker process would update in its own copy of the analysis
+        without sending it back, such that the outputs of the model-fit (e.g. `likelihood_profile.json` and
+        `pre_check.json`) would be wrong. If any analysis uses them the log likelihood is computed in the main
+        process instead.
+
+        Parameters
+        ----------
+        analyses
+            The charge injection imaging analyses of every dataset that is fitted.
+        n_processes
+            The number of worker processes of the pool.
+        """
+        if n_processes <= 1:
+            return False
+
+        if any(
+            getattr(analysis, "adaptive_express", None) is not None
+            or getattr(analysis, "emulator", None) is not None
+            or getattr(analysis, "profiler", None) is not None
+            or getattr(analysis, "pre_check", None) is not None
+            for analysis in analyses
+        ):
+            logger.info(
+                "The analysis pool is not used because an analysis uses adaptive express, an emulator, a profiler "
+                "or a pre-check, the log likelihood is computed in the main process instead."
+            )
+
+            return False
+
+        return True
+
+    def modify_before_fit(self, paths: af.DirectoryPaths, model: af.Collection):
+        """
+        Modify every analysis before the fit (see `AnalysisImagingCI.modify_before_fit`), returning a combined
+        analysis of the same type such that the log likelihood function still stacks every dataset.
+
+        Parameters
+        ----------
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored.
+        model
+            The model object, which includes model components representing the CTI model that is fitted.
+        """
+        analysis = super().modify_before_fit(paths=paths, model=model)
+
+        return type(self)(*analysis.analyses, n_processes=self.n_processes)
+
+    def modify_after_fit(
+        self, paths: af.DirectoryPaths, model: af.Collection, result: af.Result
+    ):
+        analysis = super().modify_after_fit(paths=paths, model=model, result=result)
+
+        self.close_pool()
+
+        return type(self)(*analysis.analyses, n_processes=self.n_processes)
+
+    def log_likelihood_function(self, instance: af.ModelInstance) -> float:
+        """
+        Returns the summed log likelihood of the fit of a model instance to every dataset, where the `pre_cti_data`
+        of every dataset is clocked via a single call to arctic if the analyses can be stacked.
+
+        If `n_processes` is above 1, the log likelihood of every analysis is computed in a worker process of the
+        analysis pool instead, unless the pool cannot be used (see `use_pool_from`).
+
+        Parameters
+        ----------
+        instance
+            An instance of the model, which includes the CTI model that is fitted to every dataset.
+        """
+        if self.use_pool:
+            if self.analysis_pool is None:
+                self.analysis_pool = SharedMemoryAnalysisPool(
+                    analyses=self.analyses, n_processes=self.n_processes
+                )
+
+            return self.analysis_pool(instance)
+
+        if self.clocker is None or self.n_cores > 1:
+            return super().log_likelihood_function(instance)
+
+        for analysis in self.analyses:
+            analysis.settings_cti.check_total_density_within_range(
+                parallel_traps=instance.cti.parallel_trap_list,
+                serial_traps=instance.cti.serial_trap_list,
+            )
+            analysis.pre_check_instance(instance=instance)
+
+        post_cti_data_list = self.clocker.add_cti_stacked(
+            data_list=[analysis.dataset.pre_cti_data for analysis in self.analyses],
+            cti=instance.cti,
+            preloads_list=[analysis.preloads for analysis in self.analyses],
+        )
+
+        return sum(
+            analysis.figure_of_merit_from(
+                instance=instance, post_cti_data=post_cti_data
+            )
+            for analysis, post_cti_data in zip(self.analyses, post_cti_data_list)
+        )
+
+    def close_pool(self):
+        """
+        Shut down the worker processes and release the shared memory of the analysis pool, if it has been created.
+        """
+        if self.analysis_pool is not None:
+            self.analysis_pool.close()
+            self.analysis_pool = None
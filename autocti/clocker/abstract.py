@@ -1,3 +1,5 @@
+from contextlib import nullcontext
+
 from arcticpy import CCD
 from arcticpy import CCDPhase
 
@@ -5,6 +7,8 @@ from autoconf.dictable import from_json, output_to_json
 
 
 class AbstractClocker:
+    profiler = None
+
     def __init__(self, iterations: int = 1, verbosity: int = 0):
         """
         An abstract clocker, which wraps the c++ arctic CTI clocking algorithm in **PyAutoCTI**.
@@ -39,6 +43,22 @@ class AbstractClocker:
         if ccd_phase is not None:
             return CCD(phases=[ccd_phase], fraction_of_traps_per_phase=[1.0])
 
+    def profile_stage(self, name: str):
+        """
+        Returns a context which times the code executed within it as the stage `name` of the log likelihood
+        function, if a `LikelihoodProfiler` has been passed to the clocker by an analysis (see `LikelihoodProfiler`),
+        and otherwise does nothing.
+
+        Parameters
+        ----------
+        name
+            The name of the stage which is timed (e.g. `arctic_parallel`).
+        """
+        if self.profiler is None:
+            return nullcontext()
+
+        return self.profiler.stage(name=name)
+
     @classmethod
     def from_json(cls, file_path):
         return from_json(file_path=file_path)
@@ -0,0 +1,202 @@
+import hashlib
+import numpy as np
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+def canonical_str_from(obj) -> str:
+    """
+    Returns a canonical string representation of an object, which is identical for any two objects whose values
+    are identical, and is used to hash the objects which determine the output of a call to arctic (e.g. the trap
+    species, CCD phase and clocker settings).
+
+    Objects are converted recursively as follows:
+
+    - Python and NumPy scalars are converted to the `repr` of their Python value (e.g. `np.float64(1.0)` and `1.0`
+      give the same string).
+    - NumPy arrays are converted to their dtype, shape and a digest of their bytes.
+    - Lists, tuples and dictionaries are converted element by element (dictionaries sorted by key).
+    - Any other object is converted to its class path and the canonical string of its attributes, or its `repr`
+      if it has no attributes.
+
+    Parameters
+    ----------
+    obj
+        The object which is converted to a canonical string.
+    """
+    if obj is None or isinstance(obj, (bool, np.bool_, str)):
+        return repr(obj if not isinstance(obj, np.bool_) else bool(obj))
+
+    if isinstance(obj, (int, np.integer)):
+        return repr(int(obj))
+
+    if isinstance(obj, (float, np.floating)):
+        return repr(float(obj))
+
+    if isinstance(obj, np.ndarray):
+        return f"ndarray({obj.dtype},{obj.shape},{array_fingerprint_from(obj)})"
+
+    if isinstance(obj, (list, tuple)):
+        return "[" + ",".join(canonical_str_from(value) for value in obj) + "]"
+
+    if isinstance(obj, dict):
+        return (
+            "{"
+            + ",".join(
+                f"{key}:{canonical_str_from(obj[key])}" for key in sorted(obj, key=str)
+            )
+            + "}"
+        )
+
+    cls = obj.__class__
+
+    try:
+        attributes = vars(obj)
+    except TypeError:
+        return f"{cls.__module__}.{cls.__qualname__}({obj!r})"
+
+    return f"{cls.__module__}.{cls.__qualname__}{canonical_str_from(attributes)}"
+
+
+def canonical_hash_from(obj) -> str:
+    """
+    Returns a hash of the canonical string representation of an object (see `canonical_str_from`).
+
+    Parameters
+    ----------
+    obj
+        The object which is hashed.
+    """
+    return hashlib.blake2b(canonical_str_from(obj).encode(), digest_size=16).hexdigest()
+
+
+def array_fingerprint_from(array: np.ndarray) -> str:
+    """
+    Returns a fingerprint of a NumPy array, which is a hash of its dtype, shape and every byte of its values.
+
+    Parameters
+    ----------
+    array
+        The array which is fingerprinted.
+    """
+    array = np.ascontiguousarray(array)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{array.dtype}{array.shape}".encode())
+    digest.update(array.reshape(-1).view(np.uint8))
+
+    return digest.hexdigest()
+
+
+class ClockerCache:
+    def __init__(self, max_bytes: int):
+        """
+        A least-recently-used (LRU) cache of the post-CTI images output by a clocker, bounded by the total number of
+        bytes of the images it stores.
+
+        Every image is stored under a key (e.g. the hash of the CTI model, the clocker settings and a fingerprint of
+        the pre-CTI data) such that repeated calls to arctic with identical inputs, for example when the maximum
+        likelihood fit of a non-linear search is visualized or re-loaded via the aggregator, return the stored image
+        instead of clocking the data again.
+
+        When storing an image would exceed `max_bytes`, the least recently used images are evicted until it fits.
+        Images larger than `max_bytes` are not stored.
+
+        The cache is thread safe, such that it can be shared by clockers evaluated over a thread pool.
+
+        Parameters
+        ----------
+        max_bytes
+            The maximum total number of bytes of all images stored in the cache.
+        """
+        self.max_bytes = max_bytes
+
+        self._image_dict = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._image_dict)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._image_dict
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """
+        Returns the image stored under the input key (marking it as the most recently used) or `None` if no
+        image is stored, updating the hit and miss counters.
+
+        Parameters
+        ----------
+        key
+            The key the image is stored under.
+        """
+        with self._lock:
+            try:
+                image = self._image_dict[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._image_dict.move_to_end(key)
+            self.hits += 1
+
+            return image
+
+    def set(self, key: Hashable, image: np.ndarray):
+        """
+        Stores an image under the input key, evicting the least recently used images if the total bytes of the cache
+        would exceed `max_bytes`.
+
+        The image is stored as a read-only array, such that it cannot be modified in place.
+
+        Parameters
+        ----------
+        key
+            The key the image is stored under.
+        image
+            The image which is stored.
+        """
+        image = np.array(image)
+        image.setflags(write=False)
+
+        if image.nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._image_dict:
+                self.total_bytes -= self._image_dict.pop(key).nbytes
+
+            while self._image_dict and self.total_bytes + image.nbytes > self.max_bytes:
+                _, image_evicted = self._image_dict.popitem(last=False)
+                self.total_bytes -= image_evicted.nbytes
+                self.evictions += 1
+
+            self._image_dict[key] = image
+            self.total_bytes += image.nbytes
+
+    def clear(self):
+        """
+        Removes every image from the cache and resets its counters.
+        """
+        with self._lock:
+            self._image_dict.clear()
+            self.total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
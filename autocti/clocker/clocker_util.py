@@ -0,0 +1,214 @@
+import numpy as np
+from typing import List, Tuple
+
+_max_quantized_value = 2.0**53
+
+
+def fast_index_array_and_inverse_from(
+    array: np.ndarray, for_parallel: bool, tolerance: float = 1.0e-8
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    For 2D images where the same signal is repeated over many columns (e.g. uniform charge injection imaging) or
+    rows, returns the indexes of every unique stripe (columns if `for_parallel=True`, rows otherwise) and an inverse
+    array mapping every stripe of the image to the unique stripe it is identical to.
+
+    The unique stripes are found in a single vectorized pass, by quantizing every stripe to integer multiples
+    of `tolerance` and hashing each quantized stripe to a single 64-bit integer (via its dot product with a fixed
+    set of random odd integers). Unique hashes are found via `np.unique`, and the stripes paired via their hash are
+    then checked to be identical to their unique stripe. In the (extremely unlikely) event of a hash collision the
+    quantized stripes are instead lexsorted via `np.unique(axis=0)`. This avoids comparing every stripe to every
+    other stripe in a Python loop, which scales as O(N^2) in the number of stripes.
+
+    Values are quantized by rounding, therefore stripes whose values all lie in the same `tolerance` wide bin are
+    paired, meaning paired stripes always differ by less than `tolerance` in every pixel. Values which are
+    integer multiples of `tolerance` (e.g. injection levels of 100.0 electrons) sit at the centre of their bin,
+    such that floating point noise does not split them into different bins.
+
+    This differs from the stripe-by-stripe search, which paired stripes differing by less than `tolerance` from the
+    first stripe of a pair: two stripes differing by less than `tolerance` whose values straddle a bin edge are not
+    paired. This only means an extra stripe is clocked via arctic, it never pairs stripes which are not identical.
+
+    Stripes whose values cannot be quantized exactly (because a value divided by `tolerance` exceeds the range of
+    integers a float64 represents exactly) are instead paired only if they are exactly equal, via
+    `np.unique(axis=0)`. Stripes containing a NaN or infinite value are never paired, as in the stripe-by-stripe
+    search.
+
+    The unique stripes are ordered by the index of their first occurrence in the image, with this first index
+    used as the index of the unique stripe, such that the output matches the stripe-by-stripe search previously
+    performed by `Clocker2D.fast_indexes_from`.
+
+    Parameters
+    ----------
+    array
+        The 2D image whose unique columns or rows are found.
+    for_parallel
+        If `True` unique columns are found (for parallel clocking), if `False` unique rows are found (for serial
+        clocking).
+    tolerance
+        The absolute difference in every pixel below which two stripes are considered identical.
+
+    Returns
+    -------
+    The indexes of the first occurrence of every unique stripe and, for every stripe in the image, the index of the
+    unique stripe it maps to (both as `np.int32` arrays).
+    """
+    array = np.asarray(array)
+
+    stripes = array.T if for_parallel else array
+
+    total_stripes = stripes.shape[0]
+
+    finite = np.all(np.isfinite(stripes), axis=1)
+
+    quantizable = finite & np.all(
+        np.abs(stripes) < _max_quantized_value * tolerance, axis=1
+    )
+
+    group_array = np.arange(total_stripes, dtype=np.int64)
+
+    if np.any(quantizable):
+        group_array[quantizable] = np.flatnonzero(quantizable)[
+            _first_index_array_from(
+                quantized=np.round(stripes[quantizable] / tolerance).astype(np.int64)
+            )
+        ]
+
+    exact = finite & ~quantizable
+
+    if np.any(exact):
+        _, first_index_array, inverse_array = np.unique(
+            stripes[exact], axis=0, return_index=True, return_inverse=True
+        )
+
+        group_array[exact] = np.flatnonzero(exact)[
+            first_index_array[inverse_array.reshape(-1)]
+        ]
+
+    first_index_array, inverse_array = np.unique(group_array, return_inverse=True)
+
+    return first_index_array.astype(np.int32), inverse_array.reshape(-1).astype(
+        np.int32
+    )
+
+
+def _first_index_array_from(quantized: np.ndarray) -> np.ndarray:
+    """
+    For every stripe of an array of quantized stripes, returns the index of the first stripe it is identical to.
+
+    Every stripe is hashed to a single 64-bit integer via its dot product with a fixed set of random odd integers,
+    whose unique values are found via `np.unique`. If any stripes paired via their hash are not identical (a hash
+    collision) the quantized stripes are instead lexsorted via `np.unique(axis=0)`.
+
+    Parameters
+    ----------
+    quantized
+        The stripes quantized to integer multiples of the tolerance, of shape (total_stripes, stripe_length).
+    """
+    hash_weights = np.random.default_rng(seed=1).integers(
+        low=1, high=2**62, size=quantized.shape[1], dtype=np.int64
+    )
+
+    _, first_index_array, inverse_array = np.unique(
+        quantized @ (hash_weights | 1), return_index=True, return_inverse=True
+    )
+
+    if not np.array_equal(quantized, quantized[first_index_array[inverse_array]]):
+        _, first_index_array, inverse_array = np.unique(
+            quantized, axis=0, return_index=True, return_inverse=True
+        )
+
+    return first_index_array[inverse_array.reshape(-1)]
+
+
+def fast_stripe_lists_from(
+    fast_inverse_array: np.ndarray, total_unique: int
+) -> List[List[int]]:
+    """
+    Converts the inverse array returned by `fast_index_array_and_inverse_from`, which maps every stripe of an image
+    to its unique stripe, to a list of lists where each inner list contains every stripe index that is identical
+    to a given unique stripe.
+
+    Parameters
+    ----------
+    fast_inverse_array
+        For every stripe in the image, the index of the unique stripe it maps to.
+    total_unique
+        The total number of unique stripes.
+    """
+    order = np.argsort(fast_inverse_array, kind="stable")
+    counts = np.bincount(fast_inverse_array, minlength=total_unique)
+
+    return [
+        stripe_array.tolist()
+        for stripe_array in np.split(order, np.cumsum(counts)[:-1])
+    ]
+
+
+def poisson_density_array_from(
+    density_list: List[float], total_pixels: int, total_columns: int, seed: int = -1
+) -> np.ndarray:
+    """
+    Draws the density of every trap species in every column of an image from a Poisson distribution, where the
+    input density of each species is the mean density of that species.
+
+    For every column the number of traps of each species over `total_pixels` is drawn from a Poisson distribution
+    whose mean is the species density multiplied by `total_pixels`, which is then divided by `total_pixels` to give
+    that column's density.
+
+    Every column is given its own random number generator, seeded by a child of a `np.random.SeedSequence`
+    spawned from the input `seed`. The densities drawn for a given column therefore depend only on the seed
+    and the column index, such that the densities are reproducible irrespective of the order in which columns
+    are clocked (e.g. how they are distributed over threads).
+
+    Parameters
+    ----------
+    density_list
+        The mean density of every trap species.
+    total_pixels
+        The number of pixels in every column over which the number of traps is drawn.
+    total_columns
+        The number of columns for which densities are drawn.
+    seed
+        The seed of the `np.random.SeedSequence`, where a value of -1 uses fresh entropy from the operating system
+        and therefore draws different densities every call.
+
+    Returns
+    -------
+    An array of shape (total_columns, total_species) containing the drawn density of every trap species in every
+    column.
+    """
+    seed_sequence = np.random.SeedSequence(None if seed == -1 else seed)
+
+    lam_array = np.asarray(density_list, dtype="float") * total_pixels
+
+    return np.array(
+        [
+            np.random.default_rng(column_seed).poisson(lam=lam_array)
+            for column_seed in seed_sequence.spawn(total_columns)
+        ],
+        dtype="float",
+    ).reshape(total_columns, lam_array.shape[0]) / float(total_pixels)
+
+
+def window_index_arrays_from(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the indexes of every row and every column of a 2D mask which contain at least one unmasked pixel.
+
+    These define the window of an image which is clocked when a clocker's `window_from_mask` is on, where only
+    pixels which influence the unmasked pixels are clocked via arctic.
+
+    Parameters
+    ----------
+    mask
+        The 2D mask, where `True` entries are masked and not used in the likelihood function.
+
+    Returns
+    -------
+    The indexes of the rows and columns containing at least one unmasked pixel (both as `np.int32` arrays).
+    """
+    unmasked = ~np.asarray(mask, dtype="bool")
+
+    return (
+        np.flatnonzero(unmasked.any(axis=1)).astype(np.int32),
+        np.flatnonzero(unmasked.any(axis=0)).astype(np.int32),
+    )
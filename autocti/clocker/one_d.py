@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Optional
 
 from arcticpy import add_cti
@@ -99,53 +100,145 @@ class Clocker1D(AbstractClocker):
             and release electrons and the volume-filling behaviour of the CCD.
         """
 
-        trap_list, ccd = self._traps_ccd_from(cti=cti)
-
         image_pre_cti_2d = aa.Array2D.zeros(
             shape_native=(data.shape_native[0], 1), pixel_scales=data.pixel_scales
         ).native
 
         image_pre_cti_2d[:, 0] = data
 
+        image_post_cti = self.add_cti_columns(
+            image=image_pre_cti_2d,
+            cti=cti,
+            window_offset=data.readout_offsets[0],
+        )
+
+        return aa.Array1D.no_mask(
+            values=np.asarray(image_post_cti).flatten(), pixel_scales=data.pixel_scales
+        )
+
+    def add_cti_columns(
+        self,
+        image: np.ndarray,
+        cti: CTI1D,
+        window_offset: int = 0,
+    ) -> np.ndarray:
+        """
+        Add CTI to every column of a 2D ndarray via a single call to the c++ arctic clocking algorithm, where every
+        column is an independent 1D line of data (e.g. a warm pixel line) which is clocked towards row 0.
+
+        This is used to clock many 1D datasets at once (e.g. thousands of warm pixel lines), because passing the
+        lines to arctic as the columns of a single 2D image replaces a call to arctic per line with one call. The
+        columns are independent of one another if the read-out electronics empty traps between columns (the default
+        behaviour of the `ROE`).
+
+        Parameters
+        ----------
+        image
+            The 2D ndarray whose columns are clocked via arctic and have CTI added to them.
+        cti
+            An object which represents the CTI properties of 1D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD.
+        window_offset
+            The number of pixels before clocking begins (e.g. the readout offset of the 1D data), which is the same
+            for every column.
+        """
+        trap_list, ccd = self._traps_ccd_from(cti=cti)
+
         ccd = self.ccd_from(ccd_phase=ccd)
 
-        try:
-            image_post_cti = add_cti(
-                image=image_pre_cti_2d,
-                parallel_ccd=ccd,
-                parallel_roe=self.roe,
-                parallel_traps=trap_list,
-                parallel_express=self.express,
-                parallel_window_offset=data.readout_offsets[0],
-                parallel_window_start=self.window_start,
-                parallel_window_stop=self.window_stop,
-                parallel_time_start=self.time_start,
-                parallel_time_stop=self.time_stop,
-                parallel_prune_n_electrons=self.prune_n_electrons,
-                parallel_prune_frequency=self.prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                verbosity=self.verbosity,
-            )
-        except TypeError:
-            image_post_cti = add_cti(
-                image=image_pre_cti_2d,
-                parallel_ccd=ccd,
-                parallel_roe=self.roe,
-                parallel_traps=trap_list,
-                parallel_express=self.express,
-                parallel_window_offset=data.readout_offsets[0],
-                parallel_window_start=self.window_start,
-                parallel_window_stop=self.window_stop,
-                parallel_time_start=self.time_start,
-                parallel_time_stop=self.time_stop,
-                parallel_prune_n_electrons=self.prune_n_electrons,
-                parallel_prune_frequency=self.prune_frequency,
-                verbosity=self.verbosity,
+        with self.profile_stage(name="arctic_parallel"):
+            try:
+                return add_cti(
+                    image=image,
+                    parallel_ccd=ccd,
+                    parallel_roe=self.roe,
+                    parallel_traps=trap_list,
+                    parallel_express=self.express,
+                    parallel_window_offset=window_offset,
+                    parallel_window_start=self.window_start,
+                    parallel_window_stop=self.window_stop,
+                    parallel_time_start=self.time_start,
+                    parallel_time_stop=self.time_stop,
+                    parallel_prune_n_electrons=self.prune_n_electrons,
+                    parallel_prune_frequency=self.prune_frequency,
+                    allow_negative_pixels=self.allow_negative_pixels,
+                    verbosity=self.verbosity,
+                )
+            except TypeError:
+                return add_cti(
+                    image=image,
+                    parallel_ccd=ccd,
+                    parallel_roe=self.roe,
+                    parallel_traps=trap_list,
+                    parallel_express=self.express,
+                    parallel_window_offset=window_offset,
+                    parallel_window_start=self.window_start,
+                    parallel_window_stop=self.window_stop,
+                    parallel_time_start=self.time_start,
+                    parallel_time_stop=self.time_stop,
+                    parallel_prune_n_electrons=self.prune_n_electrons,
+                    parallel_prune_frequency=self.prune_frequency,
+                    verbosity=self.verbosity,
+                )
+
+    def add_cti_many(
+        self,
+        data_list: List[aa.Array1D],
+        cti: CTI1D,
+    ) -> List[aa.Array1D]:
+        """
+        Add CTI to a list of 1D datasets using the same CTI model, for example the binned FPR / EPER lines of many
+        CCD quadrants which are fitted simultaneously.
+
+        Calling `add_cti` for every line calls arctic once per line. This function instead groups the lines into
+        buckets of lines with the same length and readout offset, packs every bucket into a 2D image where every
+        line is a column and clocks every bucket via a single call to arctic (see `add_cti_columns`). Lines of equal
+        length (the typical use case) are therefore all clocked via one call to arctic.
+
+        The post-CTI data of every line is returned as an `Array1D` created from its column of the post-CTI image of
+        its bucket, in the same order as the input `data_list`.
+
+        Columns are only independent of one another if the read-out electronics empty traps between columns,
+        therefore if the `ROE` does not every line is instead clocked separately via `add_cti`.
+
+        Parameters
+        ----------
+        data_list
+            The 1D datasets that are clocked via arctic and have CTI added to them.
+        cti
+            An object which represents the CTI properties of 1D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD.
+        """
+        if not self.roe.empty_traps_between_columns:
+            return [self.add_cti(data=data, cti=cti) for data in data_list]
+
+        bucket_dict = {}
+
+        for index, data in enumerate(data_list):
+            key = (data.shape_native[0], data.readout_offsets[0])
+            bucket_dict.setdefault(key, []).append(index)
+
+        post_cti_data_list = [None] * len(data_list)
+
+        for (total_pixels, window_offset), index_list in bucket_dict.items():
+            image_pre_cti_2d = np.zeros(shape=(total_pixels, len(index_list)))
+
+            for column, index in enumerate(index_list):
+                image_pre_cti_2d[:, column] = data_list[index]
+
+            image_post_cti = np.asarray(
+                self.add_cti_columns(
+                    image=image_pre_cti_2d, cti=cti, window_offset=window_offset
+                )
             )
 
-        return aa.Array1D.no_mask(
-            values=image_post_cti.flatten(), pixel_scales=data.pixel_scales
-        )
+            for column, index in enumerate(index_list):
+                post_cti_data_list[index] = aa.Array1D.no_mask(
+                    values=image_post_cti[:, column],
+                    pixel_scales=data_list[index].pixel_scales,
+                )
+
+        return post_cti_data_list
 
     def remove_cti(
         self,
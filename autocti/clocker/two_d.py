@@ -1,5 +1,7 @@
+import copy
 import numpy as np
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 
 from arcticpy import add_cti
 from arcticpy import remove_cti
@@ -9,11 +11,23 @@ from arcticpy import ROE
 import autoarray as aa
 
 from autocti.clocker.abstract import AbstractClocker
+from autocti.clocker import clocker_util
+from autocti.clocker.cache import ClockerCache
+from autocti.clocker.cache import array_fingerprint_from
+from autocti.clocker.cache import canonical_hash_from
 from autocti.model.model_util import CTI2D
 from autocti.preloads import Preloads
 
 
 class Clocker2D(AbstractClocker):
+    _cache_exclude_fields = (
+        "cache",
+        "cache_max_bytes",
+        "n_threads",
+        "parallel_trap_column_list",
+        "profiler",
+    )
+
     def __init__(
         self,
         iterations: int = 5,
@@ -41,6 +55,9 @@ class Clocker2D(AbstractClocker):
         allow_negative_pixels=1,
         verbosity: int = 0,
         poisson_seed: int = -1,
+        n_threads: int = 1,
+        cache_max_bytes: int = 0,
+        window_from_mask: bool = False,
     ):
         """
         Performs clocking of a 2D image via the c++ arctic algorithm.
@@ -93,6 +110,9 @@ class Clocker2D(AbstractClocker):
             If input, serial CTI is added via arctic efficiently by calling arctic once and mapping the 1D output over
             the full 2D image. This requires every row in the image has the same signal (such that each column gives
             an identical arctic output).
+
+            If both `parallel_fast_mode` and `serial_fast_mode` are on, unique columns are parallel clocked and the
+            unique rows of the parallel clocked image are then serial clocked (see `add_cti_parallel_serial_fast`).
         allow_negative_pixels
             If True, negative electrons in a pixel are allowed and modeled via arCTIc, if Falss they are explicitly
             not allowed.
@@ -100,6 +120,25 @@ class Clocker2D(AbstractClocker):
             Whether to silence print statements and output from the c++ arctic call.
         poisson_seed
             A seed for the random number generator which draws the Poisson trap densities from a Poisson distribution.
+            The seed of every column is spawned from this seed, such that the same densities are drawn for every
+            column irrespective of `n_threads`. A value of -1 draws different densities every call.
+        n_threads
+            The number of threads used to call arctic. If above 1, the image is split into blocks of columns for
+            parallel clocking and blocks of rows for serial clocking, which are clocked concurrently on a thread pool
+            and stitched back together, giving an output identical to clocking the whole image in one call. If a
+            parallel or serial window is set the standard (non fast mode) clocking is performed in a single call.
+        cache_max_bytes
+            If above 0, every post-CTI image output by `add_cti` is stored in a least-recently-used cache bounded
+            by this number of bytes, keyed on a hash of the CTI model, the clocker settings and the pre-CTI data.
+            Repeated calls with identical inputs (e.g. visualizing the maximum likelihood fit) then return the stored
+            image without calling arctic. For CTI models with parallel and serial traps the image after parallel
+            clocking is also cached, such that when only the serial parameters change only serial clocking is
+            performed.
+        window_from_mask
+            If `True` and the `preloads` passed to `add_cti` contain the rows and columns of the data which contain
+            unmasked pixels (e.g. as set up by `AnalysisImagingCI`), only the pixels which influence the unmasked
+            pixels are clocked via arctic and all other pixels of the post-CTI image are zero (see
+            `add_cti_windowed`).
         """
 
         super().__init__(iterations=iterations, verbosity=verbosity)
@@ -131,6 +170,15 @@ class Clocker2D(AbstractClocker):
 
         self.poisson_seed = poisson_seed
 
+        self.n_threads = n_threads
+
+        self.window_from_mask = window_from_mask
+
+        self.cache_max_bytes = cache_max_bytes
+        self.cache = (
+            ClockerCache(max_bytes=cache_max_bytes) if cache_max_bytes > 0 else None
+        )
+
     def _parallel_traps_ccd_from(self, cti: CTI2D):
         """
         Unpack the `CTI1D` object to retries its traps and ccd.
@@ -153,6 +201,230 @@ class Clocker2D(AbstractClocker):
 
         return trap_list, cti.serial_ccd
 
+    @property
+    def _clocks_full_window(self) -> bool:
+        """
+        Whether the parallel and serial windows of the clocker span the whole image.
+
+        A combined parallel and serial call to arctic clocks parallel CTI only over the columns of the serial window
+        and serial CTI only over the rows of the parallel window. A parallel only call followed by a serial only call
+        (e.g. to clock each direction in blocks over threads) is therefore only identical to a combined call if
+        neither window is set.
+        """
+        return (
+            self.parallel_window_start == 0
+            and self.parallel_window_stop == -1
+            and self.serial_window_start == 0
+            and self.serial_window_stop == -1
+        )
+
+    def _add_cti_via_blocks_from(
+        self, image: np.ndarray, add_cti_func: Callable, for_parallel: bool
+    ) -> np.ndarray:
+        """
+        Add CTI to a 2D image via an input function which calls arctic, splitting the image into blocks of columns
+        (for parallel clocking) or rows (for serial clocking) which are clocked concurrently on a thread pool of
+        `n_threads` threads.
+
+        Parallel clocking of every column and serial clocking of every row are independent of one another, therefore
+        the stitched output of every block is identical to passing the whole image to arctic in a single call. The
+        c++ arctic extension releases the GIL, therefore the blocks are clocked in parallel.
+
+        If the read-out electronics do not empty traps between columns (or rows) the clocking of each column depends
+        on the columns before it, in which case the image is not split into blocks.
+
+        Parameters
+        ----------
+        image
+            The 2D image that is clocked via arctic and has CTI added to it.
+        add_cti_func
+            The function which clocks a single block of the image via a call to arctic.
+        for_parallel
+            If `True` the image is split into blocks of columns for parallel clocking, if `False` it is split into
+            blocks of rows for serial clocking.
+        """
+        axis = 1 if for_parallel else 0
+        roe = self.parallel_roe if for_parallel else self.serial_roe
+
+        total_blocks = min(self.n_threads, image.shape[axis])
+
+        if total_blocks <= 1 or not roe.empty_traps_between_columns:
+            return add_cti_func(image)
+
+        image_block_list = [
+            np.ascontiguousarray(image_block)
+            for image_block in np.array_split(image, total_blocks, axis=axis)
+        ]
+
+        with ThreadPoolExecutor(max_workers=total_blocks) as executor:
+            image_post_cti_block_list = list(
+                executor.map(add_cti_func, image_block_list)
+            )
+
+        return np.concatenate(image_post_cti_block_list, axis=axis)
+
+    def _add_cti_parallel_from(
+        self,
+        image: np.ndarray,
+        cti: CTI2D,
+        parallel_window_offset: Optional[int] = None,
+        use_window: bool = True,
+    ) -> np.ndarray:
+        """
+        Add parallel CTI to a 2D image (e.g. the unique columns of the data extracted in a fast mode) via a
+        parallel only call to the c++ arctic clocking algorithm.
+
+        If `n_threads` is above 1 the image is split into blocks of columns which are clocked concurrently.
+
+        Parameters
+        ----------
+        image
+            The 2D image that is clocked via arctic and has parallel CTI added to it.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for parallel clocking.
+        parallel_window_offset
+            The number of pixels before parallel clocking begins, which if not input is the clocker's
+            `parallel_window_offset`.
+        use_window
+            Whether the clocker's `parallel_window_start` and `parallel_window_stop` are passed to arctic. The fast
+            modes do not pass them, such that every pixel of the reduced image is clocked.
+        """
+        parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
+
+        parallel_ccd = self.ccd_from(ccd_phase=parallel_ccd)
+
+        if parallel_window_offset is None:
+            parallel_window_offset = self.parallel_window_offset
+
+        if use_window:
+            window_dict = {
+                "parallel_window_start": self.parallel_window_start,
+                "parallel_window_stop": self.parallel_window_stop,
+            }
+        else:
+            window_dict = {}
+
+        def add_cti_func(image_block):
+            try:
+                return add_cti(
+                    image=image_block,
+                    parallel_ccd=parallel_ccd,
+                    parallel_roe=self.parallel_roe,
+                    parallel_traps=parallel_trap_list,
+                    parallel_express=self.parallel_express,
+                    parallel_window_offset=parallel_window_offset,
+                    **window_dict,
+                    parallel_time_start=self.parallel_time_start,
+                    parallel_time_stop=self.parallel_time_stop,
+                    parallel_prune_n_electrons=self.parallel_prune_n_electrons,
+                    parallel_prune_frequency=self.parallel_prune_frequency,
+                    allow_negative_pixels=self.allow_negative_pixels,
+                    verbosity=self.verbosity,
+                )
+            except TypeError:
+                return add_cti(
+                    image=image_block,
+                    parallel_ccd=parallel_ccd,
+                    parallel_roe=self.parallel_roe,
+                    parallel_traps=parallel_trap_list,
+                    parallel_express=self.parallel_express,
+                    parallel_window_offset=parallel_window_offset,
+                    **window_dict,
+                    parallel_time_start=self.parallel_time_start,
+                    parallel_time_stop=self.parallel_time_stop,
+                    parallel_prune_n_electrons=self.parallel_prune_n_electrons,
+                    parallel_prune_frequency=self.parallel_prune_frequency,
+                    verbosity=self.verbosity,
+                )
+
+        with self.profile_stage(name="arctic_parallel"):
+            return self._add_cti_via_blocks_from(
+                image=image, add_cti_func=add_cti_func, for_parallel=True
+            )
+
+    def _add_cti_serial_from(
+        self,
+        image: np.ndarray,
+        cti: CTI2D,
+        serial_window_offset: Optional[int] = None,
+        use_window: bool = True,
+    ) -> np.ndarray:
+        """
+        Add serial CTI to a 2D image (e.g. the unique rows of the data extracted in a fast mode) via a
+        serial only call to the c++ arctic clocking algorithm.
+
+        If `n_threads` is above 1 the image is split into blocks of rows which are clocked concurrently.
+
+        Parameters
+        ----------
+        image
+            The 2D image that is clocked via arctic and has serial CTI added to it.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for serial clocking.
+        serial_window_offset
+            The number of pixels before serial clocking begins, which if not input is the clocker's
+            `serial_window_offset`.
+        use_window
+            Whether the clocker's `serial_window_start` and `serial_window_stop` are passed to arctic. The fast
+            modes do not pass them, such that every pixel of the reduced image is clocked.
+        """
+        serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
+
+        serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
+
+        if serial_window_offset is None:
+            serial_window_offset = self.serial_window_offset
+
+        if use_window:
+            window_dict = {
+                "serial_window_start": self.serial_window_start,
+                "serial_window_stop": self.serial_window_stop,
+            }
+        else:
+            window_dict = {}
+
+        def add_cti_func(image_block):
+            try:
+                return add_cti(
+                    image=image_block,
+                    serial_ccd=serial_ccd,
+                    serial_roe=self.serial_roe,
+                    serial_traps=serial_trap_list,
+                    serial_express=self.serial_express,
+                    serial_window_offset=serial_window_offset,
+                    **window_dict,
+                    serial_time_start=self.serial_time_start,
+                    serial_time_stop=self.serial_time_stop,
+                    serial_prune_n_electrons=self.serial_prune_n_electrons,
+                    serial_prune_frequency=self.serial_prune_frequency,
+                    allow_negative_pixels=self.allow_negative_pixels,
+                    pixel_bounce_list=cti.pixel_bounce_list,
+                    verbosity=self.verbosity,
+                )
+            except TypeError:
+                return add_cti(
+                    image=image_block,
+                    serial_ccd=serial_ccd,
+                    serial_roe=self.serial_roe,
+                    serial_traps=serial_trap_list,
+                    serial_express=self.serial_express,
+                    serial_window_offset=serial_window_offset,
+                    **window_dict,
+                    serial_time_start=self.serial_time_start,
+                    serial_time_stop=self.serial_time_stop,
+                    serial_prune_n_electrons=self.serial_prune_n_electrons,
+                    serial_prune_frequency=self.serial_prune_frequency,
+                    pixel_bounce_list=cti.pixel_bounce_list,
+                    verbosity=self.verbosity,
+                )
+
+        with self.profile_stage(name="arctic_serial"):
+            return self._add_cti_via_blocks_from(
+                image=image, add_cti_func=add_cti_func, for_parallel=False
+            )
+
     def add_cti(
         self,
         data: aa.Array2D,
@@ -178,96 +450,818 @@ class Clocker2D(AbstractClocker):
         cti
             An object which represents the CTI properties of 2D clocking, including the trap species which capture
             and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
+        preloads
+            Preloaded quantities (e.g. the indexes of unique columns used by the fast modes) which speed up clocking.
+        """
+
+        if self.cache is None or self.parallel_poisson_traps:
+            return self._add_cti_from(data=data, cti=cti, preloads=preloads)
+
+        cache_key = self.cache_key_from(data=data, cti=cti, preloads=preloads)
+
+        image_post_cti = self.cache.get(key=cache_key)
+
+        if image_post_cti is None:
+            if (
+                not self._use_window_from(preloads=preloads)
+                and self._clocks_full_window
+                and cti.parallel_trap_list is not None
+                and cti.serial_trap_list is not None
+                and (self.parallel_fast_mode or not self.serial_fast_mode)
+            ):
+                image_post_cti = self._add_cti_via_parallel_cache_from(
+                    data=data, cti=cti, preloads=preloads
+                )
+            else:
+                image_post_cti = self._add_cti_from(
+                    data=data, cti=cti, preloads=preloads
+                )
+
+            self.cache.set(key=cache_key, image=image_post_cti)
+
+            return image_post_cti
+
+        try:
+            return aa.Array2D(
+                values=np.array(image_post_cti),
+                mask=data.mask,
+                store_native=True,
+                skip_mask=True,
+            )
+        except AttributeError:
+            return np.array(image_post_cti)
+
+    def cache_key_from(
+        self,
+        data: aa.Array2D,
+        cti: CTI2D,
+        parallel_only: bool = False,
+        preloads: Optional[Preloads] = Preloads(),
+    ) -> tuple:
+        """
+        Returns the key under which the post-CTI image output by `add_cti` is stored in the clocker's cache.
+
+        The key is a tuple of a canonical hash of the CTI model (its trap species, CCD phases and pixel bounce), a
+        canonical hash of the clocker settings which change the output of arctic and a fingerprint of the pre-CTI
+        data (its values and readout offsets). Two calls whose inputs have identical values therefore have the same
+        key, even if they are different Python objects.
+
+        Hashing the values of the data on every call is expensive for large images, therefore if the `preloads`
+        contain the fingerprint of the data (e.g. as set up by `AnalysisImagingCI`) it is used instead.
+
+        If `parallel_only=True` the key of the image after only parallel clocking is returned, which only depends on
+        the parallel trap species and CCD phase of the CTI model.
+
+        Parameters
+        ----------
+        data
+            The 2D data that is clocked via arctic and has CTI added to it.
+        cti
+            An object which represents the CTI properties of 2D clocking.
+        parallel_only
+            If `True`, the key of the post-parallel clocking image is returned.
+        preloads
+            If windowed clocking is used, the rows and columns of the window are included in the key. If it contains
+            the fingerprint of the data, this is used instead of fingerprinting the data.
+        """
+        settings_dict = {
+            key: value
+            for key, value in vars(self).items()
+            if key not in self._cache_exclude_fields
+        }
+
+        if parallel_only:
+            cti_list = ["parallel", cti.parallel_trap_list, cti.parallel_ccd]
+        else:
+            cti_list = [
+                cti.parallel_trap_list,
+                cti.parallel_ccd,
+                cti.serial_trap_list,
+                cti.serial_ccd,
+                cti.pixel_bounce_list,
+            ]
+
+        return (
+            canonical_hash_from(cti_list),
+            canonical_hash_from(settings_dict),
+            preloads.data_fingerprint
+            or array_fingerprint_from(np.asarray(data.native_skip_mask)),
+            canonical_hash_from(getattr(data, "readout_offsets", None)),
+            canonical_hash_from(
+                [preloads.window_row_index_array, preloads.window_column_index_array]
+                if self._use_window_from(preloads=preloads)
+                else None
+            ),
+        )
+
+    def _add_cti_via_parallel_cache_from(
+        self,
+        data: aa.Array2D,
+        cti: CTI2D,
+        preloads: Optional[Preloads] = Preloads(),
+    ) -> aa.Array2D:
+        """
+        Add parallel and serial CTI to a 2D dataset via two calls to the c++ arctic clocking algorithm, where the
+        image after parallel clocking is stored in the clocker's cache.
+
+        The post-parallel image only depends on the parallel trap species and CCD phase of the CTI model. In a
+        model-fit where only the serial parameters change (e.g. a serial only search with the parallel model fixed)
+        the post-parallel image is therefore retrieved from the cache and only serial clocking is performed,
+        roughly halving the run time of arctic.
+
+        If `parallel_fast_mode=True` the post-parallel image is computed from only the unique columns of the data and
+        if `serial_fast_mode=True` serial clocking is performed on only the unique rows of the post-parallel image,
+        as in `add_cti_parallel_serial_fast`. The window offsets are those of the clocking mode which is cached, such
+        that the output is identical to `_add_cti_from`: the fast modes use the clocker's window offsets and the
+        standard mode the readout offsets of the data.
+
+        Parameters
+        ----------
+        data
+            The 2D data that is clocked via arctic and has CTI added to it.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
+        preloads
+            Contains the indexes of the unique columns in the data and the inverse array mapping them to every column
+            of the data, which if not preloaded are computed via `clocker_util.fast_index_array_and_inverse_from`.
+        """
+        image_pre_cti = data.native_skip_mask
+
+        parallel_window_offset = self.parallel_window_offset
+        serial_window_offset = self.serial_window_offset
+
+        if not self.parallel_fast_mode:
+            try:
+                parallel_window_offset = image_pre_cti.readout_offsets[0]
+                serial_window_offset = image_pre_cti.readout_offsets[1]
+            except AttributeError:
+                pass
+
+        cache_key = self.cache_key_from(
+            data=data, cti=cti, parallel_only=True, preloads=preloads
+        )
+
+        image_post_parallel = self.cache.get(key=cache_key)
+
+        if image_post_parallel is None:
+            if self.parallel_fast_mode:
+                if preloads.parallel_fast_index_array is None:
+                    (
+                        fast_index_array,
+                        fast_inverse_array,
+                    ) = clocker_util.fast_index_array_and_inverse_from(
+                        array=image_pre_cti, for_parallel=True
+                    )
+                else:
+                    fast_index_array = preloads.parallel_fast_index_array
+                    fast_inverse_array = preloads.parallel_fast_inverse_array
+
+                image_post_parallel_pass = self._add_cti_parallel_from(
+                    image=np.ascontiguousarray(
+                        np.asarray(image_pre_cti)[:, fast_index_array], dtype="float"
+                    ),
+                    cti=cti,
+                    parallel_window_offset=parallel_window_offset,
+                )
+
+                image_post_parallel = np.asarray(image_post_parallel_pass)[
+                    :, fast_inverse_array
+                ]
+            else:
+                image_post_parallel = np.asarray(
+                    self._add_cti_parallel_from(
+                        image=np.array(image_pre_cti, dtype="float"),
+                        cti=cti,
+                        parallel_window_offset=parallel_window_offset,
+                    )
+                )
+
+            self.cache.set(key=cache_key, image=image_post_parallel)
+
+        if self.serial_fast_mode:
+            (
+                fast_row_index_array,
+                fast_row_inverse_array,
+            ) = clocker_util.fast_index_array_and_inverse_from(
+                array=image_post_parallel, for_parallel=False
+            )
+
+            image_post_serial_pass = self._add_cti_serial_from(
+                image=np.ascontiguousarray(
+                    image_post_parallel[fast_row_index_array, :], dtype="float"
+                ),
+                cti=cti,
+                serial_window_offset=serial_window_offset,
+            )
+
+            image_post_cti = np.asarray(image_post_serial_pass)[
+                fast_row_inverse_array, :
+            ]
+        else:
+            image_post_cti = self._add_cti_serial_from(
+                image=np.array(image_post_parallel, dtype="float"),
+                cti=cti,
+                serial_window_offset=serial_window_offset,
+            )
+
+        try:
+            return aa.Array2D(
+                values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
+            )
+        except AttributeError:
+            return image_post_cti
+
+    def _add_cti_from(
+        self,
+        data: aa.Array2D,
+        cti: CTI2D,
+        preloads: Optional[Preloads] = Preloads(),
+    ) -> aa.Array2D:
         """
+        Add CTI to a 2D dataset via the c++ arctic clocking algorithm, dispatching to the clocking mode set by the
+        clocker's settings (e.g. Poisson traps, the fast modes, multi-threading), without using the cache.
 
+        See `add_cti` for a full description.
+        """
         if self.parallel_poisson_traps:
             return self.add_cti_poisson_traps(data=data, cti=cti)
 
+        if self.parallel_fast_mode and self.serial_fast_mode:
+            return self.add_cti_parallel_serial_fast(
+                data=data, cti=cti, preloads=preloads
+            )
+
         if self.parallel_fast_mode:
             return self.add_cti_parallel_fast(data=data, cti=cti, preloads=preloads)
 
         if self.serial_fast_mode:
             return self.add_cti_serial_fast(data=data, cti=cti, preloads=preloads)
 
+        if self._use_window_from(preloads=preloads):
+            return self.add_cti_windowed(data=data, cti=cti, preloads=preloads)
+
         data = data.native_skip_mask
 
         parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
         serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
 
-        parallel_ccd = self.ccd_from(ccd_phase=parallel_ccd)
-        serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
+        parallel_ccd = self.ccd_from(ccd_phase=parallel_ccd)
+        serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
+
+        try:
+            parallel_window_offset = data.readout_offsets[0]
+            serial_window_offset = data.readout_offsets[1]
+        except AttributeError:
+            parallel_window_offset = self.parallel_window_offset
+            serial_window_offset = self.serial_window_offset
+
+        if self.n_threads > 1 and self._clocks_full_window:
+            image_post_cti = np.asarray(data)
+
+            if cti.parallel_trap_list is not None:
+                image_post_cti = self._add_cti_parallel_from(
+                    image=image_post_cti,
+                    cti=cti,
+                    parallel_window_offset=parallel_window_offset,
+                )
+
+            if cti.serial_trap_list is not None or cti.pixel_bounce_list is not None:
+                image_post_cti = self._add_cti_serial_from(
+                    image=image_post_cti,
+                    cti=cti,
+                    serial_window_offset=serial_window_offset,
+                )
+
+            try:
+                return aa.Array2D(
+                    values=image_post_cti,
+                    mask=data.mask,
+                    store_native=True,
+                    skip_mask=True,
+                )
+            except AttributeError:
+                return image_post_cti
+
+        with self.profile_stage(name="arctic"):
+            try:
+                image_post_cti = add_cti(
+                    image=data,
+                    parallel_ccd=parallel_ccd,
+                    parallel_roe=self.parallel_roe,
+                    parallel_traps=parallel_trap_list,
+                    parallel_express=self.parallel_express,
+                    parallel_window_offset=parallel_window_offset,
+                    parallel_window_start=self.parallel_window_start,
+                    parallel_window_stop=self.parallel_window_stop,
+                    parallel_time_start=self.parallel_time_start,
+                    parallel_time_stop=self.parallel_time_stop,
+                    parallel_prune_n_electrons=self.parallel_prune_n_electrons,
+                    parallel_prune_frequency=self.parallel_prune_frequency,
+                    serial_ccd=serial_ccd,
+                    serial_roe=self.serial_roe,
+                    serial_traps=serial_trap_list,
+                    serial_express=self.serial_express,
+                    serial_window_offset=serial_window_offset,
+                    serial_window_start=self.serial_window_start,
+                    serial_window_stop=self.serial_window_stop,
+                    serial_time_start=self.serial_time_start,
+                    serial_time_stop=self.serial_time_stop,
+                    serial_prune_n_electrons=self.serial_prune_n_electrons,
+                    serial_prune_frequency=self.serial_prune_frequency,
+                    allow_negative_pixels=self.allow_negative_pixels,
+                    pixel_bounce_list=cti.pixel_bounce_list,
+                    verbosity=self.verbosity,
+                )
+            except TypeError:
+                image_post_cti = add_cti(
+                    image=data,
+                    parallel_ccd=parallel_ccd,
+                    parallel_roe=self.parallel_roe,
+                    parallel_traps=parallel_trap_list,
+                    parallel_express=self.parallel_express,
+                    parallel_window_offset=parallel_window_offset,
+                    parallel_window_start=self.parallel_window_start,
+                    parallel_window_stop=self.parallel_window_stop,
+                    parallel_time_start=self.parallel_time_start,
+                    parallel_time_stop=self.parallel_time_stop,
+                    parallel_prune_n_electrons=self.parallel_prune_n_electrons,
+                    parallel_prune_frequency=self.parallel_prune_frequency,
+                    serial_ccd=serial_ccd,
+                    serial_roe=self.serial_roe,
+                    serial_traps=serial_trap_list,
+                    serial_express=self.serial_express,
+                    serial_window_offset=serial_window_offset,
+                    serial_window_start=self.serial_window_start,
+                    serial_window_stop=self.serial_window_stop,
+                    serial_time_start=self.serial_time_start,
+                    serial_time_stop=self.serial_time_stop,
+                    serial_prune_n_electrons=self.serial_prune_n_electrons,
+                    serial_prune_frequency=self.serial_prune_frequency,
+                    pixel_bounce_list=cti.pixel_bounce_list,
+                    verbosity=self.verbosity,
+                )
+
+        try:
+            return aa.Array2D(
+                values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
+            )
+        except AttributeError:
+            return image_post_cti
+
+    def _use_window_from(self, preloads: Preloads) -> bool:
+        """
+        Returns whether `add_cti` uses windowed clocking, which requires the clocker's `window_from_mask` to be on,
+        the window to be in the `preloads` and the fast modes (which already reduce the image that is clocked) to be
+        off.
+
+        Parameters
+        ----------
+        preloads
+            Preloaded quantities, which may contain the rows and columns of the window.
+        """
+        return (
+            self.window_from_mask
+            and preloads.window_row_index_array is not None
+            and preloads.window_column_index_array is not None
+            and not self.parallel_fast_mode
+            and not self.serial_fast_mode
+            and not self.parallel_poisson_traps
+        )
+
+    def add_cti_windowed(
+        self,
+        data: aa.Array2D,
+        cti: CTI2D,
+        preloads: Preloads,
+    ) -> aa.Array2D:
+        """
+        Add CTI to a 2D dataset by passing only the pixels which influence the unmasked pixels of the data to the c++
+        arctic clocking algorithm.
+
+        Charge is clocked towards the readout (row 0 for parallel clocking, column 0 for serial clocking) and trails
+        away from it, therefore a pixel after clocking only depends on the pixels before it (closer to the readout)
+        in its column (parallel) or row (serial). The window clocked is therefore:
+
+        - Parallel clocking: every row up to the last row containing an unmasked pixel, which includes all rows
+          whose charge trails into the unmasked pixels. If traps are emptied between columns, only the columns
+          containing an unmasked pixel are clocked (unless serial clocking is performed, in which case every column
+          up to the last column containing an unmasked pixel is needed).
+
+        - Serial clocking: every column up to the last column containing an unmasked pixel and, if traps are emptied
+          between rows, only the rows containing an unmasked pixel.
+
+        For fits to small regions of a large image (e.g. the FPR and EPER of the first few charge injection
+        regions), this clocks far fewer pixels than the full image. All pixels of the post-CTI image outside the
+        window are zero.
+
+        If `parallel_express=0` / `serial_express=0` the unmasked pixels are identical to clocking the full image. For
+        other express values arctic computes the express matrix over the clocked window, such that the unmasked
+        pixels agree with clocking the full image to the accuracy of the express approximation. Rows are only cropped
+        for a standard `ROE` without a manual `parallel_window_stop`, because for other read-out electronics (e.g.
+        `ROEChargeInjection`) every pixel is transferred through the full column.
+
+        Parameters
+        ----------
+        data
+            The 2D data that is clocked via arctic and has CTI added to it.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
+        preloads
+            Contains the indexes of the rows and columns of the data which contain an unmasked pixel.
+        """
+        image_pre_cti = np.asarray(data.native_skip_mask)
+        image_post_cti = np.zeros(image_pre_cti.shape)
+
+        row_index_array = preloads.window_row_index_array
+        column_index_array = preloads.window_column_index_array
+
+        if row_index_array.shape[0] == 0 or column_index_array.shape[0] == 0:
+            try:
+                return aa.Array2D(
+                    values=image_post_cti,
+                    mask=data.mask,
+                    store_native=True,
+                    skip_mask=True,
+                )
+            except AttributeError:
+                return image_post_cti
+
+        try:
+            parallel_window_offset = data.readout_offsets[0]
+            serial_window_offset = data.readout_offsets[1]
+        except AttributeError:
+            parallel_window_offset = self.parallel_window_offset
+            serial_window_offset = self.serial_window_offset
+
+        use_parallel = cti.parallel_trap_list is not None
+        use_serial = (
+            cti.serial_trap_list is not None or cti.pixel_bounce_list is not None
+        )
+
+        if use_parallel and (
+            type(self.parallel_roe) is not ROE or self.parallel_window_stop != -1
+        ):
+            row_stop = image_pre_cti.shape[0]
+        else:
+            row_stop = int(row_index_array[-1]) + 1
+
+        if use_serial and (
+            type(self.serial_roe) is not ROE or self.serial_window_stop != -1
+        ):
+            window_column_index_array = np.arange(
+                image_pre_cti.shape[1], dtype=np.int32
+            )
+        elif use_serial or not self.parallel_roe.empty_traps_between_columns:
+            window_column_index_array = np.arange(
+                int(column_index_array[-1]) + 1, dtype=np.int32
+            )
+        else:
+            window_column_index_array = column_index_array
+
+        image = np.ascontiguousarray(
+            image_pre_cti[:row_stop, window_column_index_array], dtype="float"
+        )
+
+        if use_parallel:
+            image = np.asarray(
+                self._add_cti_parallel_from(
+                    image=image,
+                    cti=cti,
+                    parallel_window_offset=parallel_window_offset,
+                )
+            )
+
+        window_row_index_array = np.arange(row_stop, dtype=np.int32)
+
+        if use_serial:
+            if self.serial_roe.empty_traps_between_columns:
+                window_row_index_array = row_index_array
+                image = np.ascontiguousarray(image[window_row_index_array, :])
+
+            image = np.asarray(
+                self._add_cti_serial_from(
+                    image=image,
+                    cti=cti,
+                    serial_window_offset=serial_window_offset,
+                )
+            )
+
+        image_post_cti[np.ix_(window_row_index_array, window_column_index_array)] = (
+            image
+        )
+
+        try:
+            return aa.Array2D(
+                values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
+            )
+        except AttributeError:
+            return image_post_cti
+
+    def add_cti_batch(
+        self,
+        data: aa.Array2D,
+        cti_list: List[CTI2D],
+        preloads: Optional[Preloads] = Preloads(),
+    ) -> List[aa.Array2D]:
+        """
+        Add CTI to a 2D dataset for every CTI model in a list, for example the batch of models proposed at once
+        by a non-linear search which evaluates many points in parallel.
+
+        Quantities which depend only on the data are computed once for the whole batch: if a fast mode is on and the
+        indexes of the unique columns or rows of the data are not in the input `preloads`, they are computed once
+        and shared by every model (and the cache, if enabled, is shared by every model).
+
+        The models are clocked concurrently over a thread pool of `n_threads` threads, with each model clocked
+        via a single thread (the c++ arctic extension releases the GIL). The list of post-CTI images is returned in
+        the same order as `cti_list`, each identical to the output of `add_cti` for that model.
+
+        Parameters
+        ----------
+        data
+            The 2D data that is clocked via arctic and has CTI added to it.
+        cti_list
+            The CTI models, each of which represents the CTI properties of 2D clocking, including the trap species
+            which capture and release electrons and the volume-filling behaviour of the CCD.
+        preloads
+            Preloaded quantities (e.g. the indexes of unique columns used by the fast modes) which speed up clocking.
+        """
+        image_pre_cti = data.native_skip_mask
+
+        parallel_fast_index_array = preloads.parallel_fast_index_array
+        parallel_fast_inverse_array = preloads.parallel_fast_inverse_array
+
+        if self.parallel_fast_mode and parallel_fast_index_array is None:
+            (
+                parallel_fast_index_array,
+                parallel_fast_inverse_array,
+            ) = clocker_util.fast_index_array_and_inverse_from(
+                array=image_pre_cti, for_parallel=True
+            )
+
+        serial_fast_index_array = preloads.serial_fast_index_array
+        serial_fast_inverse_array = preloads.serial_fast_inverse_array
+
+        if self.serial_fast_mode and serial_fast_index_array is None:
+            (
+                serial_fast_index_array,
+                serial_fast_inverse_array,
+            ) = clocker_util.fast_index_array_and_inverse_from(
+                array=image_pre_cti, for_parallel=False
+            )
+
+        preloads = Preloads(
+            parallel_fast_index_array=parallel_fast_index_array,
+            parallel_fast_inverse_array=parallel_fast_inverse_array,
+            serial_fast_index_array=serial_fast_index_array,
+            serial_fast_inverse_array=serial_fast_inverse_array,
+            noise_normalization=preloads.noise_normalization,
+            window_row_index_array=preloads.window_row_index_array,
+            window_column_index_array=preloads.window_column_index_array,
+            data_fingerprint=preloads.data_fingerprint,
+        )
+
+        max_workers = min(self.n_threads, len(cti_list))
+
+        if max_workers <= 1:
+            return [
+                self.add_cti(data=data, cti=cti, preloads=preloads) for cti in cti_list
+            ]
+
+        clocker = copy.copy(self)
+        clocker.n_threads = 1
+
+        def add_cti_func(cti):
+            return clocker.add_cti(data=data, cti=cti, preloads=preloads)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(add_cti_func, cti_list))
+
+    def add_cti_stacked(
+        self,
+        data_list: List[aa.Array2D],
+        cti: CTI2D,
+        preloads_list: Optional[List[Preloads]] = None,
+    ) -> List[aa.Array2D]:
+        """
+        Add CTI to a list of 2D datasets using the same CTI model, for example the charge injection images taken at
+        different injection levels which are fitted simultaneously in a CTI calibration.
+
+        Parallel clocking of every column and serial clocking of every row are independent of one another, therefore
+        the columns of every dataset can be stacked side by side into a single image which is clocked via one call to
+        arctic, with the output split back into the post-CTI image of every dataset. This replaces a call to arctic
+        per dataset with one larger call, which is performed as follows:
+
+        1) The columns of every dataset are stacked into a single image and passed to arctic for parallel clocking. If
+           `parallel_fast_mode` is on only the unique columns of every dataset are stacked (as in
+           `add_cti_parallel_fast`), with the indexes of these columns taken from the `preloads` of every dataset.
+
+        2) The rows of every dataset after parallel clocking are stacked into a single image and passed to arctic for
+           serial clocking. If `serial_fast_mode` is on only the unique rows of every dataset are stacked.
+
+        3) The output of every call to arctic is split into the post-CTI image of every dataset.
+
+        As in `add_cti`, the clocker's window start and stop are only passed to arctic if both fast modes are off.
+
+        Stacking requires that all datasets have the same number of rows (for parallel clocking) and columns (for
+        serial clocking) and the same readout offsets, and that the read-out electronics empty traps between columns.
+        If any of these criteria are not met (or the `parallel_poisson_traps` are on) every dataset is instead clocked
+        separately via `add_cti`. The cache of the clocker is not used when datasets are stacked.
+
+        Parameters
+        ----------
+        data_list
+            The 2D datasets that are clocked via arctic and have CTI added to them.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
+        preloads_list
+            The preloaded quantities of every dataset (e.g. the indexes of unique columns used by the fast modes).
+        """
+        if preloads_list is None:
+            preloads_list = [Preloads()] * len(data_list)
+
+        image_pre_cti_list = [data.native_skip_mask for data in data_list]
+
+        window_offsets_list = []
+
+        for image_pre_cti in image_pre_cti_list:
+            try:
+                window_offsets_list.append(tuple(image_pre_cti.readout_offsets))
+            except AttributeError:
+                window_offsets_list.append(
+                    (self.parallel_window_offset, self.serial_window_offset)
+                )
+
+        image_pre_cti_list = [
+            np.asarray(image_pre_cti, dtype="float")
+            for image_pre_cti in image_pre_cti_list
+        ]
+
+        add_parallel = cti.parallel_trap_list is not None
+        add_serial = (
+            cti.serial_trap_list is not None or cti.pixel_bounce_list is not None
+        )
+
+        is_stackable = (
+            not self.parallel_poisson_traps
+            and (add_parallel or add_serial)
+            and len(set(window_offsets_list)) == 1
+            and (
+                not add_parallel
+                or (
+                    self.parallel_roe.empty_traps_between_columns
+                    and len({image.shape[0] for image in image_pre_cti_list}) == 1
+                )
+            )
+            and (
+                not add_serial
+                or (
+                    self.serial_roe.empty_traps_between_columns
+                    and len({image.shape[1] for image in image_pre_cti_list}) == 1
+                )
+            )
+        )
+
+        if not is_stackable:
+            return [
+                self.add_cti(data=data, cti=cti, preloads=preloads)
+                for data, preloads in zip(data_list, preloads_list)
+            ]
+
+        parallel_window_offset, serial_window_offset = window_offsets_list[0]
+
+        use_window = not self.parallel_fast_mode and not self.serial_fast_mode
+
+        image_post_cti_list = image_pre_cti_list
+
+        if add_parallel:
+            fast_index_list = []
+            fast_inverse_list = []
+
+            for image_pre_cti, preloads in zip(image_pre_cti_list, preloads_list):
+                if not self.parallel_fast_mode:
+                    fast_index_array = np.arange(image_pre_cti.shape[1])
+                    fast_inverse_array = fast_index_array
+                elif preloads.parallel_fast_index_array is None:
+                    (
+                        fast_index_array,
+                        fast_inverse_array,
+                    ) = clocker_util.fast_index_array_and_inverse_from(
+                        array=image_pre_cti, for_parallel=True
+                    )
+                else:
+                    fast_index_array = preloads.parallel_fast_index_array
+                    fast_inverse_array = preloads.parallel_fast_inverse_array
+
+                fast_index_list.append(fast_index_array)
+                fast_inverse_list.append(fast_inverse_array)
+
+            image_pre_cti_stack = np.ascontiguousarray(
+                np.concatenate(
+                    [
+                        image_pre_cti[:, fast_index_array]
+                        for image_pre_cti, fast_index_array in zip(
+                            image_pre_cti_list, fast_index_list
+                        )
+                    ],
+                    axis=1,
+                )
+            )
+
+            image_post_cti_stack = np.asarray(
+                self._add_cti_parallel_from(
+                    image=image_pre_cti_stack,
+                    cti=cti,
+                    parallel_window_offset=parallel_window_offset,
+                    use_window=use_window,
+                )
+            )
 
-        try:
-            parallel_window_offset = data.readout_offsets[0]
-            serial_window_offset = data.readout_offsets[1]
-        except AttributeError:
-            parallel_window_offset = self.parallel_window_offset
-            serial_window_offset = self.serial_window_offset
+            image_post_cti_list = [
+                image_post_cti_block[:, fast_inverse_array]
+                for image_post_cti_block, fast_inverse_array in zip(
+                    np.split(
+                        image_post_cti_stack,
+                        np.cumsum([len(index) for index in fast_index_list])[:-1],
+                        axis=1,
+                    ),
+                    fast_inverse_list,
+                )
+            ]
 
-        try:
-            image_post_cti = add_cti(
-                image=data,
-                parallel_ccd=parallel_ccd,
-                parallel_roe=self.parallel_roe,
-                parallel_traps=parallel_trap_list,
-                parallel_express=self.parallel_express,
-                parallel_window_offset=parallel_window_offset,
-                parallel_window_start=self.parallel_window_start,
-                parallel_window_stop=self.parallel_window_stop,
-                parallel_time_start=self.parallel_time_start,
-                parallel_time_stop=self.parallel_time_stop,
-                parallel_prune_n_electrons=self.parallel_prune_n_electrons,
-                parallel_prune_frequency=self.parallel_prune_frequency,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=serial_window_offset,
-                serial_window_start=self.serial_window_start,
-                serial_window_stop=self.serial_window_stop,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
-            )
-        except TypeError:
-            image_post_cti = add_cti(
-                image=data,
-                parallel_ccd=parallel_ccd,
-                parallel_roe=self.parallel_roe,
-                parallel_traps=parallel_trap_list,
-                parallel_express=self.parallel_express,
-                parallel_window_offset=parallel_window_offset,
-                parallel_window_start=self.parallel_window_start,
-                parallel_window_stop=self.parallel_window_stop,
-                parallel_time_start=self.parallel_time_start,
-                parallel_time_stop=self.parallel_time_stop,
-                parallel_prune_n_electrons=self.parallel_prune_n_electrons,
-                parallel_prune_frequency=self.parallel_prune_frequency,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=serial_window_offset,
-                serial_window_start=self.serial_window_start,
-                serial_window_stop=self.serial_window_stop,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
+        if add_serial:
+            fast_index_list = []
+            fast_inverse_list = []
+
+            for image_post_cti, preloads in zip(image_post_cti_list, preloads_list):
+                if not self.serial_fast_mode:
+                    fast_index_array = np.arange(image_post_cti.shape[0])
+                    fast_inverse_array = fast_index_array
+                elif add_parallel or preloads.serial_fast_index_array is None:
+                    (
+                        fast_index_array,
+                        fast_inverse_array,
+                    ) = clocker_util.fast_index_array_and_inverse_from(
+                        array=image_post_cti, for_parallel=False
+                    )
+                else:
+                    fast_index_array = preloads.serial_fast_index_array
+                    fast_inverse_array = preloads.serial_fast_inverse_array
+
+                fast_index_list.append(fast_index_array)
+                fast_inverse_list.append(fast_inverse_array)
+
+            image_pre_cti_stack = np.ascontiguousarray(
+                np.concatenate(
+                    [
+                        image_post_cti[fast_index_array, :]
+                        for image_post_cti, fast_index_array in zip(
+                            image_post_cti_list, fast_index_list
+                        )
+                    ],
+                    axis=0,
+                )
             )
 
-        try:
-            return aa.Array2D(
-                values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
+            image_post_cti_stack = np.asarray(
+                self._add_cti_serial_from(
+                    image=image_pre_cti_stack,
+                    cti=cti,
+                    serial_window_offset=serial_window_offset,
+                    use_window=use_window,
+                )
             )
-        except AttributeError:
-            return image_post_cti
+
+            image_post_cti_list = [
+                image_post_cti_block[fast_inverse_array, :]
+                for image_post_cti_block, fast_inverse_array in zip(
+                    np.split(
+                        image_post_cti_stack,
+                        np.cumsum([len(index) for index in fast_index_list])[:-1],
+                        axis=0,
+                    ),
+                    fast_inverse_list,
+                )
+            ]
+
+        post_cti_data_list = []
+
+        for data, image_post_cti in zip(data_list, image_post_cti_list):
+            try:
+                post_cti_data_list.append(
+                    aa.Array2D(
+                        values=image_post_cti,
+                        mask=data.mask,
+                        store_native=True,
+                        skip_mask=True,
+                    )
+                )
+            except AttributeError:
+                post_cti_data_list.append(image_post_cti)
+
+        return post_cti_data_list
 
     def add_cti_poisson_traps(
         self,
@@ -285,6 +1279,15 @@ class Clocker2D(AbstractClocker):
         clocking the density of traps in every column is drawn from a Poisson distribution to represent the stochastic
         nature of how many traps are in each column of a real CCD.
 
+        The densities of every column are drawn via `clocker_util.poisson_density_array_from`, which seeds every
+        column from a `np.random.SeedSequence` spawned from `poisson_seed`, and are stored in the attribute
+        `parallel_trap_column_list` as an array of shape (total_columns, total_trap_species).
+
+        Columns whose drawn densities are identical are grouped and clocked in a single arctic call (if the
+        read-out electronics empty traps between columns, such that every column is clocked independently). These
+        groups are clocked concurrently over `n_threads` threads. Because every column's densities depend only on
+        the seed and its column index, the output is identical irrespective of the number of threads.
+
         Parameters
         ----------
         data
@@ -304,29 +1307,55 @@ class Clocker2D(AbstractClocker):
         except AttributeError:
             parallel_window_offset = self.parallel_window_offset
 
-        image_pre_cti = data.native_skip_mask
+        image_pre_cti = np.asarray(data.native_skip_mask)
         image_post_cti = np.zeros(data.shape_native)
 
         total_rows = image_post_cti.shape[0]
         total_columns = image_post_cti.shape[1]
 
-        parallel_trap_column_list = []
+        self.parallel_trap_column_list = clocker_util.poisson_density_array_from(
+            density_list=[
+                parallel_trap.density for parallel_trap in parallel_trap_list
+            ],
+            total_pixels=total_rows,
+            total_columns=total_columns,
+            seed=self.poisson_seed,
+        )
+
+        if self.parallel_roe.empty_traps_between_columns:
+            _, density_inverse_array = np.unique(
+                self.parallel_trap_column_list, axis=0, return_inverse=True
+            )
+            density_inverse_array = density_inverse_array.reshape(-1)
 
-        for column in range(total_columns):
-            parallel_trap_poisson_list = [
-                parallel_trap.poisson_density_from(
-                    total_pixels=total_rows, seed=self.poisson_seed
+            column_array_list = [
+                np.asarray(column_list, dtype=np.int32)
+                for column_list in clocker_util.fast_stripe_lists_from(
+                    fast_inverse_array=density_inverse_array,
+                    total_unique=int(density_inverse_array.max()) + 1,
                 )
-                for parallel_trap in parallel_trap_list
             ]
+        else:
+            column_array_list = [
+                np.array([column], dtype=np.int32) for column in range(total_columns)
+            ]
+
+        def add_cti_func(column_array):
+            parallel_trap_poisson_list = []
 
-            parallel_trap_column_list.append(parallel_trap_poisson_list)
+            for parallel_trap, density in zip(
+                parallel_trap_list, self.parallel_trap_column_list[column_array[0]]
+            ):
+                parallel_trap_poisson = copy.copy(parallel_trap)
+                parallel_trap_poisson.density = float(density)
+                parallel_trap_poisson_list.append(parallel_trap_poisson)
 
-            image_pre_cti_pass = np.zeros(shape=(total_rows, 1))
-            image_pre_cti_pass[:, 0] = image_pre_cti[:, column]
+            image_pre_cti_pass = np.ascontiguousarray(
+                image_pre_cti[:, column_array], dtype="float"
+            )
 
             try:
-                image_post_cti[:, column] = add_cti(
+                return add_cti(
                     image=image_pre_cti_pass,
                     parallel_ccd=parallel_ccd,
                     parallel_roe=self.parallel_roe,
@@ -337,9 +1366,9 @@ class Clocker2D(AbstractClocker):
                     parallel_window_stop=self.parallel_window_stop,
                     allow_negative_pixels=self.allow_negative_pixels,
                     verbosity=self.verbosity,
-                )[:, 0]
+                )
             except TypeError:
-                image_post_cti[:, column] = add_cti(
+                return add_cti(
                     image=image_pre_cti_pass,
                     parallel_ccd=parallel_ccd,
                     parallel_roe=self.parallel_roe,
@@ -349,9 +1378,22 @@ class Clocker2D(AbstractClocker):
                     parallel_window_start=self.parallel_window_start,
                     parallel_window_stop=self.parallel_window_stop,
                     verbosity=self.verbosity,
-                )[:, 0]
+                )
+
+        max_workers = min(self.n_threads, len(column_array_list))
 
-        self.parallel_trap_column_list = parallel_trap_column_list
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                image_post_cti_group_list = list(
+                    executor.map(add_cti_func, column_array_list)
+                )
+        else:
+            image_post_cti_group_list = list(map(add_cti_func, column_array_list))
+
+        for column_array, image_post_cti_group in zip(
+            column_array_list, image_post_cti_group_list
+        ):
+            image_post_cti[:, column_array] = image_post_cti_group
 
         serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
 
@@ -418,54 +1460,31 @@ class Clocker2D(AbstractClocker):
         `add_cti_parallel_fast` and `add_cti_serial_fast` to create the extracted image that is passed to arctic and
         rebuild the final post CTI image.
 
+        Unique stripes are found in a single vectorized pass via the function
+        `clocker_util.fast_index_array_and_inverse_from`, where stripes are paired if every pixel differs by less
+        than 1e-8.
+
         Parameters
         ----------
         data
             The 1D data that is clocked via arctic and has CTI added to it.
+        for_parallel
+            If `True` unique columns are found (for parallel clocking), if `False` unique rows are found (for serial
+            clocking).
         """
 
-        if for_parallel:
-            total_stripes = data.shape[1]
-        else:
-            total_stripes = data.shape[0]
-
-        fast_index_list = []
-        fast_column_lists = []
-
-        unchecked_list = range(0, total_stripes)
-
-        for stripe_index in range(total_stripes):
-            paired = False
-
-            pair_list = []
-            unchecked_list_new = []
-
-            if stripe_index in unchecked_list:
-                for pair_index in unchecked_list:
-                    if for_parallel:
-                        residual_map = np.abs(
-                            data[:, stripe_index] - data[:, pair_index]
-                        )
-                    else:
-                        residual_map = np.abs(
-                            data[stripe_index, :] - data[pair_index, :]
-                        )
-
-                    if np.all(residual_map < 1.0e-8):
-                        if not paired:
-                            fast_index_list.append(stripe_index)
-
-                        paired = True
-
-                        pair_list.append(pair_index)
-
-                    else:
-                        unchecked_list_new.append(pair_index)
+        fast_index_array, fast_inverse_array = (
+            clocker_util.fast_index_array_and_inverse_from(
+                array=data, for_parallel=for_parallel
+            )
+        )
 
-                fast_column_lists.append(pair_list)
-                unchecked_list = unchecked_list_new
+        fast_column_lists = clocker_util.fast_stripe_lists_from(
+            fast_inverse_array=fast_inverse_array,
+            total_unique=fast_index_array.shape[0],
+        )
 
-        return fast_index_list, fast_column_lists
+        return fast_index_array.tolist(), fast_column_lists
 
     def add_cti_parallel_fast(
         self,
@@ -485,6 +1504,9 @@ class Clocker2D(AbstractClocker):
         extracting all identical columns, adding CTI via arcitc to only these columns and copying the output columns
         to construct the final post-cti image.
 
+        Extracting the unique columns and copying the output columns are each a single fancy-indexing operation,
+        using the index and inverse arrays of the `preloads`.
+
         Parameters
         ----------
         data
@@ -492,106 +1514,39 @@ class Clocker2D(AbstractClocker):
         cti
             An object which represents the CTI properties of 2D clocking, including the trap species which capture
             and release electrons and the volume-filling behaviour of the CCD for parallel clocking.
-        perform_checks
-            Check that it is value for the input data to use the fast clocking speed up (e.g. all columns are identical
-            and all entries outside this region are zero).
+        preloads
+            Contains the indexes of the unique columns in the data and the inverse array mapping them to every column
+            of the data, which if not preloaded are computed via `clocker_util.fast_index_array_and_inverse_from`.
         """
 
-        parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
-
         image_pre_cti = data.native_skip_mask
 
-        parallel_ccd = self.ccd_from(ccd_phase=parallel_ccd)
-
-        if preloads.parallel_fast_index_list is None:
-            fast_index_list, fast_column_lists = self.fast_indexes_from(
-                data=image_pre_cti, for_parallel=True
+        if preloads.parallel_fast_index_array is None:
+            (
+                fast_index_array,
+                fast_inverse_array,
+            ) = clocker_util.fast_index_array_and_inverse_from(
+                array=image_pre_cti, for_parallel=True
             )
         else:
-            fast_index_list = preloads.parallel_fast_index_list
-            fast_column_lists = preloads.parallel_fast_column_lists
-
-        image_pre_cti_pass = np.zeros(
-            shape=(data.shape_native[0], len(fast_index_list))
-        )
-        for i, fast_index in enumerate(fast_index_list):
-            image_pre_cti_pass[:, i] = image_pre_cti[:, fast_index]
-
-        try:
-            image_post_cti_pass = add_cti(
-                image=image_pre_cti_pass,
-                parallel_ccd=parallel_ccd,
-                parallel_roe=self.parallel_roe,
-                parallel_traps=parallel_trap_list,
-                parallel_express=self.parallel_express,
-                parallel_window_offset=self.parallel_window_offset,
-                parallel_time_start=self.parallel_time_start,
-                parallel_time_stop=self.parallel_time_stop,
-                parallel_prune_n_electrons=self.parallel_prune_n_electrons,
-                parallel_prune_frequency=self.parallel_prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                verbosity=self.verbosity,
-            )
-        except TypeError:
-            image_post_cti_pass = add_cti(
-                image=image_pre_cti_pass,
-                parallel_ccd=parallel_ccd,
-                parallel_roe=self.parallel_roe,
-                parallel_traps=parallel_trap_list,
-                parallel_express=self.parallel_express,
-                parallel_window_offset=self.parallel_window_offset,
-                parallel_time_start=self.parallel_time_start,
-                parallel_time_stop=self.parallel_time_stop,
-                parallel_prune_n_electrons=self.parallel_prune_n_electrons,
-                parallel_prune_frequency=self.parallel_prune_frequency,
-                verbosity=self.verbosity,
-            )
-
-        image_post_cti = np.zeros(shape=data.shape_native)
-
-        for i, fast_column_list in enumerate(fast_column_lists):
-            for fast_column in fast_column_list:
-                image_post_cti[:, fast_column] = image_post_cti_pass[:, i]
+            fast_index_array = preloads.parallel_fast_index_array
+            fast_inverse_array = preloads.parallel_fast_inverse_array
 
-        if cti.serial_trap_list is None:
-            return aa.Array2D(
-                values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
+        with self.profile_stage(name="fast_gather"):
+            image_pre_cti_pass = np.ascontiguousarray(
+                np.asarray(image_pre_cti)[:, fast_index_array], dtype="float"
             )
 
-        serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
+        image_post_cti_pass = self._add_cti_parallel_from(
+            image=image_pre_cti_pass, cti=cti, use_window=False
+        )
 
-        serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
+        with self.profile_stage(name="fast_scatter"):
+            image_post_cti = np.asarray(image_post_cti_pass)[:, fast_inverse_array]
 
-        try:
-            image_post_cti = add_cti(
-                image=image_post_cti,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=self.serial_window_offset,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
-            )
-        except TypeError:
-            image_post_cti = add_cti(
-                image=image_post_cti,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=self.serial_window_offset,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
+        if cti.serial_trap_list is not None:
+            image_post_cti = self._add_cti_serial_from(
+                image=image_post_cti, cti=cti, use_window=False
             )
 
         return aa.Array2D(
@@ -616,6 +1571,9 @@ class Clocker2D(AbstractClocker):
         only a single column to arcitc once and copying the output column the NumPy array to construct the final
         post-cti image.
 
+        Extracting the unique rows and copying the output rows are each a single fancy-indexing operation,
+        using the index and inverse arrays of the `preloads`.
+
         This only works for serial CTI when parallel CTI is omitted.
 
         By default, checks are performed which ensure that the input data fits the criteria for this speed up.
@@ -627,68 +1585,136 @@ class Clocker2D(AbstractClocker):
         cti
             An object which represents the CTI properties of 2D clocking, including the trap species which capture
             and release electrons and the volume-filling behaviour of the CCD for serial clocking.
-        perform_checks
-            Check that it is value for the input data to use the fast clocking speed up (e.g. all columns are identical
-            and all entries outside this region are zero).
+        preloads
+            Contains the indexes of the unique rows in the data and the inverse array mapping them to every row
+            of the data, which if not preloaded are computed via `clocker_util.fast_index_array_and_inverse_from`.
         """
 
-        serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
-
         image_pre_cti = data.native_skip_mask
 
-        serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
+        if preloads.serial_fast_index_array is None:
+            (
+                fast_index_array,
+                fast_inverse_array,
+            ) = clocker_util.fast_index_array_and_inverse_from(
+                array=image_pre_cti, for_parallel=False
+            )
+        else:
+            fast_index_array = preloads.serial_fast_index_array
+            fast_inverse_array = preloads.serial_fast_inverse_array
+
+        with self.profile_stage(name="fast_gather"):
+            image_pre_cti_pass = np.ascontiguousarray(
+                np.asarray(image_pre_cti)[fast_index_array, :], dtype="float"
+            )
+
+        image_post_cti_pass = self._add_cti_serial_from(
+            image=image_pre_cti_pass, cti=cti, use_window=False
+        )
+
+        with self.profile_stage(name="fast_scatter"):
+            image_post_cti = np.asarray(image_post_cti_pass)[fast_inverse_array, :]
+
+        return aa.Array2D(
+            values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
+        )
+
+    def add_cti_parallel_serial_fast(
+        self,
+        data: aa.Array2D,
+        cti: CTI2D,
+        preloads: Preloads = Preloads(),
+    ):
+        """
+        Add CTI to a 2D dataset by passing it to the c++ arctic clocking algorithm, using both the parallel and serial
+        fast modes.
+
+        Clocking is performed towards the readout register and electronics, with parallel CTI added first followed
+        by serial CTI. Parallel CTI is added and the post-CTI image (therefore including trailing after parallel
+        clocking) is used to perform serial clocking and add serial CTI.
+
+        This is performed in two stages:
+
+        1) All identical columns of the data are extracted and only these columns are passed to arctic for parallel
+           clocking (as in `add_cti_parallel_fast`).
+
+        2) The rows of the reduced parallel arctic output are inspected and all identical rows are extracted, mapped
+           over every column of the data and only these rows are passed to arctic for serial clocking. The output rows
+           are then copied to construct the final post-cti image.
+
+        For uniform charge injection imaging many rows after parallel clocking are identical (e.g. the rows before
+        the first charge injection and the rows of the charge injection region once traps are filled), therefore
+        this avoids serial clocking thousands of identical rows.
+
+        The rows that are identical after parallel clocking depend on the parallel CTI model, therefore the row
+        mapping is computed from the reduced parallel arctic output every time this function is called, which is
+        inexpensive because it only contains the unique columns. If the CTI model has no parallel traps the
+        parallel output is the input data, in which case the row mapping of the data in the `preloads` is used.
+
+        Parameters
+        ----------
+        data
+            The 1D data that is clocked via arctic and has CTI added to it.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
+        preloads
+            Contains the indexes of the unique columns and rows in the data and the inverse arrays mapping them to
+            every column and row of the data, which if not preloaded are computed via
+            `clocker_util.fast_index_array_and_inverse_from`.
+        """
+        if cti.parallel_trap_list is None:
+            return self.add_cti_serial_fast(data=data, cti=cti, preloads=preloads)
+
+        if cti.serial_trap_list is None:
+            return self.add_cti_parallel_fast(data=data, cti=cti, preloads=preloads)
+
+        image_pre_cti = data.native_skip_mask
 
-        if preloads.serial_fast_index_list is None:
-            fast_index_list, fast_row_lists = self.fast_indexes_from(
-                data=image_pre_cti, for_parallel=False
+        if preloads.parallel_fast_index_array is None:
+            (
+                fast_column_index_array,
+                fast_column_inverse_array,
+            ) = clocker_util.fast_index_array_and_inverse_from(
+                array=image_pre_cti, for_parallel=True
             )
         else:
-            fast_index_list = preloads.serial_fast_index_list
-            fast_row_lists = preloads.serial_fast_row_lists
+            fast_column_index_array = preloads.parallel_fast_index_array
+            fast_column_inverse_array = preloads.parallel_fast_inverse_array
+
+        with self.profile_stage(name="fast_gather"):
+            image_pre_cti_pass = np.ascontiguousarray(
+                np.asarray(image_pre_cti)[:, fast_column_index_array], dtype="float"
+            )
 
-        image_pre_cti_pass = np.zeros(
-            shape=(len(fast_index_list), data.shape_native[1])
+        image_post_cti_pass = np.asarray(
+            self._add_cti_parallel_from(
+                image=image_pre_cti_pass, cti=cti, use_window=False
+            )
         )
-        for i, fast_index in enumerate(fast_index_list):
-            image_pre_cti_pass[i, :] = image_pre_cti[fast_index, :]
 
-        try:
-            image_post_cti_pass = add_cti(
-                image=image_pre_cti_pass,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=self.serial_window_offset,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
+        with self.profile_stage(name="fast_gather"):
+            (
+                fast_row_index_array,
+                fast_row_inverse_array,
+            ) = clocker_util.fast_index_array_and_inverse_from(
+                array=image_post_cti_pass, for_parallel=False
             )
-        except TypeError:
-            image_post_cti_pass = add_cti(
-                image=image_pre_cti_pass,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=self.serial_window_offset,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
+
+            image_serial_pre_cti_pass = np.ascontiguousarray(
+                image_post_cti_pass[fast_row_index_array, :][
+                    :, fast_column_inverse_array
+                ]
             )
 
-        image_post_cti = np.zeros(shape=data.shape_native)
+        image_serial_post_cti_pass = self._add_cti_serial_from(
+            image=image_serial_pre_cti_pass, cti=cti, use_window=False
+        )
 
-        for i, fast_row_list in enumerate(fast_row_lists):
-            for fast_row in fast_row_list:
-                image_post_cti[fast_row, :] = image_post_cti_pass[i, :]
+        with self.profile_stage(name="fast_scatter"):
+            image_post_cti = np.asarray(image_serial_post_cti_pass)[
+                fast_row_inverse_array, :
+            ]
 
         return aa.Array2D(
             values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
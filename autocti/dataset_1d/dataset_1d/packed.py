@@ -0,0 +1,192 @@
+import numpy as np
+from typing import List, Optional
+
+from autocti.dataset_1d.dataset_1d.dataset_1d import Dataset1D
+
+
+class Dataset1DPacked:
+    def __init__(
+        self,
+        data: np.ndarray,
+        noise_map: np.ndarray,
+        offset_array: np.ndarray,
+        row_start_array: np.ndarray,
+        flux_array: np.ndarray,
+        size: int,
+        mask: Optional[np.ndarray] = None,
+    ):
+        """
+        Many 1D CTI datasets (e.g. thousands of warm pixel lines) packed into contiguous buffers, storing only the
+        pixels of every line which are fitted (e.g. the warm pixel and its trail) instead of a full-length `Array1D`
+        padded with zeros to the size of the CCD per line.
+
+        The data of every line is stored in a single 1D buffer, where the pixels of line `i` are
+        `data[offset_array[i]:offset_array[i + 1]]` and correspond to the rows `row_start_array[i]` onwards of a full
+        column of the CCD. The pre-CTI data of every line is a single pixel of charge `flux_array[i]` at row
+        `row_start_array[i]` (e.g. the flux of the warm pixel before CTI), with all other pixels zero.
+
+        Every line is clocked by arctic as one column of a single 2D image (see `pre_cti_image_2d_from` and
+        `AnalysisDataset1DPacked`), and the model data of every pixel in the buffer is gathered from the post-CTI
+        image via `row_index_array` and `column_index_array`.
+
+        Parameters
+        ----------
+        data
+            The data of every line, packed into a single 1D buffer.
+        noise_map
+            The noise-map of every line, packed into a single 1D buffer.
+        offset_array
+            The index of the first pixel of every line in the buffers, with a final entry which is the total number
+            of pixels (such that it has one more entry than the number of lines).
+        row_start_array
+            The row of the CCD (distance from the readout) of the first pixel of every line.
+        flux_array
+            The charge of every line before CTI, which is located at the row of its first pixel.
+        size
+            The size of the CCD, that is the number of pixels in the parallel direction.
+        mask
+            The mask of the buffers, where `True` entries are not fitted. If not input every pixel is fitted.
+        """
+        self.data = np.asarray(data, dtype="float")
+        self.noise_map = np.asarray(noise_map, dtype="float")
+        self.offset_array = np.asarray(offset_array, dtype="int")
+        self.row_start_array = np.asarray(row_start_array, dtype="int")
+        self.flux_array = np.asarray(flux_array, dtype="float")
+        self.size = size
+
+        if mask is None:
+            mask = np.full(shape=self.data.shape, fill_value=False)
+
+        self.mask = np.asarray(mask, dtype="bool")
+
+        line_length_array = np.diff(self.offset_array)
+
+        self.column_index_array = np.repeat(
+            np.arange(self.total_lines), line_length_array
+        )
+        self.row_index_array = (
+            np.arange(self.data.shape[0])
+            - np.repeat(self.offset_array[:-1], line_length_array)
+            + np.repeat(self.row_start_array, line_length_array)
+        )
+
+    @classmethod
+    def from_pixel_line_dict_list(
+        cls, pixel_line_dict_list: List[dict], size: int
+    ) -> "Dataset1DPacked":
+        """
+        Pack a list of pixel lines output from the warm-pixels script, each of which has the format described in
+        `Dataset1D.from_pixel_line_dict`.
+
+        Parameters
+        ----------
+        pixel_line_dict_list
+            The dictionaries describing every pixel line.
+        size
+            The size of the CCD, that is the number of pixels in the parallel direction.
+        """
+        line_length_list = [
+            len(pixel_line_dict["data"]) for pixel_line_dict in pixel_line_dict_list
+        ]
+
+        offset_array = np.zeros(len(pixel_line_dict_list) + 1, dtype="int")
+        offset_array[1:] = np.cumsum(line_length_list)
+
+        return Dataset1DPacked(
+            data=np.concatenate(
+                [
+                    np.asarray(pixel_line_dict["data"], dtype="float")
+                    for pixel_line_dict in pixel_line_dict_list
+                ]
+            ),
+            noise_map=np.concatenate(
+                [
+                    np.asarray(pixel_line_dict["noise"], dtype="float")
+                    for pixel_line_dict in pixel_line_dict_list
+                ]
+            ),
+            offset_array=offset_array,
+            row_start_array=np.array(
+                [
+                    int(pixel_line_dict["location"][0])
+                    for pixel_line_dict in pixel_line_dict_list
+                ]
+            ),
+            flux_array=np.array(
+                [
+                    float(pixel_line_dict["flux"])
+                    for pixel_line_dict in pixel_line_dict_list
+                ]
+            ),
+            size=size,
+        )
+
+    @property
+    def total_lines(self) -> int:
+        return self.offset_array.shape[0] - 1
+
+    @property
+    def row_stop(self) -> int:
+        """
+        The row after the last pixel of every line, such that only the rows before it affect the model data of the
+        lines when they are clocked.
+        """
+        return int(np.max(self.row_index_array, initial=-1)) + 1
+
+    def pre_cti_image_2d_from(self, total_rows: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the pre-CTI data of every line as the columns of a 2D image of shape (total_rows, total_lines),
+        which is passed to arctic to clock every line via a single call.
+
+        Charge is clocked towards row 0 and trails away from it, therefore the model data of every line only depends
+        on the rows before its last pixel. By default the image therefore only contains the rows up to `row_stop`,
+        which for lines near the readout is far fewer than the `size` of the CCD.
+
+        Parameters
+        ----------
+        total_rows
+            The number of rows of the image, which if not input is `row_stop`.
+        """
+        if total_rows is None:
+            total_rows = self.row_stop
+
+        image = np.zeros(shape=(total_rows, self.total_lines))
+        image[self.row_start_array, np.arange(self.total_lines)] = self.flux_array
+
+        return image
+
+    def model_data_from(self, image_post_cti: np.ndarray) -> np.ndarray:
+        """
+        Returns the model data of every line packed into a buffer with the same layout as the `data`, by gathering
+        the pixels of every line from the columns of the post-CTI image output by arctic.
+
+        Parameters
+        ----------
+        image_post_cti
+            The post-CTI image whose columns are the clocked lines.
+        """
+        return np.asarray(image_post_cti)[self.row_index_array, self.column_index_array]
+
+    def dataset_1d_from(self, index: int) -> Dataset1D:
+        """
+        Returns a line of the packed dataset as a `Dataset1D` padded with zeros to the `size` of the CCD, which is
+        identical to loading the line via `Dataset1D.from_pixel_line_dict` (e.g. for visualization).
+
+        Parameters
+        ----------
+        index
+            The index of the line which is returned.
+        """
+        row_start = int(self.row_start_array[index])
+
+        pixel_slice = slice(self.offset_array[index], self.offset_array[index + 1])
+
+        return Dataset1D.from_pixel_line_dict(
+            pixel_line_dict={
+                "location": [row_start, 0],
+                "flux": self.flux_array[index],
+                "data": self.data[pixel_slice],
+                "noise": self.noise_map[pixel_slice],
+            },
+            size=self.size,
+        )
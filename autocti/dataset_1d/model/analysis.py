@@ -9,6 +9,8 @@ from autocti.dataset_1d.fit import FitDataset1D
 from autocti.dataset_1d.model.visualizer import VisualizerDataset1D
 from autocti.dataset_1d.model.result import ResultDataset1D
 from autocti.model.analysis import AnalysisCTI
+from autocti.model.pre_check import PreCheckPipeline
+from autocti.model.profiler import LikelihoodProfiler
 from autocti.model.settings import SettingsCTI1D
 from autocti.clocker.one_d import Clocker1D
 
@@ -23,6 +25,8 @@ class AnalysisDataset1D(AnalysisCTI):
         clocker: Clocker1D,
         settings_cti: SettingsCTI1D = SettingsCTI1D(),
         dataset_full: Optional[Dataset1D] = None,
+        profiler: Optional[LikelihoodProfiler] = None,
+        pre_check: Optional[PreCheckPipeline] = None,
     ):
         """
         Fits a CTI model to a 1D CTI dataset via a non-linear search.
@@ -47,12 +51,20 @@ class AnalysisDataset1D(AnalysisCTI):
         dataset_full
             The full dataset, which is visualized separate from the `dataset` that is fitted, which for example may
             not have the FPR masked and thus enable visualization of the FPR.
+        profiler
+            If input, the run time of every stage of the log likelihood function is recorded and output to the
+            `files` folder of the search when the model-fit finishes (see `LikelihoodProfiler`).
+        pre_check
+            If input, inexpensive checks of the physical plausibility of every CTI model which reject non-physical
+            models before they are clocked via arctic (see `PreCheckPipeline`).
         """
         super().__init__(
             dataset=dataset,
             clocker=clocker,
             settings_cti=settings_cti,
             dataset_full=dataset_full,
+            profiler=profiler,
+            pre_check=pre_check,
         )
 
     def region_list_from(self) -> List:
@@ -96,11 +108,18 @@ class AnalysisDataset1D(AnalysisCTI):
             How fit the model is and the model
         """
 
-        self.settings_cti.check_total_density_within_range(traps=instance.cti.trap_list)
+        with self.profile_call():
+            with self.profile_stage(name="density_check"):
+                self.settings_cti.check_total_density_within_range(
+                    traps=instance.cti.trap_list
+                )
 
-        fit = self.fit_via_instance_from(instance=instance)
+            self.pre_check_instance(instance=instance)
 
-        return fit.log_likelihood
+            fit = self.fit_via_instance_from(instance=instance)
+
+            with self.profile_stage(name="chi_squared"):
+                return fit.log_likelihood
 
     def fit_via_instance_and_dataset_from(
         self, instance: af.ModelInstance, dataset: Dataset1D
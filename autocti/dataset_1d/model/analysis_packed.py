@@ -0,0 +1,165 @@
+import numpy as np
+from typing import Optional
+
+from arcticpy import ROE
+
+import autofit as af
+
+from autocti import exc
+from autocti.clocker.one_d import Clocker1D
+from autocti.dataset_1d.dataset_1d.packed import Dataset1DPacked
+from autocti.model.analysis import AnalysisCTI
+from autocti.model.pre_check import PreCheckPipeline
+from autocti.model.profiler import LikelihoodProfiler
+from autocti.model.settings import SettingsCTI1D
+
+
+class AnalysisDataset1DPacked(AnalysisCTI):
+    def __init__(
+        self,
+        dataset: Dataset1DPacked,
+        clocker: Clocker1D,
+        settings_cti: SettingsCTI1D = SettingsCTI1D(),
+        profiler: Optional[LikelihoodProfiler] = None,
+        pre_check: Optional[PreCheckPipeline] = None,
+    ):
+        """
+        Fits a CTI model to many 1D CTI datasets (e.g. thousands of warm pixel lines) simultaneously via a non-linear
+        search, where the log likelihood is the sum of the log likelihoods of every line.
+
+        Fitting every line via its own `AnalysisDataset1D` (e.g. summing the analyses) calls arctic once per line and
+        creates a `FitDataset1D` of the full size of the CCD per line, even though every line only has a handful of
+        pixels which are fitted. This analysis instead stores the lines in a `Dataset1DPacked`, and the log
+        likelihood function:
+
+        1) Creates the pre-CTI data of every line as the columns of a single 2D image.
+        2) Clocks every line via a single call to arctic (see `Clocker1D.add_cti_columns`).
+        3) Gathers the model data of every line from the post-CTI image into a buffer with the same layout as the
+           packed data.
+        4) Computes the chi-squared of the buffer, with the noise normalization computed once when the analysis is
+           created because the noise-map does not change during the model-fit.
+
+        The log likelihood is identical to the sum of the log likelihoods of fitting every line via an
+        `AnalysisDataset1D`, where every pixel outside the line (which has no data) is masked.
+
+        Charge is clocked towards row 0 and trails away from it, therefore the model data of every line only depends
+        on the rows before its last pixel and the image only contains these rows (see
+        `Dataset1DPacked.pre_cti_image_2d_from`). The number of rows sets the express matrix of arctic, therefore
+        for a clocker with `express > 0`, a window or time window, or a read-out electronics other than the `ROE`,
+        the image instead has every row of the CCD such that the clocking is unchanged.
+
+        The trap density check, `pre_check` pipeline and `profiler` behave as in every `AnalysisCTI`. Visualization
+        and outputting the dataset to hard-disk are not performed by this analysis, where the lines of a fit can be
+        inspected via `Dataset1DPacked.dataset_1d_from` and an `AnalysisDataset1D`.
+
+        Parameters
+        ----------
+        dataset
+            The packed 1D CTI datasets that the model is fitted to.
+        clocker
+            The CTI arctic clocker used by the non-linear search and model-fit.
+        settings_cti
+            The settings controlling aspects of the CTI model in this model-fit.
+        profiler
+            If input, the run time of every stage of the log likelihood function is recorded and output to the
+            `files` folder of the search when the model-fit finishes (see `LikelihoodProfiler`).
+        pre_check
+            If input, inexpensive checks of the physical plausibility of every CTI model which reject non-physical
+            models before they are clocked via arctic (see `PreCheckPipeline`).
+        """
+        super().__init__(
+            dataset=dataset,
+            clocker=clocker,
+            settings_cti=settings_cti,
+            profiler=profiler,
+            pre_check=pre_check,
+        )
+
+        self.unmasked = ~dataset.mask
+
+        self.data_unmasked = dataset.data[self.unmasked]
+        self.inverse_noise_map_unmasked = 1.0 / dataset.noise_map[self.unmasked]
+
+        self.noise_normalization = float(
+            np.sum(np.log(2 * np.pi * dataset.noise_map[self.unmasked] ** 2.0))
+        )
+
+        self.total_rows = self.total_rows_from(dataset=dataset, clocker=clocker)
+
+    @staticmethod
+    def total_rows_from(dataset: Dataset1DPacked, clocker: Clocker1D) -> int:
+        """
+        Returns the number of rows of the image the lines are clocked in, which is `row_stop` of the dataset if
+        removing the rows after the last pixel of every line does not change the clocking and the `size` of the CCD
+        otherwise.
+
+        An exception is raised if a line extends beyond the `size` of the CCD, as its pixels are not in the image.
+
+        Parameters
+        ----------
+        dataset
+            The packed 1D CTI datasets that the model is fitted to.
+        clocker
+            The CTI arctic clocker used by the non-linear search and model-fit.
+        """
+        if dataset.row_stop > dataset.size:
+            raise exc.DatasetException(
+                f"A line of the packed dataset extends to row {dataset.row_stop - 1}, beyond the size of the CCD "
+                f"({dataset.size} rows)."
+            )
+
+        if (
+            clocker.express == 0
+            and clocker.window_stop == -1
+            and clocker.time_stop == -1
+            and type(clocker.roe) is ROE
+        ):
+            return dataset.row_stop
+
+        return dataset.size
+
+    def post_cti_data_from(self, instance: af.ModelInstance) -> np.ndarray:
+        """
+        Returns the model data of every line for a model instance, packed into a buffer with the same layout as the
+        `data` of the dataset.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model, which includes the CTI model that is fitted to every line.
+        """
+        image_post_cti = self.clocker.add_cti_columns(
+            image=self.dataset.pre_cti_image_2d_from(total_rows=self.total_rows),
+            cti=instance.cti,
+        )
+
+        return self.dataset.model_data_from(image_post_cti=image_post_cti)
+
+    def log_likelihood_function(self, instance: af.ModelInstance) -> float:
+        """
+        Returns the summed log likelihood of the fit of a model instance to every line, where every line is clocked
+        via a single call to arctic.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model, which includes the CTI model that is fitted to every line.
+        """
+        with self.profile_call():
+            with self.profile_stage(name="density_check"):
+                self.settings_cti.check_total_density_within_range(
+                    traps=instance.cti.trap_list
+                )
+
+            self.pre_check_instance(instance=instance)
+
+            model_data = self.post_cti_data_from(instance=instance)
+
+            with self.profile_stage(name="chi_squared"):
+                chi_array = (
+                    self.data_unmasked - model_data[self.unmasked]
+                ) * self.inverse_noise_map_unmasked
+
+                return -0.5 * (
+                    float(np.dot(chi_array, chi_array)) + self.noise_normalization
+                )
@@ -30,6 +30,10 @@ class FittingException(Exception):
     pass
 
 
+class AnalysisException(Exception):
+    pass
+
+
 class PriorException(FitException):
     pass
 
@@ -6,6 +6,8 @@ import autoarray as aa
 from autocti.charge_injection.imaging.imaging import ImagingCI
 from autocti.dataset_1d.dataset_1d.dataset_1d import Dataset1D
 from autocti.extract.settings import SettingsExtract
+from autocti.extract.two_d.plan import ExtractPlan2D
+from autocti.extract.two_d.plan import extract_plan_2d_from
 from autocti.layout.one_d import Layout1D
 from autocti.mask.mask_2d import Mask2D
 
@@ -114,6 +116,28 @@ class Extract2D:
     def region_list_from(self, settings: SettingsExtract) -> List[aa.Region2D]:
         raise NotImplementedError
 
+    def plan_from(self, array: aa.Array2D, settings: SettingsExtract) -> ExtractPlan2D:
+        """
+        Returns the extraction plan of the regions of this `Extract` object for the input settings, which stores
+        the indexes of every pixel of every region in the native array such that all regions are extracted from an
+        array via a single `take`.
+
+        Plans are cached for every combination of layout, `Extract` class, settings and array shape (see
+        `extract_plan_2d_from`), such that the stacking and binning functions below reuse them over every array
+        they are called on (e.g. the data, noise-map and residuals of every fit that is visualized).
+
+        Parameters
+        ----------
+        array
+            The 2D array the regions are extracted from, whose native shape the plan is computed for.
+        settings
+           The settings used to extract the region (e.g. the EPERs), which for example include the `pixels`
+           tuple specifying the range of pixel columns they are extracted between.
+        """
+        return extract_plan_2d_from(
+            extract=self, settings=settings, shape_native=array.shape_native
+        )
+
     @property
     def anti_region_list(self) -> List[aa.Region2D]:
         """
@@ -245,6 +269,10 @@ class Extract2D:
         For fits to charge injection data this function is also used to create images like the stacked 2D residuals,
         which therefore quantify the goodness-of-fit of a CTI model.
 
+        The regions are cropped by the settings in the same way as `array_2d_list_from`, therefore if
+        `force_same_row_size` is True regions with different numbers of rows are cropped to the smallest number of
+        rows and stacked, whereas otherwise they cannot be stacked and an `ExtractException` is raised.
+
         Parameters
         ----------
         array
@@ -254,29 +282,17 @@ class Extract2D:
            The settings used to extract the serial region (e.g. the EPERs), which for example include the `pixels`
            tuple specifying the range of pixel columns they are extracted between.
         """
+        plan = self.plan_from(array=array, settings=settings)
 
-        arr_list = np.asarray(
-            [
-                np.array(array.native[region.slice])
-                for region in self.region_list_from(settings=settings)
-            ]
-        )
-
-        mask_2d_list = [
-            array.mask[region.slice]
-            for region in self.region_list_from(settings=settings)
-        ]
+        mask_stack = plan.mask_from(array=array)
 
         stacked_array_2d = np.mean(
-            arr_list, axis=0, where=np.invert(np.asarray(mask_2d_list))
+            plan.values_from(array=array), axis=0, where=np.invert(mask_stack)
         )
 
         return aa.Array2D(
-            values=np.asarray(stacked_array_2d.data),
-            mask=Mask2D(
-                sum(mask_2d_list) == len(mask_2d_list),
-                pixel_scales=array.pixel_scale,
-            ),
+            values=stacked_array_2d,
+            mask=Mask2D(np.all(mask_stack, axis=0), pixel_scales=array.pixel_scale),
         ).native
 
     def stacked_array_2d_total_pixels_from(
@@ -289,6 +305,8 @@ class Extract2D:
         If the data being stacked is a noise-map, we need to know how many pixels were used in the stacking of every
         final pixel on the stacked 2d array in order to compute the new noise map via quadrature.
 
+        The regions are cropped by the settings in the same way as `stacked_array_2d_from`.
+
         Parameters
         ----------
         array
@@ -298,19 +316,13 @@ class Extract2D:
            The settings used to extract the serial region (e.g. the EPERs), which for example include the `pixels`
            tuple specifying the range of pixel columns they are extracted between.
         """
-
-        mask_2d_list = [
-            array.mask[region.slice]
-            for region in self.region_list_from(settings=settings)
-        ]
-
-        arr_total_pixels = sum([np.invert(mask_2d) for mask_2d in mask_2d_list])
+        mask_stack = self.plan_from(array=array, settings=settings).mask_from(
+            array=array
+        )
 
         return aa.Array2D(
-            values=np.asarray(arr_total_pixels),
-            mask=Mask2D(
-                sum(mask_2d_list) == len(mask_2d_list), pixel_scales=array.pixel_scale
-            ),
+            values=np.sum(np.invert(mask_stack), axis=0),
+            mask=Mask2D(np.all(mask_stack, axis=0), pixel_scales=array.pixel_scale),
         ).native
 
     def binned_array_1d_from(
@@ -338,15 +350,13 @@ class Extract2D:
            The settings used to extract the serial region (e.g. the EPERs), which for example include the `pixels`
            tuple specifying the range of pixel columns they are extracted between.
         """
+        plan = self.plan_from(array=array, settings=settings)
 
-        region_list = self.region_list_from(settings=settings)
-        region_list = settings.region_list_from(region_list=region_list)
-
-        arr_list = np.asarray([array.native[region.slice] for region in region_list])
-
-        mask_list = np.asarray([array.mask[region.slice] for region in region_list])
-
-        stacked_array_2d = np.mean(arr_list, axis=0, where=np.invert(mask_list))
+        stacked_array_2d = np.mean(
+            plan.values_from(array=array),
+            axis=0,
+            where=np.invert(plan.mask_from(array=array)),
+        )
 
         binned_array_1d = np.mean(
             stacked_array_2d,
@@ -378,22 +388,123 @@ class Extract2D:
            The settings used to extract the serial region (e.g. the EPERs), which for example include the `pixels`
            tuple specifying the range of pixel columns they are extracted between.
         """
-
-        mask_2d_list = [
-            array.mask[region.slice]
-            for region in self.region_list_from(settings=settings)
-        ]
-
-        arr_total_pixels = sum([np.invert(mask_2d) for mask_2d in mask_2d_list])
+        mask_stack = self.plan_from(array=array, settings=settings).mask_from(
+            array=array
+        )
 
         binned_total_pixels = np.sum(
-            np.asarray(arr_total_pixels), axis=self.binning_axis
+            np.sum(np.invert(mask_stack), axis=0), axis=self.binning_axis
         )
 
         return aa.Array1D.no_mask(
             values=binned_total_pixels, pixel_scales=array.pixel_scale
         )
 
+    def binned_array_1d_list_from(
+        self, array_list: List[aa.Array2D], settings_list: List[SettingsExtract]
+    ) -> List[Tuple[List[aa.Array1D], List[aa.Array1D], List[aa.Array1D]]]:
+        """
+        Extract, stack and bin multiple aligned arrays (e.g. the data, noise-map and pre-CTI data of a dataset) for
+        multiple settings (e.g. different windows of the FPRs or EPERs) in a single pass, returning for every
+        settings the following binned 1D products of every array:
+
+        - The binned 1D array, identical to `binned_array_1d_from`.
+        - The binned 1D total pixels, identical to `binned_array_1d_total_pixels_from`.
+        - The binned 1D quadrature sum, which for a noise-map is the noise of the binned 1D array propagated in
+          quadrature: the noise of every stacked pixel is the square root of the sum of the squared noise of its
+          unmasked pixels divided by their number, and the noise of every binned pixel is the square root of the sum
+          of the squared noise of its stacked pixels divided by their number.
+
+        Every array is flattened once and the regions of all arrays are extracted via a single gather of the
+        extraction plan of each settings (see `plan_from`), after which all arrays are stacked and binned together.
+        Every array is stacked over the unmasked pixels of its own mask, as in `binned_array_1d_from`.
+
+        Parameters
+        ----------
+        array_list
+            The 2D arrays which are extracted, stacked and binned, which have the same shape as one another.
+        settings_list
+            The settings used to extract the regions (e.g. the EPERs), where the arrays are binned separately for
+            every settings.
+
+        Returns
+        -------
+        For every settings, a tuple containing the list of the binned 1D arrays, the list of the binned 1D total
+        pixels and the list of the binned 1D quadrature sums (each in the same order as `array_list`).
+        """
+        pixel_scales = array_list[0].pixel_scale
+
+        values = np.stack(
+            [
+                np.asarray(array.native, dtype="float").reshape(-1)
+                for array in array_list
+            ]
+        )
+        unmasked = np.invert(
+            np.stack(
+                [
+                    np.asarray(array.mask, dtype="bool").reshape(-1)
+                    for array in array_list
+                ]
+            )
+        )
+
+        axis = self.binning_axis + 1
+
+        def array_1d_list_from(arrays_1d: np.ndarray) -> List[aa.Array1D]:
+            return [
+                aa.Array1D.no_mask(values=array_1d, pixel_scales=pixel_scales)
+                for array_1d in arrays_1d
+            ]
+
+        binned_list = []
+
+        for settings in settings_list:
+            index_array = self.plan_from(
+                array=array_list[0], settings=settings
+            ).index_array
+
+            values_stack = values[:, index_array]
+            unmasked_stack = unmasked[:, index_array]
+
+            stacked_total_pixels = np.sum(unmasked_stack, axis=1)
+
+            stacked_arrays_2d = np.mean(values_stack, axis=1, where=unmasked_stack)
+
+            stacked_quadratures_2d = np.divide(
+                np.sum(values_stack**2.0, axis=1, where=unmasked_stack),
+                stacked_total_pixels**2.0,
+                out=np.zeros(stacked_total_pixels.shape),
+                where=stacked_total_pixels > 0,
+            )
+
+            stacked_valid = np.invert(np.isnan(stacked_arrays_2d))
+
+            binned_arrays_1d = np.mean(
+                stacked_arrays_2d, axis=axis, where=stacked_valid
+            )
+
+            binned_total_pixels = np.sum(stacked_total_pixels, axis=axis)
+
+            binned_total_valid = np.sum(stacked_valid, axis=axis)
+
+            binned_quadratures_1d = np.divide(
+                np.sqrt(np.sum(stacked_quadratures_2d, axis=axis, where=stacked_valid)),
+                binned_total_valid,
+                out=np.full(binned_total_valid.shape, np.nan),
+                where=binned_total_valid > 0,
+            )
+
+            binned_list.append(
+                (
+                    array_1d_list_from(arrays_1d=binned_arrays_1d),
+                    array_1d_list_from(arrays_1d=binned_total_pixels),
+                    array_1d_list_from(arrays_1d=binned_quadratures_1d),
+                )
+            )
+
+        return binned_list
+
     def binned_region_1d_from(self, settings: SettingsExtract) -> aa.Region1D:
         raise NotImplementedError
 
@@ -426,37 +537,73 @@ class Extract2D:
     def dataset_1d_from(
         self, dataset_2d: ImagingCI, settings: SettingsExtract
     ) -> Dataset1D:
-        binned_data_1d = self.binned_array_1d_from(
-            array=dataset_2d.data, settings=settings
-        )
+        """
+        Extract a 1D dataset from a 2D charge injection imaging dataset, by extracting, stacking and binning its
+        data, noise-map and pre-CTI data (see `dataset_1d_list_from`).
 
-        binned_noise_map_1d = self.binned_array_1d_from(
-            array=dataset_2d.noise_map, settings=settings
-        )
+        Parameters
+        ----------
+        dataset_2d
+            The 2D charge injection imaging dataset from which the 1D dataset is extracted.
+        settings
+           The settings used to extract the region (e.g. the EPERs), which for example include the `pixels`
+           tuple specifying the range of pixel columns they are extracted between.
+        """
+        return self.dataset_1d_list_from(
+            dataset_2d=dataset_2d, settings_list=[settings]
+        )[0]
 
-        binned_noise_map_1d_total_pixels = self.binned_array_1d_total_pixels_from(
-            array=dataset_2d.noise_map, settings=settings
-        )
+    def dataset_1d_list_from(
+        self, dataset_2d: ImagingCI, settings_list: List[SettingsExtract]
+    ) -> List[Dataset1D]:
+        """
+        Extract a 1D dataset from a 2D charge injection imaging dataset for every input settings (e.g. every window
+        of the FPRs or EPERs which is fitted).
 
-        binned_noise_map_1d /= np.sqrt(binned_noise_map_1d_total_pixels)
+        The data, noise-map and pre-CTI data are extracted, stacked and binned together for every settings via
+        `binned_array_1d_list_from`, where every quantity is binned over its own mask. The noise-map of the 1D
+        dataset is the binned quadrature sum of the noise-map, which propagates the noise of every pixel into the
+        mean of the stacking and binning. For a noise-map which is uniform over the regions this equals the mean
+        noise divided by the square root of the number of pixels binned into every pixel.
 
-        binned_pre_cti_data_1d = self.binned_array_1d_from(
-            array=dataset_2d.pre_cti_data,
-            settings=settings,
+        Parameters
+        ----------
+        dataset_2d
+            The 2D charge injection imaging dataset from which the 1D datasets are extracted.
+        settings_list
+            The settings used to extract the regions (e.g. the EPERs), where a 1D dataset is returned for every
+            settings.
+        """
+        binned_list = self.binned_array_1d_list_from(
+            array_list=[dataset_2d.data, dataset_2d.noise_map, dataset_2d.pre_cti_data],
+            settings_list=settings_list,
         )
 
-        binned_region_1d = self.binned_region_1d_from(settings=settings)
+        dataset_1d_list = []
 
-        layout_1d = Layout1D(
-            shape_1d=binned_data_1d.shape_native, region_list=[binned_region_1d]
-        )
+        for settings, (binned_array_1d_list, _, binned_quadrature_1d_list) in zip(
+            settings_list, binned_list
+        ):
+            binned_data_1d, _, binned_pre_cti_data_1d = binned_array_1d_list
 
-        return Dataset1D(
-            data=binned_data_1d,
-            noise_map=binned_noise_map_1d,
-            pre_cti_data=binned_pre_cti_data_1d,
-            layout=layout_1d,
-        )
+            binned_noise_map_1d = binned_quadrature_1d_list[1]
+
+            binned_region_1d = self.binned_region_1d_from(settings=settings)
+
+            layout_1d = Layout1D(
+                shape_1d=binned_data_1d.shape_native, region_list=[binned_region_1d]
+            )
+
+            dataset_1d_list.append(
+                Dataset1D(
+                    data=binned_data_1d,
+                    noise_map=binned_noise_map_1d,
+                    pre_cti_data=binned_pre_cti_data_1d,
+                    layout=layout_1d,
+                )
+            )
+
+        return dataset_1d_list
 
     def add_gaussian_noise_to(
         self,
@@ -489,10 +636,10 @@ class Extract2D:
         array = array.native
 
         for arr, region in zip(array_2d_list, region_list):
-            array[
-                region.y0 : region.y1, region.x0 : region.x1
-            ] = aa.preprocess.data_with_gaussian_noise_added(
-                data=arr, sigma=noise_sigma, seed=noise_seed
+            array[region.y0 : region.y1, region.x0 : region.x1] = (
+                aa.preprocess.data_with_gaussian_noise_added(
+                    data=arr, sigma=noise_sigma, seed=noise_seed
+                )
             )
 
         return array
@@ -0,0 +1,237 @@
+import numpy as np
+from pathlib import Path
+from typing import Optional, Union
+
+import autoarray as aa
+
+from autocti import exc
+from autocti.extract.settings import SettingsExtract
+from autocti.extract.two_d.abstract import Extract2D
+from autocti.extract.two_d.plan import ExtractPlan2D
+from autocti.mask.mask_2d import Mask2D
+
+
+class Extract2DAccumulator:
+    def __init__(self, extract: Extract2D, settings: SettingsExtract):
+        """
+        Stacks a region (e.g. the parallel EPERs) of many CTI calibration exposures incrementally, one exposure at
+        a time, such that hundreds of exposures (e.g. every charge injection image of a calibration block) can be
+        stacked without holding them in memory at once.
+
+        For every pixel of the stacked region the accumulator stores the running sum, the running sum of squares
+        and the number of unmasked pixels over every region of every exposure added. These are all that is needed
+        to compute the stacked mean (which for a single exposure equals `Extract2D.stacked_array_2d_from`), the
+        total pixels (equal to `Extract2D.stacked_array_2d_total_pixels_from`) and the standard error of the mean,
+        therefore memory use is independent of the number of exposures.
+
+        Accumulators of the same regions can be merged via `merge`, such that exposures can be split over
+        workers (e.g. processes each loading a subset of the .fits files) whose accumulators are merged at the end.
+
+        The regions are extracted via the extraction plan of the `Extract2D` object (see `Extract2D.plan_from`),
+        which is computed from the first exposure added and reused for every exposure thereafter.
+
+        Parameters
+        ----------
+        extract
+            The `Extract2D` object (e.g. `layout.extract.parallel_eper`) whose regions are stacked.
+        settings
+           The settings used to extract the region (e.g. the EPERs), which for example include the `pixels`
+           tuple specifying the range of pixel columns they are extracted between.
+        """
+        self.extract = extract
+        self.settings = settings
+
+        self.plan: Optional[ExtractPlan2D] = None
+        self.pixel_scale = None
+
+        self.sum_2d: Optional[np.ndarray] = None
+        self.sum_of_squares_2d: Optional[np.ndarray] = None
+        self.total_pixels_2d: Optional[np.ndarray] = None
+
+        self.total_exposures = 0
+
+    def add(self, array: aa.Array2D):
+        """
+        Add the regions of an exposure to the stack, where masked pixels of the array are omitted.
+
+        Parameters
+        ----------
+        array
+            The 2D array of the exposure (e.g. the data of a charge injection image) whose regions are stacked.
+        """
+        if self.plan is None:
+            self.plan = self.extract.plan_from(array=array, settings=self.settings)
+            self.pixel_scale = array.pixel_scale
+
+            self.sum_2d = np.zeros(self.plan.shape_stacked)
+            self.sum_of_squares_2d = np.zeros(self.plan.shape_stacked)
+            self.total_pixels_2d = np.zeros(self.plan.shape_stacked, dtype="int")
+
+        elif tuple(array.shape_native) != tuple(self.plan.shape_native):
+            raise exc.ExtractException(
+                f"An array of shape {array.shape_native} cannot be added to an accumulator of arrays of shape "
+                f"{self.plan.shape_native}."
+            )
+
+        unmasked_stack = np.invert(self.plan.mask_from(array=array))
+
+        values_stack = np.where(unmasked_stack, self.plan.values_from(array=array), 0.0)
+
+        self.sum_2d += np.sum(values_stack, axis=0)
+        self.sum_of_squares_2d += np.sum(values_stack**2.0, axis=0)
+        self.total_pixels_2d += np.sum(unmasked_stack, axis=0)
+
+        self.total_exposures += 1
+
+    def add_via_fits(
+        self,
+        file_path: Union[Path, str],
+        pixel_scales: aa.type.PixelScales,
+        hdu: int = 0,
+        mask: Optional[Mask2D] = None,
+    ):
+        """
+        Load an exposure from a .fits file and add its regions to the stack (see `add`), such that only one
+        exposure is held in memory at a time.
+
+        Parameters
+        ----------
+        file_path
+            The path to the .fits file containing the exposure (e.g. '/path/to/data.fits').
+        pixel_scales
+            The (y,x) arcsecond-to-pixel units conversion factor of every pixel.
+        hdu
+            The hdu the exposure is contained in the .fits file.
+        mask
+            A mask applied to the exposure before it is stacked (e.g. masking cosmic rays).
+        """
+        array = aa.Array2D.from_fits(
+            file_path=file_path, hdu=hdu, pixel_scales=pixel_scales
+        )
+
+        if mask is not None:
+            array = aa.Array2D(values=array.native, mask=mask)
+
+        self.add(array=array)
+
+    def merge(self, accumulator: "Extract2DAccumulator") -> "Extract2DAccumulator":
+        """
+        Merge the stack of another accumulator of the same regions (e.g. an accumulator of a different subset of
+        exposures computed by a different worker) into this accumulator.
+
+        Parameters
+        ----------
+        accumulator
+            The accumulator whose stack is merged into this accumulator.
+        """
+        if accumulator.plan is None:
+            return self
+
+        if self.plan is None:
+            self.plan = accumulator.plan
+            self.pixel_scale = accumulator.pixel_scale
+
+            self.sum_2d = np.copy(accumulator.sum_2d)
+            self.sum_of_squares_2d = np.copy(accumulator.sum_of_squares_2d)
+            self.total_pixels_2d = np.copy(accumulator.total_pixels_2d)
+
+            self.total_exposures = accumulator.total_exposures
+
+            return self
+
+        if not np.array_equal(self.plan.index_array, accumulator.plan.index_array):
+            raise exc.ExtractException(
+                "Accumulators can only be merged if they stack the same regions of arrays of the same shape."
+            )
+
+        self.sum_2d += accumulator.sum_2d
+        self.sum_of_squares_2d += accumulator.sum_of_squares_2d
+        self.total_pixels_2d += accumulator.total_pixels_2d
+
+        self.total_exposures += accumulator.total_exposures
+
+        return self
+
+    @property
+    def mask(self) -> Mask2D:
+        """
+        The mask of the stacked region, where a pixel is masked if it is masked in every region of every exposure.
+        """
+        return Mask2D(mask=self.total_pixels_2d == 0, pixel_scales=self.pixel_scale)
+
+    def _stacked_from(self, values: np.ndarray) -> aa.Array2D:
+        return aa.Array2D(values=values, mask=self.mask).native
+
+    @property
+    def stacked_array_2d(self) -> aa.Array2D:
+        """
+        The mean of the regions of every exposure added, where every pixel is the mean over its unmasked pixels.
+        """
+        return self._stacked_from(
+            values=np.divide(
+                self.sum_2d,
+                self.total_pixels_2d,
+                out=np.zeros_like(self.sum_2d),
+                where=self.total_pixels_2d > 0,
+            )
+        )
+
+    @property
+    def stacked_array_2d_total_pixels(self) -> aa.Array2D:
+        """
+        The number of unmasked pixels stacked into every pixel of the stacked region.
+        """
+        return self._stacked_from(values=self.total_pixels_2d)
+
+    @property
+    def stacked_variance_2d(self) -> aa.Array2D:
+        """
+        The variance of the pixels stacked into every pixel of the stacked region, computed from the running sum
+        and sum of squares.
+        """
+        total_pixels_2d = np.maximum(self.total_pixels_2d, 1)
+
+        mean_2d = self.sum_2d / total_pixels_2d
+
+        return self._stacked_from(
+            values=np.maximum(
+                self.sum_of_squares_2d / total_pixels_2d - mean_2d**2.0, 0.0
+            )
+        )
+
+    @property
+    def stacked_noise_map_2d(self) -> aa.Array2D:
+        """
+        The standard error of the mean of every pixel of the stacked region, which is the noise-map of the stacked
+        array estimated from the scatter of the stacked pixels.
+        """
+        return self._stacked_from(
+            values=np.sqrt(
+                np.asarray(self.stacked_variance_2d)
+                / np.maximum(self.total_pixels_2d, 1)
+            )
+        )
+
+    @property
+    def binned_array_1d(self) -> aa.Array1D:
+        """
+        The stacked region binned to 1D by taking the mean across the direction opposite to clocking (see
+        `Extract2D.binned_array_1d_from`), over the pixels of the stacked region that are not masked.
+        """
+        binned_array_1d = np.mean(
+            np.asarray(self.stacked_array_2d),
+            axis=self.extract.binning_axis,
+            where=self.total_pixels_2d > 0,
+        )
+
+        return aa.Array1D.no_mask(values=binned_array_1d, pixel_scales=self.pixel_scale)
+
+    @property
+    def binned_array_1d_total_pixels(self) -> aa.Array1D:
+        """
+        The number of unmasked pixels binned into every pixel of `binned_array_1d`.
+        """
+        return aa.Array1D.no_mask(
+            values=np.sum(self.total_pixels_2d, axis=self.extract.binning_axis),
+            pixel_scales=self.pixel_scale,
+        )
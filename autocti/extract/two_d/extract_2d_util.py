@@ -1,7 +1,11 @@
-from typing import Tuple
+import numpy as np
+import warnings
+from typing import List, Tuple
 
 import autoarray as aa
 
+from autocti import exc
+
 
 def binned_region_1d_fpr_from(pixels: Tuple[int, int]) -> aa.Region1D:
     """
@@ -54,3 +58,107 @@ def binned_region_1d_eper_from(pixels: Tuple[int, int]) -> aa.Region1D:
     elif pixels[1] >= 0:
         return aa.Region1D(region=(0, -pixels[0]))
     return aa.Region1D(region=(0, pixels[1] - pixels[0]))
+
+
+def masked_column_value_list_from(
+    array_2d: np.ndarray, mask_2d: np.ndarray, value_str: str = "median"
+) -> List[float]:
+    """
+    Returns the median, mean or standard deviation of every column of a 2D array, computed over the values of the
+    column which are not masked.
+
+    Every column is computed at once, by setting the masked values to NaN and using NaN-aware numpy functions
+    (e.g. `np.nanmedian`, which partitions every column in a single call), as opposed to computing every column
+    separately. For example, the 2D array may be every column of every charge injection region stacked side-by-side
+    or the FPRs of every charge injection region stacked on top of one another.
+
+    A column where every value is masked has a value of NaN, where numpy warns that the column is empty for the
+    `mean` and `std`.
+
+    Parameters
+    ----------
+    array_2d
+        The 2D array whose columns are computed.
+    mask_2d
+        The mask of the 2D array, where `True` values are omitted.
+    value_str
+        The value computed for every column, which is `median`, `mean` or `std`.
+    """
+    values = np.where(mask_2d, np.nan, np.asarray(array_2d, dtype="float"))
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore", message="All-NaN slice encountered", category=RuntimeWarning
+        )
+
+        if value_str == "median":
+            value_array = np.nanmedian(values, axis=0)
+        elif value_str == "mean":
+            value_array = np.nanmean(values, axis=0)
+        elif value_str == "std":
+            value_array = np.nanstd(values, axis=0)
+        else:
+            raise exc.ExtractException(
+                f"The value_str {value_str} is not supported, it must be median, mean or std."
+            )
+
+    return value_array.tolist()
+
+
+def region_column_median_list_from(
+    array_2d: np.ndarray, mask_2d: np.ndarray, region_list: List[aa.Region2D]
+) -> List[float]:
+    """
+    Returns the median of every column of every region of a 2D array (e.g. the charge injection regions), computed
+    over the values of every column which are not masked, in the order of the regions and their columns.
+
+    The columns of all regions with the same number of rows are stacked side-by-side into a single 2D array, such
+    that the medians of all their columns are computed at once via `masked_column_value_list_from`.
+
+    Parameters
+    ----------
+    array_2d
+        The 2D array whose region columns are computed.
+    mask_2d
+        The mask of the 2D array, where `True` values are omitted.
+    region_list
+        The regions of the 2D array whose columns are computed.
+    """
+    array_2d = np.asarray(array_2d)
+    mask_2d = np.asarray(mask_2d, dtype="bool")
+
+    region_index_dict = {}
+
+    for region_index, region in enumerate(region_list):
+        total_rows = array_2d[region.y0 : region.y1].shape[0]
+
+        region_index_dict.setdefault(total_rows, []).append(region_index)
+
+    median_list_of_lists = [None] * len(region_list)
+
+    for region_index_list in region_index_dict.values():
+        array_stack = np.concatenate(
+            [array_2d[region_list[index].slice] for index in region_index_list], axis=1
+        )
+        mask_stack = np.concatenate(
+            [mask_2d[region_list[index].slice] for index in region_index_list], axis=1
+        )
+
+        median_list = masked_column_value_list_from(
+            array_2d=array_stack, mask_2d=mask_stack, value_str="median"
+        )
+
+        column_start = 0
+
+        for index in region_index_list:
+            total_columns = array_2d[
+                :, region_list[index].x0 : region_list[index].x1
+            ].shape[1]
+
+            median_list_of_lists[index] = median_list[
+                column_start : column_start + total_columns
+            ]
+
+            column_start += total_columns
+
+    return [median for median_list in median_list_of_lists for median in median_list]
@@ -4,6 +4,7 @@ from typing import List, Optional, Tuple
 import autoarray as aa
 
 from autocti.extract.two_d.abstract import Extract2D
+from autocti.extract.two_d import extract_2d_util
 from autocti.extract.settings import SettingsExtract
 
 from autocti import exc
@@ -41,35 +42,23 @@ class Extract2DParallel(Extract2D):
     def _value_list_from(
         self, array: aa.Array2D, value_str: str, settings: SettingsExtract
     ):
-        value_list = []
-
-        arr_list = [
-            array.native[region.slice]
-            for region in self.region_list_from(settings=settings)
-        ]
-
-        mask_list = [
-            array.mask[region.slice]
-            for region in self.region_list_from(settings=settings)
-        ]
-
-        arr_stack = np.stack(arr_list)
-        mask_stack = np.stack(mask_list)
-
-        for column_index in range(arr_list[0].shape[1]):
-            arr_extract = arr_stack[:, :, column_index]
-            mask_extract = mask_stack[:, :, column_index]
+        """
+        Returns the median, mean or standard deviation of every column of the regions, computed over the unmasked
+        values of the column in every region.
 
-            arr_unmasked = arr_extract[np.invert(mask_extract)]
+        The regions are extracted via the extraction plan (see `plan_from`) as an array of shape
+        (total_regions, rows, columns), whose regions are stacked on top of one another such that the values of every
+        column are computed at once (see `extract_2d_util.masked_column_value_list_from`).
+        """
+        plan = self.plan_from(array=array, settings=settings)
 
-            if value_str == "median":
-                value_list.append(float(np.median(arr_unmasked)))
-            elif value_str == "mean":
-                value_list.append(float(np.mean(arr_unmasked)))
-            elif value_str == "std":
-                value_list.append(float(np.std(arr_unmasked)))
+        total_columns = plan.shape_stacked[1]
 
-        return value_list
+        return extract_2d_util.masked_column_value_list_from(
+            array_2d=plan.values_from(array=array).reshape(-1, total_columns),
+            mask_2d=plan.mask_from(array=array).reshape(-1, total_columns),
+            value_str=value_str,
+        )
 
     def median_list_from(
         self, array: aa.Array2D, settings: SettingsExtract
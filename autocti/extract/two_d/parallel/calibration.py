@@ -259,7 +259,7 @@ class Extract2DParallelCalibration:
 
         mask = self.mask_2d_from(mask=dataset.mask, columns=columns)
 
-        dataset = ImagingCI(
+        dataset_extracted = ImagingCI(
             data=dataset.layout.extract.parallel_calibration.array_2d_from(
                 array=dataset.data, columns=columns
             ),
@@ -274,8 +274,10 @@ class Extract2DParallelCalibration:
             ),
             cosmic_ray_map=cosmic_ray_map,
             noise_scaling_map_dict=noise_scaling_map_dict,
-            fpr_value=dataset.fpr_value,
+            fpr_value=dataset._fpr_value,
             settings_dict=dataset.settings_dict,
         )
 
-        return dataset.apply_mask(mask=mask)
+        dataset._carry_fpr_value_to(dataset=dataset_extracted)
+
+        return dataset_extracted.apply_mask(mask=mask)
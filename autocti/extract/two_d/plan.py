@@ -0,0 +1,157 @@
+import numpy as np
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
+
+import autoarray as aa
+
+from autocti import exc
+from autocti.extract.settings import SettingsExtract
+
+
+class ExtractPlan2D:
+    def __init__(self, region_list: List[aa.Region2D], shape_native: Tuple[int, int]):
+        """
+        A compiled plan of the extraction of a list of regions (e.g. the parallel FPR of every charge injection
+        region) from a 2D array of a given shape, which the `Extract2D` objects use to stack and bin arrays.
+
+        The plan stores a single integer array of shape (total_regions, rows, columns), whose entries are the
+        indexes of every extracted pixel in the flattened native array. Extracting every region of an array is
+        therefore a single `take`, after which stacking is a mean over the first axis, instead of slicing every
+        region and converting the list of slices to an array.
+
+        The indexes follow Python slicing, such that regions which extend beyond the edge of the array are cropped
+        in the same way as `array.native[region.slice]`.
+
+        Parameters
+        ----------
+        region_list
+            The regions which are extracted, which must all have the same shape after cropping to the array.
+        shape_native
+            The 2D shape of the native arrays the regions are extracted from.
+        """
+        row_range = np.arange(shape_native[0])
+        column_range = np.arange(shape_native[1])
+
+        row_index_list = [row_range[region.y0 : region.y1] for region in region_list]
+        column_index_list = [
+            column_range[region.x0 : region.x1] for region in region_list
+        ]
+
+        if (
+            len({row_index.shape for row_index in row_index_list}) > 1
+            or len({column_index.shape for column_index in column_index_list}) > 1
+        ):
+            raise exc.ExtractException(
+                "The regions extracted from the array do not have the same shape and cannot be stacked."
+            )
+
+        self.shape_native = shape_native
+
+        self.index_array = (
+            np.asarray(row_index_list)[:, :, None] * shape_native[1]
+            + np.asarray(column_index_list)[:, None, :]
+        )
+
+    @property
+    def total_regions(self) -> int:
+        return self.index_array.shape[0]
+
+    @property
+    def shape_stacked(self) -> Tuple[int, int]:
+        return self.index_array.shape[1:]
+
+    def values_from(self, array: aa.Array2D) -> np.ndarray:
+        """
+        Returns the values of every region of an array, as an ndarray of shape (total_regions, rows, columns).
+
+        Parameters
+        ----------
+        array
+            The array whose regions are extracted.
+        """
+        return np.asarray(array.native, dtype="float").reshape(-1)[self.index_array]
+
+    def mask_from(self, array: aa.Array2D) -> np.ndarray:
+        """
+        Returns the mask of every region of an array, as an ndarray of shape (total_regions, rows, columns).
+
+        Parameters
+        ----------
+        array
+            The array whose regions of its mask are extracted.
+        """
+        return np.asarray(array.mask, dtype="bool").reshape(-1)[self.index_array]
+
+
+_extract_plan_2d_dict: "OrderedDict[Hashable, ExtractPlan2D]" = OrderedDict()
+
+_extract_plan_2d_max_size = 256
+
+
+def region_key_from(region: Optional[aa.Region2D]) -> Optional[Tuple[int, ...]]:
+    if region is None:
+        return None
+
+    return (region.y0, region.y1, region.x0, region.x1)
+
+
+def extract_plan_2d_from(
+    extract, settings: SettingsExtract, shape_native: Tuple[int, int]
+) -> ExtractPlan2D:
+    """
+    Returns the `ExtractPlan2D` of an `Extract2D` object for the input settings and array shape.
+
+    Plans are cached by the values which define the extracted regions (the class of the `Extract2D` object, the
+    layout regions it is created from, the settings and the array shape) rather than by the `Extract2D` object,
+    because a layout creates new `Extract2D` objects every time its `extract` property is accessed. The regions of
+    a plan are therefore only computed the first time an extraction is performed, and visualization or fits which
+    extract the same regions many times reuse the plan.
+
+    The regions are cropped via `settings.region_list_from` (e.g. to the same number of rows if
+    `force_same_row_size` is True), such that every function which extracts regions via a plan uses the same regions
+    as `array_2d_list_from`.
+
+    The cache is least-recently-used (LRU): once it stores `_extract_plan_2d_max_size` plans, the plan which was
+    used least recently is removed when a new plan is stored.
+
+    Parameters
+    ----------
+    extract
+        The `Extract2D` object whose `region_list_from` defines the extracted regions.
+    settings
+        The settings used to extract the regions (e.g. the `pixels` of the EPERs).
+    shape_native
+        The 2D shape of the native arrays the regions are extracted from.
+    """
+    key = (
+        type(extract),
+        tuple(shape_native),
+        None if extract.shape_2d is None else tuple(extract.shape_2d),
+        tuple(region_key_from(region) for region in extract.region_list or []),
+        region_key_from(extract.parallel_overscan),
+        region_key_from(extract.serial_prescan),
+        region_key_from(extract.serial_overscan),
+        None if settings.pixels is None else tuple(settings.pixels),
+        settings.pixels_from_end,
+        settings.force_same_row_size,
+    )
+
+    try:
+        plan = _extract_plan_2d_dict[key]
+    except KeyError:
+        pass
+    else:
+        _extract_plan_2d_dict.move_to_end(key)
+        return plan
+
+    region_list = extract.region_list_from(settings=settings)
+    region_list = settings.region_list_from(region_list=region_list)
+
+    plan = ExtractPlan2D(region_list=region_list, shape_native=shape_native)
+
+    while len(_extract_plan_2d_dict) >= _extract_plan_2d_max_size:
+        _extract_plan_2d_dict.popitem(last=False)
+
+    _extract_plan_2d_dict[key] = plan
+
+    return plan
@@ -4,6 +4,7 @@ from typing import List, Optional, Tuple
 import autoarray as aa
 
 from autocti.extract.two_d.abstract import Extract2D
+from autocti.extract.two_d import extract_2d_util
 from autocti.extract.settings import SettingsExtract
 
 
@@ -39,35 +40,28 @@ class Extract2DSerial(Extract2D):
     def _value_list_from(
         self, array: aa.Array2D, value_str: str, settings: SettingsExtract
     ):
-        value_list = []
-
-        arr_list = [
-            array.native[region.slice]
-            for region in self.region_list_from(settings=settings)
-        ]
-
-        mask_list = [
-            array.mask[region.slice]
-            for region in self.region_list_from(settings=settings)
-        ]
-
-        arr_stack = np.stack(arr_list)
-        mask_stack = np.stack(mask_list)
-
-        for row_index in range(arr_list[0].shape[0]):
-            arr_extract = arr_stack[:, row_index, :]
-            mask_extract = mask_stack[:, row_index, :]
-
-            arr_unmasked = arr_extract[np.invert(mask_extract)]
-
-            if value_str == "median":
-                value_list.append(float(np.median(arr_unmasked)))
-            elif value_str == "mean":
-                value_list.append(float(np.mean(arr_unmasked)))
-            elif value_str == "std":
-                value_list.append(float(np.std(arr_unmasked)))
+        """
+        Returns the median, mean or standard deviation of every row of the regions, computed over the unmasked
+        values of the row in every region.
 
-        return value_list
+        The regions are extracted via the extraction plan (see `plan_from`) as an array of shape
+        (total_regions, rows, columns), which is transposed such that the rows of every region are columns stacked
+        on top of one another and the values of every row are computed at once (see
+        `extract_2d_util.masked_column_value_list_from`).
+        """
+        plan = self.plan_from(array=array, settings=settings)
+
+        total_rows = plan.shape_stacked[0]
+
+        return extract_2d_util.masked_column_value_list_from(
+            array_2d=np.transpose(plan.values_from(array=array), (0, 2, 1)).reshape(
+                -1, total_rows
+            ),
+            mask_2d=np.transpose(plan.mask_from(array=array), (0, 2, 1)).reshape(
+                -1, total_rows
+            ),
+            value_str=value_str,
+        )
 
     def median_list_from(
         self, array: aa.Array2D, settings: SettingsExtract
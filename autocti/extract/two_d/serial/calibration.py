@@ -252,7 +252,7 @@ class Extract2DSerialCalibration:
 
         mask = self.mask_2d_from(mask=dataset.mask, rows=rows)
 
-        dataset = ImagingCI(
+        dataset_extracted = ImagingCI(
             data=image,
             noise_map=dataset.layout.extract.serial_calibration.array_2d_from(
                 array=dataset.noise_map, rows=rows
@@ -265,8 +265,10 @@ class Extract2DSerialCalibration:
             ),
             cosmic_ray_map=cosmic_ray_map,
             noise_scaling_map_dict=noise_scaling_map_dict,
-            fpr_value=dataset.fpr_value,
+            fpr_value=dataset._fpr_value,
             settings_dict=dataset.settings_dict,
         )
 
-        return dataset.apply_mask(mask=mask)
+        dataset._carry_fpr_value_to(dataset=dataset_extracted)
+
+        return dataset_extracted.apply_mask(mask=mask)
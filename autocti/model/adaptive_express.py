@@ -0,0 +1,131 @@
+import copy
+import numpy as np
+from typing import Callable, List, Union
+
+from autocti.clocker.one_d import Clocker1D
+from autocti.clocker.two_d import Clocker2D
+
+
+class AdaptiveExpress:
+    def __init__(
+        self,
+        parallel_express: int = 1,
+        serial_express: int = 1,
+        log_likelihood_window: float = 100.0,
+        log_likelihood_error_bound: float = 1.0,
+    ):
+        """
+        Coarse-to-fine evaluation of the log likelihood function of a CTI model-fit, where proposals of the
+        non-linear search are first evaluated using a coarse (fast but approximate) arctic express setting and
+        only proposals whose log likelihood is close to the best log likelihood found so far are re-evaluated using
+        the clocker's exact express setting.
+
+        The `express` of arctic sets how many times the effect of charge transfers is computed explicitly, where
+        `express=1` is the fastest and least accurate value, higher values are slower and more accurate and
+        `express=0` computes every transfer (the slowest and exact calculation).
+
+        Early in a model-fit most proposals have log likelihoods far below the best fit, so the coarse log likelihood
+        is sufficient to reject them and is returned. Every time a proposal is within `log_likelihood_window` of the
+        best log likelihood, it is re-evaluated with the exact express and the difference between the coarse and
+        exact log likelihoods of this reference evaluation is recorded. If this difference exceeds
+        `log_likelihood_error_bound` the coarse express is no longer accurate enough to rank proposals (which occurs
+        as the search converges and the log likelihoods of proposals become close to one another) and every
+        subsequent proposal is evaluated using only the exact express.
+
+        Parameters
+        ----------
+        parallel_express
+            The parallel express value used for coarse evaluations (and the express of a `Clocker1D`).
+        serial_express
+            The serial express value used for coarse evaluations.
+        log_likelihood_window
+            Proposals whose coarse log likelihood is within this value of the best log likelihood are re-evaluated
+            using the exact express.
+        log_likelihood_error_bound
+            The maximum difference between the coarse and exact log likelihood of a reference evaluation, above
+            which all subsequent evaluations use the exact express.
+        """
+        self.parallel_express = parallel_express
+        self.serial_express = serial_express
+        self.log_likelihood_window = log_likelihood_window
+        self.log_likelihood_error_bound = log_likelihood_error_bound
+
+        self.best_log_likelihood = -np.inf
+        self.is_exact = False
+
+        self.total_coarse = 0
+        self.total_exact = 0
+
+        self.log_likelihood_error_list: List[float] = []
+
+    def clocker_from(
+        self, clocker: Union[Clocker1D, Clocker2D]
+    ) -> Union[Clocker1D, Clocker2D]:
+        """
+        Returns a copy of the input clocker which uses the coarse express values, which is used for coarse
+        evaluations of the log likelihood function.
+
+        Parameters
+        ----------
+        clocker
+            The clocker of the model-fit, which uses the exact express values.
+        """
+        clocker = copy.copy(clocker)
+
+        if isinstance(clocker, Clocker1D):
+            clocker.express = self.parallel_express
+        else:
+            clocker.parallel_express = self.parallel_express
+            clocker.serial_express = self.serial_express
+
+        return clocker
+
+    def switch_to_exact(self):
+        """
+        Evaluate every subsequent proposal using only the exact express (e.g. once the search has converged).
+        """
+        self.is_exact = True
+
+    def log_likelihood_from(
+        self,
+        log_likelihood_coarse_func: Callable[[], float],
+        log_likelihood_exact_func: Callable[[], float],
+    ) -> float:
+        """
+        Returns the log likelihood of a proposal, using the coarse express if it is sufficiently far below the best
+        log likelihood and the exact express otherwise (see the class docstring).
+
+        Parameters
+        ----------
+        log_likelihood_coarse_func
+            A function returning the log likelihood of the proposal using the coarse express.
+        log_likelihood_exact_func
+            A function returning the log likelihood of the proposal using the exact express.
+        """
+        if self.is_exact:
+            self.total_exact += 1
+            return log_likelihood_exact_func()
+
+        log_likelihood_coarse = log_likelihood_coarse_func()
+
+        self.total_coarse += 1
+
+        if log_likelihood_coarse < (
+            self.best_log_likelihood - self.log_likelihood_window
+        ):
+            return log_likelihood_coarse
+
+        log_likelihood = log_likelihood_exact_func()
+
+        self.total_exact += 1
+
+        log_likelihood_error = abs(log_likelihood - log_likelihood_coarse)
+
+        self.log_likelihood_error_list.append(log_likelihood_error)
+
+        if log_likelihood_error > self.log_likelihood_error_bound:
+            self.is_exact = True
+
+        self.best_log_likelihood = max(self.best_log_likelihood, log_likelihood)
+
+        return log_likelihood
@@ -1,3 +1,5 @@
+import copy
+from contextlib import nullcontext
 from typing import List, Optional, Union
 
 from autoconf import conf
@@ -11,6 +13,8 @@ from autocti.charge_injection.model.result import ResultImagingCI
 from autocti.clocker.one_d import Clocker1D
 from autocti.clocker.two_d import Clocker2D
 from autocti.dataset_1d.dataset_1d.dataset_1d import Dataset1D
+from autocti.model.pre_check import PreCheckPipeline
+from autocti.model.profiler import LikelihoodProfiler
 from autocti.model.settings import SettingsCTI1D
 from autocti.model.settings import SettingsCTI2D
 
@@ -22,6 +26,8 @@ class AnalysisCTI(af.Analysis):
         clocker: Union[Clocker1D, Clocker2D],
         settings_cti: Union[SettingsCTI1D, SettingsCTI2D],
         dataset_full: Optional[aa.AbstractDataset] = None,
+        profiler: Optional[LikelihoodProfiler] = None,
+        pre_check: Optional[PreCheckPipeline] = None,
     ):
         """
         Fits a CTI model to a CTI calibration dataset via a non-linear search.
@@ -46,6 +52,12 @@ class AnalysisCTI(af.Analysis):
         dataset_full
             The full dataset, which is visualized separate from the `dataset` that is fitted, which for example may
             not have the FPR masked and thus enable visualization of the FPR.
+        profiler
+            If input, the run time of every stage of the log likelihood function is recorded and output to the
+            `files` folder of the search when the model-fit finishes (see `LikelihoodProfiler`).
+        pre_check
+            If input, inexpensive checks of the physical plausibility of every CTI model which reject non-physical
+            models before they are clocked via arctic (see `PreCheckPipeline`).
         """
         super().__init__()
 
@@ -54,9 +66,94 @@ class AnalysisCTI(af.Analysis):
         self.settings_cti = settings_cti
         self.dataset_full = dataset_full
 
+        self.profiler = profiler
+        self.pre_check = pre_check
+
+        if profiler is not None:
+            self.clocker = copy.copy(clocker)
+            self.clocker.profiler = profiler
+
     def region_list_from(self) -> List:
         raise NotImplementedError
 
+    def profile_call(self):
+        """
+        Returns a context which times a call of the log likelihood function if the analysis has a `profiler`, and
+        otherwise does nothing.
+        """
+        if self.profiler is None:
+            return nullcontext()
+
+        return self.profiler.call()
+
+    def profile_stage(self, name: str):
+        """
+        Returns a context which times the code executed within it as the stage `name` of the log likelihood
+        function if the analysis has a `profiler`, and otherwise does nothing.
+
+        Parameters
+        ----------
+        name
+            The name of the stage which is timed (e.g. `chi_squared`).
+        """
+        if self.profiler is None:
+            return nullcontext()
+
+        return self.profiler.stage(name=name)
+
+    def pre_check_instance(self, instance: af.ModelInstance):
+        """
+        Perform the checks of the `pre_check` pipeline on the CTI model of an instance, raising a `PriorException`
+        which makes the non-linear search resample if it is not physical.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model, which includes the CTI model that is checked.
+        """
+        if self.pre_check is None:
+            return
+
+        with self.profile_stage(name="pre_check"):
+            self.pre_check.check(cti=instance.cti)
+
+    def modify_after_fit(
+        self, paths: af.DirectoryPaths, model: af.Collection, result: af.Result
+    ):
+        """
+        This function is called immediately after the non-linear search finishes.
+
+        If the analysis has a `profiler`, the distribution of the run time of every stage of the log likelihood
+        function is output to the file `likelihood_profile.json` in the `files` folder of the search.
+
+        If the analysis has a `pre_check` pipeline, the number of instances rejected by every check is output to the
+        file `pre_check.json` in the `files` folder of the search.
+
+        Parameters
+        ----------
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored.
+        model
+            The model object, which includes model components representing the CTI model that is fitted.
+        result
+            The result of the model-fit.
+        """
+        if self.profiler is not None and self.profiler.total_calls > 0:
+            paths._files_path.mkdir(parents=True, exist_ok=True)
+
+            self.profiler.output_to_json(
+                file_path=paths._files_path / "likelihood_profile.json"
+            )
+
+        if self.pre_check is not None and self.pre_check.total_checked > 0:
+            paths._files_path.mkdir(parents=True, exist_ok=True)
+
+            self.pre_check.output_to_json(
+                file_path=paths._files_path / "pre_check.json"
+            )
+
+        return self
+
     def save_results_combined(self, paths: af.DirectoryPaths, result: ResultImagingCI):
         """
         At the end of a model-fit, this routine saves attributes of the `Analysis` object to the `files`
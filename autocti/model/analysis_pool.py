@@ -0,0 +1,266 @@
+import io
+import logging
+import pickle
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+import autofit as af
+
+logger = logging.getLogger(__name__)
+
+_attached_shared_memory_dict: Dict[str, shared_memory.SharedMemory] = {}
+
+_worker_analysis_list = None
+
+
+def shared_array_from(name: str, shape: Tuple[int, ...], dtype: str) -> np.ndarray:
+    """
+    Returns a NumPy array whose values are stored in a block of shared memory created by `SharedMemoryPickler`,
+    which is how every large array of an analysis is restored when it is unpickled in a worker process.
+
+    The block of shared memory is attached once per process and kept open for the lifetime of the process, such
+    that every array unpickled from the same block shares the same memory and no values are copied.
+
+    The block is owned by the process which created it, therefore it is attached without registering it with the
+    resource tracker, which could otherwise unlink it or warn that it has leaked. Python 3.13 supports this via
+    `track=False`. For earlier versions the registration is skipped when the block is attached, because the resource
+    tracker is shared with the process which created the block and records every block once, such that
+    unregistering it after attaching would remove the registration of the creating process.
+
+    Parameters
+    ----------
+    name
+        The name of the block of shared memory.
+    shape
+        The shape of the array.
+    dtype
+        The data type of the array.
+    """
+    try:
+        memory = _attached_shared_memory_dict[name]
+    except KeyError:
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None
+
+            try:
+                memory = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+
+        _attached_shared_memory_dict[name] = memory
+
+    return np.ndarray(shape=shape, dtype=np.dtype(dtype), buffer=memory.buf)
+
+
+class SharedMemoryPickler(pickle.Pickler):
+    def __init__(
+        self,
+        file,
+        shared_memory_list: List[shared_memory.SharedMemory],
+        min_bytes: int = 65536,
+    ):
+        """
+        A pickler which copies every NumPy array of at least `min_bytes` bytes into a block of shared memory and
+        pickles only the name, shape and data type of the block, instead of the values of the array.
+
+        When the pickled object is unpickled (e.g. in a worker process) every such array is restored via
+        `shared_array_from` as a view of the shared memory, such that the large arrays of an analysis (e.g. the
+        `data`, `noise_map`, `pre_cti_data` and mask of its dataset) are stored once in memory and are never
+        pickled and sent to a worker process.
+
+        The blocks of shared memory are appended to `shared_memory_list`, and the object which creates them must
+        close and unlink them once they are no longer used (see `SharedMemoryAnalysisPool.close`).
+
+        Parameters
+        ----------
+        file
+            The file (e.g. an `io.BytesIO` object) the object is pickled into.
+        shared_memory_list
+            The list which every block of shared memory created by the pickler is appended to.
+        min_bytes
+            Arrays with fewer bytes than this are pickled normally.
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.shared_memory_list = shared_memory_list
+        self.min_bytes = min_bytes
+
+        self._reduce_dict = {}
+
+    def reducer_override(self, obj):
+        if type(obj) is not np.ndarray or obj.nbytes < self.min_bytes:
+            return NotImplemented
+
+        if obj.dtype.hasobject:
+            return NotImplemented
+
+        try:
+            return self._reduce_dict[id(obj)][0]
+        except KeyError:
+            pass
+
+        memory = shared_memory.SharedMemory(create=True, size=obj.nbytes)
+
+        shared_array = np.ndarray(shape=obj.shape, dtype=obj.dtype, buffer=memory.buf)
+        shared_array[...] = obj
+
+        self.shared_memory_list.append(memory)
+
+        reduce_value = (shared_array_from, (memory.name, obj.shape, obj.dtype.str))
+
+        self._reduce_dict[id(obj)] = (reduce_value, obj)
+
+        return reduce_value
+
+
+def shared_memory_dumps(
+    obj, shared_memory_list: List[shared_memory.SharedMemory], min_bytes: int = 65536
+) -> bytes:
+    """
+    Pickle an object via the `SharedMemoryPickler`, such that every large NumPy array it contains is stored in
+    shared memory and is restored as a view of this memory when the object is unpickled.
+
+    Parameters
+    ----------
+    obj
+        The object (e.g. a list of analyses) which is pickled.
+    shared_memory_list
+        The list which every block of shared memory created by the pickler is appended to.
+    min_bytes
+        Arrays with fewer bytes than this are pickled normally.
+    """
+    file = io.BytesIO()
+
+    SharedMemoryPickler(
+        file, shared_memory_list=shared_memory_list, min_bytes=min_bytes
+    ).dump(obj)
+
+    return file.getvalue()
+
+
+def _worker_initializer(analysis_list_bytes: bytes):
+    global _worker_analysis_list
+
+    _worker_analysis_list = pickle.loads(analysis_list_bytes)
+
+
+def _worker_log_likelihood_from(index: int, instance: af.ModelInstance) -> float:
+    return _worker_analysis_list[index].log_likelihood_function(instance)
+
+
+def _close_from(
+    executor: ProcessPoolExecutor, shared_memory_list: List[shared_memory.SharedMemory]
+):
+    executor.shutdown(wait=True, cancel_futures=True)
+
+    for memory in shared_memory_list:
+        try:
+            memory.close()
+            memory.unlink()
+        except FileNotFoundError:
+            pass
+
+    shared_memory_list.clear()
+
+
+class SharedMemoryAnalysisPool:
+    def __init__(
+        self, analyses: List[af.Analysis], n_processes: int, min_bytes: int = 65536
+    ):
+        """
+        A pool of worker processes which computes the log likelihoods of a list of analyses (e.g. the analyses of
+        the charge injection images at different injection levels of a CTI calibration) in parallel, where each
+        process computes the log likelihood of one analysis for the same model instance.
+
+        The analyses are sent to every worker process once when the pool is created, with every large NumPy array
+        they contain (e.g. the `data`, `noise_map`, `pre_cti_data` and mask of every dataset) stored once in
+        `multiprocessing.shared_memory` (see `SharedMemoryPickler`). Every call to the pool therefore only sends
+        the model instance to the workers, and the datasets are neither pickled on every call nor duplicated in
+        the memory of every worker.
+
+        The pool (its processes and shared memory) is released via `close`, or when the pool is garbage collected.
+
+        Parameters
+        ----------
+        analyses
+            The analyses whose log likelihoods are computed and summed.
+        n_processes
+            The number of worker processes of the pool.
+        min_bytes
+            Arrays with fewer bytes than this are pickled and sent to every worker instead of being stored in
+            shared memory.
+        """
+        self.analyses = analyses
+        self.n_processes = n_processes
+
+        self.shared_memory_list = []
+
+        analysis_list_bytes = shared_memory_dumps(
+            obj=list(analyses),
+            shared_memory_list=self.shared_memory_list,
+            min_bytes=min_bytes,
+        )
+
+        logger.info(
+            f"Analysis pool of {n_processes} processes created, with "
+            f"{sum(memory.size for memory in self.shared_memory_list)} bytes of the analyses in shared memory."
+        )
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=n_processes,
+            initializer=_worker_initializer,
+            initargs=(analysis_list_bytes,),
+        )
+
+        self._finalizer = weakref.finalize(
+            self, _close_from, self.executor, self.shared_memory_list
+        )
+
+    def __getstate__(self):
+        raise pickle.PicklingError(
+            "A SharedMemoryAnalysisPool cannot be pickled, as it owns worker processes and shared memory."
+        )
+
+    def log_likelihood_list_from(self, instance: af.ModelInstance) -> List[float]:
+        """
+        Returns the log likelihood of every analysis for a model instance, each computed in a worker process.
+
+        Exceptions raised by the log likelihood function of an analysis (e.g. a `PriorException` which makes the
+        non-linear search resample) are raised in the main process.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model, which is fitted by every analysis.
+        """
+        future_list = [
+            self.executor.submit(_worker_log_likelihood_from, index, instance)
+            for index in range(len(self.analyses))
+        ]
+
+        return [future.result() for future in future_list]
+
+    def __call__(self, instance: af.ModelInstance) -> float:
+        """
+        Returns the summed log likelihood of every analysis for a model instance.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model, which is fitted by every analysis.
+        """
+        return sum(self.log_likelihood_list_from(instance=instance))
+
+    def close(self):
+        """
+        Shut down the worker processes and release the shared memory of the pool.
+        """
+        self._finalizer()
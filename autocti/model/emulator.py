@@ -0,0 +1,362 @@
+import json
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+
+from autocti import exc
+from autocti.model.model_util import CTI1D
+from autocti.model.model_util import CTI2D
+from autocti.model.pre_check import ccd_list_from
+
+logger = logging.getLogger(__name__)
+
+
+def parameter_vector_from(cti: Union[CTI1D, CTI2D]) -> np.ndarray:
+    """
+    Returns the parameters of a CTI model as a 1D vector, which are the inputs of the emulator.
+
+    The vector contains the density, release timescale and (for slow capture traps) capture timescale of every
+    trap species, followed by the full well depth, well notch depth and well fill power of every CCD phase.
+
+    Parameters
+    ----------
+    cti
+        The CTI model whose parameters are returned.
+    """
+    parameter_list = []
+
+    for trap in cti.trap_all_list:
+        parameter_list.append(trap.density)
+        parameter_list.append(trap.release_timescale)
+
+        if hasattr(trap, "capture_timescale"):
+            parameter_list.append(trap.capture_timescale)
+
+    for ccd in ccd_list_from(cti=cti):
+        parameter_list.append(ccd.full_well_depth)
+        parameter_list.append(ccd.well_notch_depth)
+        parameter_list.append(ccd.well_fill_power)
+
+    return np.asarray(parameter_list, dtype="float")
+
+
+class Emulator:
+    def __init__(
+        self,
+        region_list: Optional[List[str]] = None,
+        log_likelihood_window: float = 100.0,
+        min_training_points: int = 50,
+        max_training_points: int = 2000,
+        total_neighbors: int = 20,
+        nugget: float = 1.0e-8,
+        validation_fraction: float = 0.02,
+        seed: int = 1,
+    ):
+        """
+        An emulator of the post-CTI data of a charge injection imaging dataset, which pre-screens the instances
+        proposed by the non-linear search such that arctic is only called for instances which may be close to the
+        best fit.
+
+        The emulator learns the binned 1D profiles of the post-CTI data (e.g. the parallel FPR and EPER of
+        `Layout2D.extract_region_from`) as a function of the trap and CCD parameters of the CTI model (see
+        `parameter_vector_from`). It is trained on-the-fly: every time an instance is evaluated exactly via arctic,
+        its parameters and binned profiles are added to the training set.
+
+        The profiles of a new instance are predicted via a local Gaussian process, which conditions a squared
+        exponential kernel on the `total_neighbors` training points nearest the instance in the (standardized)
+        parameter space. The log likelihood of the predicted profiles given the binned data is then computed and:
+
+        - If it is more than `log_likelihood_window` below the best log likelihood of the profiles of an exact
+          evaluation, the instance is rejected without calling arctic and a `PriorException` is raised, such that
+          the non-linear search resamples it (in the same way as the trap density and pre-check checks).
+
+        - Otherwise the instance is evaluated exactly via arctic and added to the training set.
+
+        Until the training set has `min_training_points` points every instance is evaluated exactly. The log
+        likelihood returned to the non-linear search is therefore always an exact log likelihood, however rejecting
+        instances truncates the prior to the region of parameter space the emulator predicts is within
+        `log_likelihood_window` of the best fit. If the emulator wrongly rejects instances the posterior is biased,
+        therefore the emulator is opt-in and the window should be wide compared to the width of the posterior.
+
+        The accuracy of the emulator is recorded for every exact evaluation it predicts, where the difference between
+        the profile log likelihood of the predicted and exact profiles is stored. A `validation_fraction` of the
+        rejected instances are also evaluated exactly (and added to the training set) before they are rejected, to
+        count the instances which the emulator wrongly rejected. These diagnostics are returned by `summary_dict` and
+        output to the `files` folder of the search (`emulator.json`) when the model-fit finishes.
+
+        Parameters
+        ----------
+        region_list
+            The regions of the data whose binned 1D profiles are emulated (e.g. `["parallel_fpr", "parallel_eper"]`).
+            If not input, the regions fitted by the model (see `AnalysisImagingCI.region_list_from`) are used,
+            which are set before the model-fit begins.
+        log_likelihood_window
+            Instances whose emulated profile log likelihood is more than this value below the best profile log
+            likelihood are rejected without calling arctic.
+        min_training_points
+            The number of exact evaluations in the training set before the emulator is used.
+        max_training_points
+            The maximum number of points in the training set, above which the oldest points are removed.
+        total_neighbors
+            The number of nearest training points the local Gaussian process is conditioned on.
+        nugget
+            The value added to the diagonal of the kernel matrix of the Gaussian process for numerical stability.
+        validation_fraction
+            The fraction of rejected instances which are evaluated exactly to measure the accuracy of the emulator.
+        seed
+            The seed of the random number generator which draws the rejected instances that are validated.
+        """
+        self.region_list = region_list
+        self.log_likelihood_window = log_likelihood_window
+        self.min_training_points = min_training_points
+        self.max_training_points = max_training_points
+        self.total_neighbors = total_neighbors
+        self.nugget = nugget
+        self.validation_fraction = validation_fraction
+
+        self._random = np.random.default_rng(seed)
+
+        self.parameter_list: List[np.ndarray] = []
+        self.profile_list: List[np.ndarray] = []
+        self.log_likelihood_list: List[float] = []
+        self.profile_log_likelihood_list: List[float] = []
+
+        self.best_profile_log_likelihood = -np.inf
+
+        self.total_exact = 0
+        self.total_emulated = 0
+        self.total_validated = 0
+        self.total_false_rejections = 0
+
+        self.profile_log_likelihood_error_list: List[float] = []
+
+    @property
+    def total_training_points(self) -> int:
+        return len(self.parameter_list)
+
+    def add_training_point(
+        self,
+        parameter_vector: np.ndarray,
+        profile: np.ndarray,
+        log_likelihood: float,
+        profile_log_likelihood: float,
+    ):
+        """
+        Add an exact evaluation to the training set of the emulator.
+
+        Parameters
+        ----------
+        parameter_vector
+            The parameters of the CTI model of the evaluation.
+        profile
+            The binned 1D profiles of the post-CTI data of the evaluation.
+        log_likelihood
+            The exact log likelihood of the evaluation.
+        profile_log_likelihood
+            The log likelihood of the binned 1D profiles of the evaluation.
+        """
+        if len(self.parameter_list) >= self.max_training_points:
+            del self.parameter_list[0]
+            del self.profile_list[0]
+            del self.log_likelihood_list[0]
+            del self.profile_log_likelihood_list[0]
+
+        self.parameter_list.append(np.asarray(parameter_vector, dtype="float"))
+        self.profile_list.append(np.asarray(profile, dtype="float"))
+        self.log_likelihood_list.append(log_likelihood)
+        self.profile_log_likelihood_list.append(profile_log_likelihood)
+
+        self.best_profile_log_likelihood = max(
+            self.best_profile_log_likelihood, profile_log_likelihood
+        )
+
+    def profile_from(self, parameter_vector: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Returns the binned 1D profiles predicted by the emulator for the parameters of a CTI model, and the
+        normalized variance of the prediction (which is 0 at a training point and 1 far from every training point).
+
+        The prediction is the mean of a Gaussian process with a squared exponential kernel conditioned on the
+        `total_neighbors` nearest training points, where parameters are standardized by the standard deviation of
+        the training set and the kernel length scale is the median distance between the nearest training points.
+
+        Parameters
+        ----------
+        parameter_vector
+            The parameters of the CTI model whose profiles are predicted.
+        """
+        parameter_array = np.asarray(self.parameter_list)
+        profile_array = np.asarray(self.profile_list)
+
+        parameter_mean = np.mean(parameter_array, axis=0)
+        parameter_scale = np.std(parameter_array, axis=0)
+        parameter_scale[parameter_scale == 0.0] = 1.0
+
+        parameter_array = (parameter_array - parameter_mean) / parameter_scale
+        parameter_vector = (
+            np.asarray(parameter_vector, dtype="float") - parameter_mean
+        ) / parameter_scale
+
+        distance_squared = np.sum((parameter_array - parameter_vector) ** 2.0, axis=1)
+
+        total_neighbors = min(self.total_neighbors, parameter_array.shape[0])
+
+        if total_neighbors < parameter_array.shape[0]:
+            index_array = np.argpartition(distance_squared, total_neighbors - 1)[
+                :total_neighbors
+            ]
+        else:
+            index_array = np.arange(parameter_array.shape[0])
+
+        neighbor_array = parameter_array[index_array]
+        neighbor_profile_array = profile_array[index_array]
+
+        neighbor_distance_squared = np.sum(
+            (neighbor_array[:, None, :] - neighbor_array[None, :, :]) ** 2.0, axis=2
+        )
+
+        length_scale_squared = (
+            np.median(neighbor_distance_squared[neighbor_distance_squared > 0.0])
+            if np.any(neighbor_distance_squared > 0.0)
+            else 1.0
+        )
+
+        kernel = np.exp(-0.5 * neighbor_distance_squared / length_scale_squared)
+        kernel[np.diag_indices_from(kernel)] += self.nugget
+
+        kernel_vector = np.exp(
+            -0.5 * distance_squared[index_array] / length_scale_squared
+        )
+
+        profile_mean = np.mean(neighbor_profile_array, axis=0)
+
+        cholesky = cho_factor(kernel)
+
+        weight_vector = cho_solve(cholesky, kernel_vector)
+
+        profile = profile_mean + weight_vector @ (neighbor_profile_array - profile_mean)
+
+        variance = max(1.0 - float(kernel_vector @ weight_vector), 0.0)
+
+        return profile, variance
+
+    def log_likelihood_from(
+        self,
+        parameter_vector: np.ndarray,
+        profile_log_likelihood_func: Callable[[np.ndarray], float],
+        log_likelihood_exact_func: Callable[[], Tuple[float, np.ndarray]],
+    ) -> float:
+        """
+        Returns the exact log likelihood of a proposal computed via arctic, or raises a `PriorException` if its
+        emulated profiles are far below the best fit (see the class docstring).
+
+        Parameters
+        ----------
+        parameter_vector
+            The parameters of the CTI model of the proposal (see `parameter_vector_from`).
+        profile_log_likelihood_func
+            A function returning the log likelihood of binned 1D profiles given the binned data.
+        log_likelihood_exact_func
+            A function returning the exact log likelihood of the proposal and the binned 1D profiles of its
+            post-CTI data, which calls arctic.
+        """
+        profile_log_likelihood_emulated = None
+        is_rejected = False
+
+        if self.total_training_points >= self.min_training_points:
+            profile, _ = self.profile_from(parameter_vector=parameter_vector)
+
+            profile_log_likelihood_emulated = profile_log_likelihood_func(profile)
+
+            is_rejected = profile_log_likelihood_emulated < (
+                self.best_profile_log_likelihood - self.log_likelihood_window
+            )
+
+            if is_rejected and self._random.random() >= self.validation_fraction:
+                self.total_emulated += 1
+
+                raise exc.PriorException(
+                    "The emulated profiles of the CTI model are far below the best fit."
+                )
+
+        log_likelihood, profile = log_likelihood_exact_func()
+
+        self.total_exact += 1
+
+        profile_log_likelihood = profile_log_likelihood_func(profile)
+
+        if profile_log_likelihood_emulated is not None:
+            self.profile_log_likelihood_error_list.append(
+                abs(profile_log_likelihood - profile_log_likelihood_emulated)
+            )
+
+        if is_rejected:
+            self.total_validated += 1
+
+            if profile_log_likelihood >= (
+                self.best_profile_log_likelihood - self.log_likelihood_window
+            ):
+                self.total_false_rejections += 1
+
+        self.add_training_point(
+            parameter_vector=parameter_vector,
+            profile=profile,
+            log_likelihood=log_likelihood,
+            profile_log_likelihood=profile_log_likelihood,
+        )
+
+        if is_rejected:
+            self.total_emulated += 1
+
+            raise exc.PriorException(
+                "The emulated profiles of the CTI model are far below the best fit."
+            )
+
+        return log_likelihood
+
+    def summary_dict(self) -> Dict[str, Union[int, float]]:
+        """
+        Returns the diagnostics of the emulator: the number of exact and emulated evaluations, the distribution of
+        the error of the emulated profile log likelihoods and the number of validated rejections which were false.
+        """
+        summary_dict = {
+            "total_exact": self.total_exact,
+            "total_emulated": self.total_emulated,
+            "total_training_points": self.total_training_points,
+            "total_validated": self.total_validated,
+            "total_false_rejections": self.total_false_rejections,
+        }
+
+        if self.profile_log_likelihood_error_list:
+            error_array = np.asarray(self.profile_log_likelihood_error_list)
+
+            summary_dict["profile_log_likelihood_error_p50"] = float(
+                np.percentile(error_array, 50.0)
+            )
+            summary_dict["profile_log_likelihood_error_p95"] = float(
+                np.percentile(error_array, 95.0)
+            )
+            summary_dict["profile_log_likelihood_error_max"] = float(
+                np.max(error_array)
+            )
+
+        return summary_dict
+
+    def output_to_json(self, file_path: Union[Path, str]):
+        """
+        Output the diagnostics of the emulator (see `summary_dict`) to a .json file.
+
+        Parameters
+        ----------
+        file_path
+            The path of the .json file the diagnostics are output to.
+        """
+        logger.info(
+            f"EMULATOR - {self.total_emulated} instances rejected via the emulator and {self.total_exact} evaluated "
+            f"via arctic."
+        )
+
+        with open(file_path, "w") as f:
+            json.dump(self.summary_dict(), f, indent=4)
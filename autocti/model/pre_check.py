@@ -0,0 +1,225 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from arcticpy import ROE
+
+from autocti import exc
+from autocti.model.model_util import CTI1D
+from autocti.model.model_util import CTI2D
+
+logger = logging.getLogger(__name__)
+
+
+def ccd_list_from(cti: Union[CTI1D, CTI2D]) -> List:
+    """
+    Returns the list of every CCD phase of a CTI model (e.g. the parallel and serial CCDs of a `CTI2D` object).
+
+    Parameters
+    ----------
+    cti
+        The CTI model whose CCD phases are returned.
+    """
+    if isinstance(cti, CTI1D):
+        ccd_list = [cti.ccd]
+    else:
+        ccd_list = [cti.parallel_ccd, cti.serial_ccd]
+
+    return [ccd for ccd in ccd_list if ccd is not None]
+
+
+class AbstractPreCheck:
+    name = None
+
+    def is_valid_from(self, cti: Union[CTI1D, CTI2D]) -> bool:
+        """
+        Returns whether a CTI model passes the check, where a model which fails the check is rejected before it is
+        clocked via arctic.
+
+        Parameters
+        ----------
+        cti
+            The CTI model of the instance proposed by the non-linear search.
+        """
+        raise NotImplementedError
+
+
+class PreCheckCCDWellFill(AbstractPreCheck):
+    name = "ccd_well_fill"
+
+    def __init__(self, well_fill_power_range: Tuple[float, float] = (0.0, 1.0)):
+        """
+        Checks the volume-filling behaviour of every CCD phase of a CTI model is physical, such that models whose
+        CCD would give a meaningless arctic output are rejected before they are clocked.
+
+        A CCD phase is physical if its full well depth is positive, its well notch depth is non-negative and below
+        the full well depth, and its well fill power is above the lower and at most the upper value of
+        `well_fill_power_range`.
+
+        Parameters
+        ----------
+        well_fill_power_range
+            The range of well fill powers which are physical, where the lower value is excluded and the upper value
+            is included.
+        """
+        self.well_fill_power_range = well_fill_power_range
+
+    def is_valid_from(self, cti: Union[CTI1D, CTI2D]) -> bool:
+        ccd_list = ccd_list_from(cti=cti)
+
+        if not ccd_list:
+            return True
+
+        full_well_depth = np.array([ccd.full_well_depth for ccd in ccd_list])
+        well_notch_depth = np.array([ccd.well_notch_depth for ccd in ccd_list])
+        well_fill_power = np.array([ccd.well_fill_power for ccd in ccd_list])
+
+        return bool(
+            np.all(
+                (full_well_depth > 0.0)
+                & (well_notch_depth >= 0.0)
+                & (well_notch_depth < full_well_depth)
+                & (well_fill_power > self.well_fill_power_range[0])
+                & (well_fill_power <= self.well_fill_power_range[1])
+            )
+        )
+
+
+class PreCheckTrapTimescales(AbstractPreCheck):
+    name = "trap_timescales"
+
+    def __init__(self, release_timescale_range: Tuple[float, float]):
+        """
+        Checks the release timescale of every trap species of a CTI model is within a range supplied by the user,
+        for example the range over which the priors of a previous fit placed the traps, or an upper limit on the
+        time charge is clocked for (see `from_roe`).
+
+        The range should only exclude release timescales which cannot produce the observed trails. A trap whose
+        release timescale is at or below the time of a single transfer still releases a fraction of its electrons
+        into the pixels which follow the charge and produces an EPER, therefore short release timescales should not
+        be excluded unless this is intended.
+
+        Parameters
+        ----------
+        release_timescale_range
+            The range of release timescales which are allowed, in the same units as the dwell times of the `ROE`.
+        """
+        self.release_timescale_range = release_timescale_range
+
+    @classmethod
+    def from_roe(cls, roe: ROE, total_pixels: int) -> "PreCheckTrapTimescales":
+        """
+        Returns the check where release timescales are allowed up to the time to clock charge over `total_pixels`
+        pixels (e.g. the number of rows of the CCD for parallel clocking), where the time of every transfer is the
+        sum of the dwell times of the read-out electronics.
+
+        There is no lower limit, because traps with release timescales of a transfer or less still produce trails.
+
+        Parameters
+        ----------
+        roe
+            The read-out electronics of the clocker, whose dwell times set the time of a transfer.
+        total_pixels
+            The number of pixels over which charge is clocked.
+        """
+        transfer_time = float(np.sum(roe.dwell_times))
+
+        return PreCheckTrapTimescales(
+            release_timescale_range=(0.0, total_pixels * transfer_time)
+        )
+
+    def is_valid_from(self, cti: Union[CTI1D, CTI2D]) -> bool:
+        trap_list = cti.trap_all_list
+
+        if not trap_list:
+            return True
+
+        release_timescale = np.array([trap.release_timescale for trap in trap_list])
+
+        return bool(
+            np.all(
+                (release_timescale >= self.release_timescale_range[0])
+                & (release_timescale <= self.release_timescale_range[1])
+            )
+        )
+
+
+class PreCheckPipeline:
+    def __init__(self, pre_check_list: List[AbstractPreCheck]):
+        """
+        A pipeline of inexpensive checks of the physical plausibility of a CTI model (e.g. `PreCheckCCDWellFill`,
+        `PreCheckTrapTimescales`), which the log likelihood function of an analysis performs on every instance
+        proposed by the non-linear search before it is clocked via arctic.
+
+        If a check fails a `PriorException` is raised, such that the non-linear search resamples the instance in
+        the same way as for the total trap density check of the `settings_cti`. In searches with wide priors many
+        proposals are non-physical, therefore rejecting them before clocking removes every arctic call they would
+        otherwise cost.
+
+        The number of instances rejected by every check is counted, and output to the `files` folder of the search
+        (`pre_check.json`) when the model-fit finishes.
+
+        Parameters
+        ----------
+        pre_check_list
+            The checks which are performed, in order, where an instance is rejected by the first check it fails.
+        """
+        self.pre_check_list = pre_check_list
+
+        self.total_checked = 0
+        self.rejection_count_dict: Dict[str, int] = {
+            pre_check.name: 0 for pre_check in pre_check_list
+        }
+
+    def check(self, cti: Union[CTI1D, CTI2D]):
+        """
+        Perform every check on a CTI model, raising a `PriorException` if it fails any check.
+
+        Parameters
+        ----------
+        cti
+            The CTI model of the instance proposed by the non-linear search.
+        """
+        self.total_checked += 1
+
+        for pre_check in self.pre_check_list:
+            if not pre_check.is_valid_from(cti=cti):
+                self.rejection_count_dict[pre_check.name] += 1
+
+                raise exc.PriorException(
+                    f"CTI model rejected by the pre-check {pre_check.name}."
+                )
+
+    @property
+    def total_rejected(self) -> int:
+        return sum(self.rejection_count_dict.values())
+
+    def summary_dict(self) -> Dict[str, Union[int, Dict[str, int]]]:
+        """
+        Returns the number of instances checked, the number rejected and the number rejected by every check.
+        """
+        return {
+            "total_checked": self.total_checked,
+            "total_rejected": self.total_rejected,
+            "rejection_count_dict": dict(self.rejection_count_dict),
+        }
+
+    def output_to_json(self, file_path: Union[Path, str]):
+        """
+        Output the number of instances rejected by every check (see `summary_dict`) to a .json file.
+
+        Parameters
+        ----------
+        file_path
+            The path of the .json file the summary is output to.
+        """
+        logger.info(
+            f"PRE-CHECK - {self.total_rejected} of {self.total_checked} instances rejected before clocking "
+            f"({self.rejection_count_dict})."
+        )
+
+        with open(file_path, "w") as f:
+            json.dump(self.summary_dict(), f, indent=4)
@@ -0,0 +1,146 @@
+import json
+import time
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+
+class LikelihoodProfiler:
+    def __init__(self):
+        """
+        Records the run time of every stage of the log likelihood function of a CTI model-fit, such that where the
+        time of a model-fit is spent can be inspected without editing any code.
+
+        The profiler is passed to an analysis (e.g. `AnalysisImagingCI(profiler=LikelihoodProfiler())`), which
+        times every call of its log likelihood function and shares the profiler with its clocker. The following
+        stages are timed:
+
+        - `density_check`: checking the total trap density of the model is within the range of the `settings_cti`.
+        - `pre_check`: the checks of the physical plausibility of the model of a `PreCheckPipeline`.
+        - `fast_gather`: extracting the unique columns or rows of the data which are clocked in a fast mode.
+        - `arctic_parallel`: parallel clocking via arctic.
+        - `arctic_serial`: serial clocking via arctic.
+        - `arctic`: parallel and serial clocking via a single call to arctic (when neither fast mode is used).
+        - `fast_scatter`: copying the output columns or rows of arctic to every column or row of the data.
+        - `noise_map`: computing the scaling of the noise-map by the hyper noise components of the model.
+        - `chi_squared`: computing the chi-squared (and for hyper noise the noise normalization) of the fit, which
+          if the unmasked pixels are not preloaded includes creating the fit and its noise-map.
+        - `total`: the full log likelihood function.
+
+        The time of every stage is summed over a call of the log likelihood function and stored per call in a
+        compact `array`, such that the overhead per call is a few calls to `time.perf_counter`. The distribution
+        (median, 95th percentile and maximum) of every stage is returned by `summary_dict` and output to the
+        `files` folder of the search (`likelihood_profile.json`) when the model-fit finishes.
+
+        If the non-linear search parallelizes the log likelihood function over processes, every process times its
+        own copy of the analysis and only the calls in the main process are recorded.
+        """
+        self.time_array_dict: Dict[str, array] = {}
+
+        self._call_time_dict: Optional[Dict[str, float]] = None
+
+    def _add(self, name: str, time_seconds: float):
+        try:
+            self.time_array_dict[name].append(time_seconds)
+        except KeyError:
+            self.time_array_dict[name] = array("d", [time_seconds])
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Time the code executed within the context as the stage `name` of the log likelihood function.
+
+        If the stage is executed multiple times in a call of the log likelihood function (e.g. a fast mode which
+        performs parallel and serial gathers) the times are summed.
+
+        Parameters
+        ----------
+        name
+            The name of the stage which is timed (e.g. `arctic_parallel`).
+        """
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            time_seconds = time.perf_counter() - start
+
+            if self._call_time_dict is None:
+                self._add(name=name, time_seconds=time_seconds)
+            else:
+                self._call_time_dict[name] = (
+                    self._call_time_dict.get(name, 0.0) + time_seconds
+                )
+
+    @contextmanager
+    def call(self):
+        """
+        Time a call of the log likelihood function, where the time of every stage executed within the context is
+        summed and recorded once the call ends, including calls which raise an exception (e.g. a `PriorException`
+        raised by the density check).
+        """
+        if self._call_time_dict is not None:
+            yield
+            return
+
+        self._call_time_dict = {}
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            time_seconds = time.perf_counter() - start
+
+            call_time_dict = self._call_time_dict
+            self._call_time_dict = None
+
+            for name, stage_time_seconds in call_time_dict.items():
+                self._add(name=name, time_seconds=stage_time_seconds)
+
+            self._add(name="total", time_seconds=time_seconds)
+
+    @property
+    def total_calls(self) -> int:
+        try:
+            return len(self.time_array_dict["total"])
+        except KeyError:
+            return 0
+
+    def summary_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the distribution of the times of every stage, in seconds, as a dictionary mapping the name of every
+        stage to its number of calls, total time, mean, median (p50), 95th percentile (p95) and maximum.
+        """
+        summary_dict = {}
+
+        for name, time_array in self.time_array_dict.items():
+            time_seconds = np.frombuffer(time_array, dtype="float")
+
+            p50, p95 = np.percentile(time_seconds, [50.0, 95.0])
+
+            summary_dict[name] = {
+                "calls": int(time_seconds.shape[0]),
+                "total": float(np.sum(time_seconds)),
+                "mean": float(np.mean(time_seconds)),
+                "p50": float(p50),
+                "p95": float(p95),
+                "max": float(np.max(time_seconds)),
+            }
+
+        return summary_dict
+
+    def output_to_json(self, file_path: Union[Path, str]):
+        """
+        Output the summary of the times of every stage (see `summary_dict`) to a .json file.
+
+        Parameters
+        ----------
+        file_path
+            The path of the .json file the summary is output to.
+        """
+        with open(file_path, "w") as f:
+            json.dump(self.summary_dict(), f, indent=4)
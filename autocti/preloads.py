@@ -1,15 +1,24 @@
 import numpy as np
-from typing import Optional
+from typing import List, Optional
 
 
 class Preloads:
     def __init__(
         self,
-        parallel_fast_index_list: Optional[np.ndarray] = None,
-        parallel_fast_column_lists: Optional[np.ndarray] = None,
-        serial_fast_index_list: Optional[np.ndarray] = None,
-        serial_fast_row_lists: Optional[np.ndarray] = None,
+        parallel_fast_index_array: Optional[np.ndarray] = None,
+        parallel_fast_inverse_array: Optional[np.ndarray] = None,
+        serial_fast_index_array: Optional[np.ndarray] = None,
+        serial_fast_inverse_array: Optional[np.ndarray] = None,
         noise_normalization: Optional[float] = None,
+        window_row_index_array: Optional[np.ndarray] = None,
+        window_column_index_array: Optional[np.ndarray] = None,
+        unmasked_index_array: Optional[np.ndarray] = None,
+        data_unmasked: Optional[np.ndarray] = None,
+        inverse_variance_unmasked: Optional[np.ndarray] = None,
+        noise_map_unmasked: Optional[np.ndarray] = None,
+        noise_scaling_key_list: Optional[List[str]] = None,
+        noise_scaling_stack: Optional[np.ndarray] = None,
+        data_fingerprint: Optional[str] = None,
     ):
         """
         Class which offers a concise API for settings up the preloads, which before a model-fit are set up via
@@ -21,34 +30,70 @@ class Preloads:
         which store unique columns and map them to the post-CTI data can be preloaded in memory to avoid repeated
         calculations in the likelihood function.
 
+        The indexes are stored as compact `np.int32` arrays, such that extracting the unique columns from the
+        pre-cti data (a gather) and mapping the reduced arCTIc output to the post-CTI data (a scatter) are each a
+        single NumPy fancy-indexing operation.
 
         Parameters
         ----------
-        parallel_fast_index_list
-            The index of a column that is repeated in the pre-cti data. This index corresponds to the first index
+        parallel_fast_index_array
+            The index of every unique column in the pre-cti data. This index corresponds to the first index
             of the repeated columns and this array used to extract the columns from the pre-cti data which are passed
             to arctic.
-        parallel_fast_column_lists
-            The mapping of every repeated column in `parallel_fast_index_list`  to all other columns which are identical.
-             This is used to map the reduced arCTIc output to the post-CTI data.
-        serial_fast_index_list
-            The index of a row that is repeated in the pre-cti data. This index corresponds to the first index
+        parallel_fast_inverse_array
+            For every column of the pre-cti data, the index of the unique column in `parallel_fast_index_array` it is
+            identical to. This is used to map the reduced arCTIc output to the post-CTI data.
+        serial_fast_index_array
+            The index of every unique row in the pre-cti data. This index corresponds to the first index
             of the repeated rows and this array used to extract the rows from the pre-cti data which are passed
             to arctic.
-        serial_fast_row_lists
-            The mapping of every repeated row in `serial_fast_index_list`  to all other rows which are identical.
-            This is used to map the reduced arCTIc output to the post-CTI data.
+        serial_fast_inverse_array
+            For every row of the pre-cti data, the index of the unique row in `serial_fast_index_array` it is
+            identical to. This is used to map the reduced arCTIc output to the post-CTI data.
         noise_normalization
             The noise normalization term of the log likelihood function evaluated in `Analysis` objects. If the
             noise-map is fixed, this can be preloaded as it does not change.
+        window_row_index_array
+            The index of every row of the data containing an unmasked pixel, which if the clocker's `window_from_mask`
+            is on is used to clock only the pixels which influence the unmasked pixels.
+        window_column_index_array
+            The index of every column of the data containing an unmasked pixel, which if the clocker's
+            `window_from_mask` is on is used to clock only the pixels which influence the unmasked pixels.
+        unmasked_index_array
+            The flat index of every unmasked pixel of the data in its native 2D array. If the noise-map is fixed, this
+            is used to compute the chi-squared from only the unmasked pixels of the model data.
+        data_unmasked
+            The data of every unmasked pixel, as a contiguous 1D array.
+        inverse_variance_unmasked
+            The inverse variance (1.0 / noise**2.0) of every unmasked pixel, as a contiguous 1D array.
+        noise_map_unmasked
+            The noise-map of every unmasked pixel, as a contiguous 1D array, which is scaled by hyper noise to
+            compute the noise-map of every fit if hyper noise is on.
+        noise_scaling_key_list
+            The keys of the noise-scaling maps in `noise_scaling_stack`, in the order they are stacked.
+        noise_scaling_stack
+            The noise-scaling maps of every unmasked pixel, stacked into a 2D array of shape (K, n_unmasked), such
+            that the hyper noise scaled noise-map of every fit is a single matrix-vector product.
+        data_fingerprint
+            The fingerprint of the pre-CTI data which is clocked, which if the clocker's cache is on is used in the
+            cache key of every post-CTI image instead of hashing the data on every call.
 
         Returns
         -------
         Preloads
             The preloads object used to skip certain calculations in the log likelihood function.
         """
-        self.parallel_fast_index_list = parallel_fast_index_list
-        self.parallel_fast_column_lists = parallel_fast_column_lists
-        self.serial_fast_index_list = serial_fast_index_list
-        self.serial_fast_row_lists = serial_fast_row_lists
+        self.parallel_fast_index_array = parallel_fast_index_array
+        self.parallel_fast_inverse_array = parallel_fast_inverse_array
+        self.serial_fast_index_array = serial_fast_index_array
+        self.serial_fast_inverse_array = serial_fast_inverse_array
         self.noise_normalization = noise_normalization
+        self.window_row_index_array = window_row_index_array
+        self.window_column_index_array = window_column_index_array
+        self.unmasked_index_array = unmasked_index_array
+        self.data_unmasked = data_unmasked
+        self.inverse_variance_unmasked = inverse_variance_unmasked
+        self.noise_map_unmasked = noise_map_unmasked
+        self.noise_scaling_key_list = noise_scaling_key_list
+        self.noise_scaling_stack = noise_scaling_stack
+        self.data_fingerprint = data_fingerprint
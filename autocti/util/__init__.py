@@ -11,6 +11,7 @@ from autoarray.fit import fit_util as fit
 from autocti.model import model_util as model
 from autocti.extract.two_d import extract_2d_util as extract_2d
 from autocti.charge_injection import ci_util as ci
+from autocti.clocker import clocker_util as clocker
 
 from pkgutil import extend_path
 
@@ -0,0 +1,102 @@
+"""
+Benchmark of coarse-to-fine log likelihood evaluation via `AdaptiveExpress`, where proposals of a non-linear search
+are first evaluated with a coarse arctic express and only proposals close to the best fit are re-evaluated with the
+clocker's exact express.
+
+A charge injection imaging dataset is simulated and a sequence of proposals is evaluated that mimics a search: early
+proposals are scattered widely around the true model and later proposals contract towards it. The wall-clock time of
+evaluating every proposal with and without `AdaptiveExpress` is printed, alongside the number of coarse and exact
+evaluations and the largest coarse vs exact log likelihood difference of the reference evaluations.
+
+Run via:
+
+ python benchmarks/adaptive_express.py
+"""
+
+import time
+
+import numpy as np
+
+import autofit as af
+import autocti as ac
+
+shape_native = (500, 200)
+total_proposals = 200
+
+parallel_express = 0
+parallel_express_coarse = 2
+
+layout = ac.Layout2DCI(
+    shape_2d=shape_native,
+    region_list=[(10, 110, 10, 190), (210, 310, 10, 190), (410, 490, 10, 190)],
+)
+
+clocker = ac.Clocker2D(parallel_express=parallel_express)
+
+ccd = ac.CCDPhase(well_fill_power=0.58, well_notch_depth=0.0, full_well_depth=200000.0)
+
+simulator = ac.SimulatorImagingCI(read_noise=4.0, pixel_scales=0.1, norm=10000.0)
+
+dataset = simulator.via_layout_from(
+    clocker=clocker,
+    layout=layout,
+    cti=ac.CTI2D(
+        parallel_trap_list=[ac.TrapInstantCapture(density=1.0, release_timescale=3.0)],
+        parallel_ccd=ccd,
+    ),
+)
+
+model = af.Collection(
+    cti=af.Model(
+        ac.CTI2D,
+        parallel_trap_list=[af.Model(ac.TrapInstantCapture)],
+        parallel_ccd=ccd,
+    )
+)
+
+rng = np.random.default_rng(seed=1)
+
+instance_list = []
+
+for i in range(total_proposals):
+    scatter = 0.5 * (1.0 - i / total_proposals) + 0.01
+
+    instance_list.append(
+        model.instance_from_vector(
+            vector=[
+                abs(1.0 + scatter * rng.normal()),
+                abs(3.0 + 3.0 * scatter * rng.normal()),
+            ]
+        )
+    )
+
+for adaptive_express in [
+    None,
+    ac.AdaptiveExpress(
+        parallel_express=parallel_express_coarse,
+        log_likelihood_window=100.0,
+        log_likelihood_error_bound=1.0,
+    ),
+]:
+    analysis = ac.AnalysisImagingCI(
+        dataset=dataset, clocker=clocker, adaptive_express=adaptive_express
+    )
+
+    start = time.time()
+
+    for instance in instance_list:
+        analysis.log_likelihood_function(instance=instance)
+
+    run_time = time.time() - start
+
+    if adaptive_express is None:
+        print(f"Exact Express: {run_time:.3f}s")
+        continue
+
+    print(
+        f"Adaptive Express: {run_time:.3f}s, "
+        f"Coarse Evaluations = {adaptive_express.total_coarse}, "
+        f"Exact Evaluations = {adaptive_express.total_exact}, "
+        f"Switched To Exact = {adaptive_express.is_exact}, "
+        f"Max Reference Error = {max(adaptive_express.log_likelihood_error_list, default=0.0):.4f}"
+    )
@@ -0,0 +1,108 @@
+"""
+Benchmark of the unique-stripe search used by the fast modes of `Clocker2D`.
+
+Compares the stripe-by-stripe Python loop previously used by `Clocker2D.fast_indexes_from` with the vectorized
+`clocker_util.fast_index_array_and_inverse_from`, on a charge injection image with non-uniform injection across
+columns (so that many columns are unique) and uniform injection across columns.
+
+Run via:
+
+ python benchmarks/clocker_fast_indexes.py
+"""
+import time
+
+import numpy as np
+
+from autocti.clocker import clocker_util
+
+shape_native = (2086, 2128)
+total_unique_columns = 500
+repeats = 3
+
+
+def fast_indexes_via_loop_from(data, for_parallel):
+    if for_parallel:
+        total_stripes = data.shape[1]
+    else:
+        total_stripes = data.shape[0]
+
+    fast_index_list = []
+    fast_column_lists = []
+
+    unchecked_list = range(0, total_stripes)
+
+    for stripe_index in range(total_stripes):
+        paired = False
+
+        pair_list = []
+        unchecked_list_new = []
+
+        if stripe_index in unchecked_list:
+            for pair_index in unchecked_list:
+                if for_parallel:
+                    residual_map = np.abs(data[:, stripe_index] - data[:, pair_index])
+                else:
+                    residual_map = np.abs(data[stripe_index, :] - data[pair_index, :])
+
+                if np.all(residual_map < 1.0e-8):
+                    if not paired:
+                        fast_index_list.append(stripe_index)
+
+                    paired = True
+
+                    pair_list.append(pair_index)
+
+                else:
+                    unchecked_list_new.append(pair_index)
+
+            fast_column_lists.append(pair_list)
+            unchecked_list = unchecked_list_new
+
+    return fast_index_list, fast_column_lists
+
+
+def pre_cti_data_from(total_unique_columns):
+    rng = np.random.default_rng(seed=1)
+
+    norm_list = rng.normal(loc=10000.0, scale=100.0, size=total_unique_columns)
+    column_norms = norm_list[rng.integers(0, total_unique_columns, shape_native[1])]
+
+    pre_cti_data = np.zeros(shape_native)
+
+    for y0 in range(10, shape_native[0] - 200, 300):
+        pre_cti_data[y0 : y0 + 100, :] = column_norms
+
+    return pre_cti_data
+
+
+def time_from(func, **kwargs):
+    start = time.time()
+
+    for i in range(repeats):
+        func(**kwargs)
+
+    return (time.time() - start) / repeats
+
+
+for unique_columns in [1, total_unique_columns]:
+    pre_cti_data = pre_cti_data_from(total_unique_columns=unique_columns)
+
+    print(f"Image Shape {shape_native}, {unique_columns} Unique Column Values")
+
+    for for_parallel in [True, False]:
+        time_loop = time_from(
+            fast_indexes_via_loop_from, data=pre_cti_data, for_parallel=for_parallel
+        )
+        time_vectorized = time_from(
+            clocker_util.fast_index_array_and_inverse_from,
+            array=pre_cti_data,
+            for_parallel=for_parallel,
+        )
+
+        print(
+            f"for_parallel={for_parallel}: Loop {time_loop:.4f}s, "
+            f"Vectorized {time_vectorized:.4f}s, "
+            f"Speed Up {time_loop / time_vectorized:.1f}x"
+        )
+
+    print()
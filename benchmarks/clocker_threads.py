@@ -0,0 +1,73 @@
+"""
+Benchmark of the multi-threaded clocking of `Clocker2D`, which splits the image into blocks of columns (parallel
+clocking) and rows (serial clocking) that are clocked concurrently via arctic on a thread pool.
+
+The run time of `Clocker2D.add_cti` is printed for an increasing number of threads on a Euclid quadrant sized charge
+injection image, alongside a check that the output is identical to the single threaded output.
+
+Run via:
+
+ python benchmarks/clocker_threads.py
+"""
+import os
+import time
+
+import numpy as np
+
+import autocti as ac
+
+shape_native = (2086, 2128)
+repeats = 3
+
+pre_cti_data = np.zeros(shape_native)
+
+for y0 in range(10, shape_native[0] - 200, 300):
+    pre_cti_data[y0 : y0 + 100, 51:2099] = 10000.0
+
+pre_cti_data = ac.Array2D.no_mask(values=pre_cti_data, pixel_scales=0.1).native
+
+ccd = ac.CCDPhase(well_fill_power=0.58, well_notch_depth=0.0, full_well_depth=200000.0)
+
+trap_list = [
+    ac.TrapInstantCapture(density=0.13, release_timescale=1.25),
+    ac.TrapInstantCapture(density=0.25, release_timescale=4.4),
+]
+
+cti = ac.CTI2D(
+    parallel_trap_list=trap_list,
+    parallel_ccd=ccd,
+    serial_trap_list=trap_list,
+    serial_ccd=ccd,
+)
+
+n_threads_list = [1, 2, 4, 8, 16, 32, 64]
+n_threads_list = [
+    n_threads for n_threads in n_threads_list if n_threads <= os.cpu_count()
+]
+
+image_post_cti_single = None
+time_single = None
+
+for n_threads in n_threads_list:
+    clocker = ac.Clocker2D(parallel_express=5, serial_express=5, n_threads=n_threads)
+
+    start = time.time()
+
+    for i in range(repeats):
+        image_post_cti = clocker.add_cti(data=pre_cti_data, cti=cti)
+
+    run_time = (time.time() - start) / repeats
+
+    if image_post_cti_single is None:
+        image_post_cti_single = image_post_cti
+        time_single = run_time
+
+    identical = np.array_equal(
+        np.asarray(image_post_cti), np.asarray(image_post_cti_single)
+    )
+
+    print(
+        f"n_threads={n_threads}: {run_time:.3f}s, "
+        f"Speed Up {time_single / run_time:.2f}x, "
+        f"Identical To Single Thread = {identical}"
+    )
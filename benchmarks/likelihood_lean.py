@@ -0,0 +1,109 @@
+"""
+Per-call microbenchmark of the figure of merit computed by `AnalysisImagingCI`, comparing the full `FitImagingCI`
+object to the lean path of `AnalysisImagingCI.figure_of_merit_from`, which after `modify_before_fit` computes the
+log likelihood from the preloaded NumPy arrays of the unmasked pixels and a preallocated residual buffer.
+
+The post-CTI data is computed once, such that only the cost of the likelihood calculation (and not of clocking via
+arctic) is timed. Both a fixed noise-map and a noise-map scaled by hyper noise are benchmarked and the mean time of
+a single call is printed for each.
+
+Run via:
+
+ python benchmarks/likelihood_lean.py
+"""
+
+import time
+
+import autofit as af
+import autocti as ac
+
+shape_native = (2086, 2128)
+total_calls = 20
+
+layout = ac.Layout2DCI(
+    shape_2d=shape_native,
+    region_list=[(100, 300, 100, 2000), (900, 1100, 100, 2000)],
+)
+
+clocker = ac.Clocker2D(parallel_express=2)
+
+ccd = ac.CCDPhase(well_fill_power=0.58, well_notch_depth=0.0, full_well_depth=200000.0)
+
+simulator = ac.SimulatorImagingCI(read_noise=4.0, pixel_scales=0.1, norm=10000.0)
+
+cti = ac.CTI2D(
+    parallel_trap_list=[ac.TrapInstantCapture(density=1.0, release_timescale=3.0)],
+    parallel_ccd=ccd,
+)
+
+dataset = simulator.via_layout_from(clocker=clocker, layout=layout, cti=cti)
+
+dataset.set_noise_scaling_map_dict(
+    noise_scaling_map_dict={
+        "parallel_eper": ac.Array2D.ones(shape_native=shape_native, pixel_scales=0.1)
+    }
+)
+
+post_cti_data = clocker.add_cti(data=dataset.pre_cti_data, cti=cti)
+
+for name, model in [
+    (
+        "Fixed Noise",
+        af.Collection(
+            cti=af.Model(
+                ac.CTI2D, parallel_trap_list=[ac.TrapInstantCapture], parallel_ccd=ccd
+            )
+        ),
+    ),
+    (
+        "Hyper Noise",
+        af.Collection(
+            cti=af.Model(
+                ac.CTI2D, parallel_trap_list=[ac.TrapInstantCapture], parallel_ccd=ccd
+            ),
+            hyper_noise=af.Model(
+                ac.HyperCINoiseCollection, parallel_eper=ac.HyperCINoiseScalar
+            ),
+        ),
+    ),
+]:
+    analysis = ac.AnalysisImagingCI(dataset=dataset, clocker=clocker)
+    analysis.modify_before_fit(paths=af.DirectoryPaths(), model=model)
+
+    instance = model.instance_from_prior_medians()
+
+    hyper_noise_scalar_dict = (
+        instance.hyper_noise.as_dict if hasattr(instance, "hyper_noise") else None
+    )
+
+    def figure_of_merit_via_fit():
+        return ac.FitImagingCI(
+            dataset=dataset,
+            post_cti_data=post_cti_data,
+            hyper_noise_scalar_dict=hyper_noise_scalar_dict,
+        ).figure_of_merit
+
+    def figure_of_merit_via_lean():
+        return analysis.figure_of_merit_from(
+            instance=instance, post_cti_data=post_cti_data
+        )
+
+    start = time.time()
+
+    for i in range(total_calls):
+        figure_of_merit_via_fit()
+
+    time_via_fit = (time.time() - start) / total_calls
+
+    start = time.time()
+
+    for i in range(total_calls):
+        figure_of_merit_via_lean()
+
+    time_via_lean = (time.time() - start) / total_calls
+
+    print(
+        f"{name}: FitImagingCI = {1000.0 * time_via_fit:.3f}ms per call, "
+        f"Lean = {1000.0 * time_via_lean:.3f}ms per call, "
+        f"Speed Up = {time_via_fit / time_via_lean:.1f}x"
+    )
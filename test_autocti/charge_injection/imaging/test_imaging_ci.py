@@ -334,6 +334,106 @@ def test__fpr_value():
     assert dataset.fpr_value == pytest.approx(1.0, 1.0e-4)
 
 
+def test__derived_quantities__cached_and_invalidated_by_data():
+    data = ac.Array2D.full(fill_value=1.0, shape_native=(5, 5), pixel_scales=(1.0, 1.0))
+    noise_map = ac.Array2D.ones(
+        shape_native=data.shape_native, pixel_scales=data.pixel_scales
+    )
+
+    layout = ac.Layout2DCI(shape_2d=data.shape_native, region_list=[(1, 4, 1, 4)])
+
+    dataset = ac.ImagingCI(
+        data=data, noise_map=noise_map, pre_cti_data=data, layout=layout
+    )
+
+    assert dataset.norm_columns_list == [1.0, 1.0, 1.0]
+    assert dataset.norm_columns_list is dataset.norm_columns_list
+    assert dataset.fpr_value == pytest.approx(1.0, 1.0e-4)
+
+    dataset.data = ac.Array2D.full(
+        fill_value=2.0, shape_native=(5, 5), pixel_scales=(1.0, 1.0)
+    ).native
+
+    assert dataset.norm_columns_list == [2.0, 2.0, 2.0]
+    assert dataset.fpr_value == pytest.approx(2.0, 1.0e-4)
+    assert dataset.pre_cti_data_residual_map.native == pytest.approx(
+        np.ones((5, 5)), 1.0e-4
+    )
+
+
+def test__apply_mask__fpr_value_and_derived_quantities_carried_over():
+    values = np.ones((5, 5))
+    values[2:4, 2] = 5.0
+
+    data = ac.Array2D.no_mask(values=values, pixel_scales=(1.0, 1.0))
+    noise_map = ac.Array2D.ones(
+        shape_native=data.shape_native, pixel_scales=data.pixel_scales
+    )
+
+    layout = ac.Layout2DCI(shape_2d=data.shape_native, region_list=[(1, 4, 1, 4)])
+
+    dataset = ac.ImagingCI(
+        data=data, noise_map=noise_map, pre_cti_data=data, layout=layout
+    )
+
+    mask = np.full(shape=(5, 5), fill_value=False)
+    mask[2:4, 2] = True
+
+    dataset_masked = dataset.apply_mask(
+        mask=ac.Mask2D(mask=mask, pixel_scales=data.pixel_scales)
+    )
+
+    assert dataset_masked.norm_columns_list == [1.0, 1.0, 1.0]
+    assert dataset_masked.fpr_value == pytest.approx(7.0 / 3.0, 1.0e-2)
+    assert dataset.fpr_value == pytest.approx(7.0 / 3.0, 1.0e-2)
+
+    norm_columns_list = dataset.norm_columns_list
+
+    dataset_same_mask = dataset.apply_mask(
+        mask=ac.Mask2D.all_false(shape_native=(5, 5), pixel_scales=(1.0, 1.0))
+    )
+
+    assert dataset_same_mask.norm_columns_list is norm_columns_list
+    assert dataset_same_mask.fpr_value == pytest.approx(7.0 / 3.0, 1.0e-2)
+
+
+def test__apply_settings__fpr_value_not_computed(imaging_ci_7x7, monkeypatch):
+    values = np.ones((7, 7))
+    values[1:5, 4] = 5.0
+
+    dataset = ac.ImagingCI(
+        data=ac.Array2D.no_mask(values=values, pixel_scales=(1.0, 1.0)),
+        noise_map=imaging_ci_7x7.noise_map,
+        pre_cti_data=imaging_ci_7x7.pre_cti_data,
+        layout=imaging_ci_7x7.layout,
+    )
+
+    median_list_from = ac.Extract2DParallelFPR.median_list_from
+
+    median_call_list = []
+
+    def median_list_from_recorded(self, *args, **kwargs):
+        median_call_list.append(kwargs)
+        return median_list_from(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        ac.Extract2DParallelFPR, "median_list_from", median_list_from_recorded
+    )
+
+    dataset_parallel = dataset.apply_settings(
+        settings=ac.SettingsImagingCI(parallel_pixels=(0, 1))
+    )
+    dataset_serial = dataset.apply_settings(
+        settings=ac.SettingsImagingCI(serial_pixels=(0, 1))
+    )
+
+    assert median_call_list == []
+
+    assert dataset_parallel.fpr_value == pytest.approx(2.0, 1.0e-4)
+    assert dataset_serial.fpr_value == pytest.approx(2.0, 1.0e-4)
+    assert len(median_call_list) == 2
+
+
 def test__set_noise_scaling_map_dict(imaging_ci_7x7, ci_noise_scaling_map_dict_7x7):
     imaging_ci_7x7.noise_scaling_map_dict = None
 
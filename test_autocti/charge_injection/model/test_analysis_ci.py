@@ -1,10 +1,12 @@
 import copy
+import numpy as np
 import os
 import pytest
 
 import autofit as af
 import autocti as ac
 
+from autocti import exc
 from autofit.non_linear.mock.mock_search import MockSearch
 from autocti.charge_injection.model.result import ResultImagingCI
 
@@ -20,6 +22,28 @@ def test__modify_before_fit__noise_normalization_preload(
     analysis.modify_before_fit(paths=af.DirectoryPaths(), model=model)
 
     assert analysis.preloads.noise_normalization == pytest.approx(157.984399, 1.0e-4)
+    assert analysis.preloads.unmasked_index_array.shape == (
+        np.sum(~np.asarray(imaging_ci_7x7.mask)),
+    )
+    assert analysis.preloads.inverse_variance_unmasked == pytest.approx(
+        1.0
+        / np.asarray(imaging_ci_7x7.noise_map.native)[~np.asarray(imaging_ci_7x7.mask)]
+        ** 2.0,
+        1.0e-8,
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    fit = analysis.fit_via_instance_from(instance=instance)
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        ac.FitImagingCI(
+            dataset=imaging_ci_7x7,
+            post_cti_data=fit.post_cti_data,
+            hyper_noise_scalar_dict=None,
+        ).figure_of_merit,
+        1.0e-8,
+    )
 
     model = af.Collection(
         cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
@@ -30,6 +54,81 @@ def test__modify_before_fit__noise_normalization_preload(
     analysis.modify_before_fit(paths=af.DirectoryPaths(), model=model)
 
     assert analysis.preloads.noise_normalization == None
+    assert analysis.preloads.inverse_variance_unmasked == None
+    assert analysis.preloads.noise_scaling_key_list == ["parallel_eper", "serial_eper"]
+    assert analysis.preloads.noise_scaling_stack.shape == (
+        2,
+        np.sum(~np.asarray(imaging_ci_7x7.mask)),
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    fit = analysis.fit_via_instance_from(instance=instance)
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        ac.FitImagingCI(
+            dataset=imaging_ci_7x7,
+            post_cti_data=fit.post_cti_data,
+            hyper_noise_scalar_dict=instance.hyper_noise.as_dict,
+        ).figure_of_merit,
+        1.0e-8,
+    )
+
+
+def test__figure_of_merit_from__reuses_buffers(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+    )
+
+    analysis = ac.AnalysisImagingCI(dataset=imaging_ci_7x7, clocker=parallel_clocker_2d)
+    analysis.modify_before_fit(paths=af.DirectoryPaths(), model=model)
+
+    instance = model.instance_from_unit_vector([])
+
+    fit = analysis.fit_via_instance_from(instance=instance)
+
+    figure_of_merit = analysis.figure_of_merit_from(
+        instance=instance, post_cti_data=fit.post_cti_data
+    )
+
+    residual_buffer = analysis.residual_buffer
+
+    assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+    assert residual_buffer.shape == analysis.preloads.data_unmasked.shape
+
+    figure_of_merit = analysis.figure_of_merit_from(
+        instance=instance, post_cti_data=fit.post_cti_data
+    )
+
+    assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+    assert analysis.residual_buffer is residual_buffer
+
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+        hyper_noise=af.Model(ac.HyperCINoiseCollection),
+    )
+
+    analysis = ac.AnalysisImagingCI(dataset=imaging_ci_7x7, clocker=parallel_clocker_2d)
+    analysis.modify_before_fit(paths=af.DirectoryPaths(), model=model)
+
+    instance = model.instance_from_unit_vector([])
+
+    fit = analysis.fit_via_instance_from(instance=instance)
+
+    figure_of_merit = analysis.figure_of_merit_from(
+        instance=instance, post_cti_data=fit.post_cti_data
+    )
+
+    noise_variance_buffer = analysis.noise_variance_buffer
+
+    assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+    assert noise_variance_buffer.shape == analysis.preloads.data_unmasked.shape
+
+    analysis.figure_of_merit_from(instance=instance, post_cti_data=fit.post_cti_data)
+
+    assert analysis.noise_variance_buffer is noise_variance_buffer
 
 
 def test__region_list_from(
@@ -88,6 +187,85 @@ def test__log_likelihood_via_analysis__matches_manual_fit(
     assert fit.log_likelihood == log_likelihood_via_analysis
 
 
+def test__log_likelihood_via_analysis__profiler_records_stages(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+        hyper_noise=af.Model(ac.HyperCINoiseCollection),
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    analysis = ac.AnalysisImagingCI(dataset=imaging_ci_7x7, clocker=parallel_clocker_2d)
+
+    log_likelihood = analysis.log_likelihood_function(instance=instance)
+
+    parallel_clocker_2d = copy.copy(parallel_clocker_2d)
+    parallel_clocker_2d.parallel_fast_mode = True
+
+    profiler = ac.LikelihoodProfiler()
+
+    analysis = ac.AnalysisImagingCI(
+        dataset=imaging_ci_7x7, clocker=parallel_clocker_2d, profiler=profiler
+    )
+
+    assert analysis.clocker is not parallel_clocker_2d
+    assert parallel_clocker_2d.profiler is None
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        log_likelihood, 1.0e-4
+    )
+    analysis.log_likelihood_function(instance=instance)
+
+    summary_dict = profiler.summary_dict()
+
+    assert profiler.total_calls == 2
+
+    for name in [
+        "density_check",
+        "fast_gather",
+        "arctic_parallel",
+        "fast_scatter",
+        "chi_squared",
+        "total",
+    ]:
+        assert summary_dict[name]["calls"] == 2
+
+
+def test__log_likelihood_via_analysis__pre_check_rejects_before_clocking(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    pre_check = ac.PreCheckPipeline(
+        pre_check_list=[
+            ac.PreCheckCCDWellFill(),
+            ac.PreCheckTrapTimescales(release_timescale_range=(1.0e6, 1.0e7)),
+        ]
+    )
+
+    analysis = ac.AnalysisImagingCI(
+        dataset=imaging_ci_7x7, clocker=parallel_clocker_2d, pre_check=pre_check
+    )
+
+    with pytest.raises(exc.PriorException):
+        analysis.log_likelihood_function(instance=instance)
+
+    assert analysis.log_likelihood_batch(
+        instances=[instance], resample_figure_of_merit=-1.0e99
+    ) == [-1.0e99]
+
+    assert pre_check.rejection_count_dict == {
+        "ccd_well_fill": 0,
+        "trap_timescales": 2,
+    }
+
+
 def test__log_likelihood_via_analysis__fast_settings_same_as_default(
     imaging_ci_7x7,
     pre_cti_data_7x7,
@@ -115,8 +293,8 @@ def test__log_likelihood_via_analysis__fast_settings_same_as_default(
 
     log_likelihood_via_fast = analysis.log_likelihood_function(instance=instance)
 
-    assert analysis.preloads.parallel_fast_index_list is not None
-    assert analysis.preloads.parallel_fast_column_lists is not None
+    assert analysis.preloads.parallel_fast_index_array is not None
+    assert analysis.preloads.parallel_fast_inverse_array is not None
 
     assert log_likelihood_via_fast == log_likelihood_via_default
 
@@ -138,8 +316,8 @@ def test__log_likelihood_via_analysis__fast_settings_same_as_default(
 
     log_likelihood_via_fast = analysis.log_likelihood_function(instance=instance)
 
-    assert analysis.preloads.serial_fast_index_list is not None
-    assert analysis.preloads.serial_fast_row_lists is not None
+    assert analysis.preloads.serial_fast_index_array is not None
+    assert analysis.preloads.serial_fast_inverse_array is not None
 
     assert log_likelihood_via_fast == log_likelihood_via_default
 
@@ -171,13 +349,318 @@ def test__log_likelihood_via_analysis__fast_settings_same_as_default(
 
     log_likelihood_via_fast = analysis.log_likelihood_function(instance=instance)
 
-    assert analysis.preloads.parallel_fast_index_list is not None
-    assert analysis.preloads.parallel_fast_column_lists is not None
-    assert analysis.preloads.serial_fast_index_list is None
-    assert analysis.preloads.serial_fast_row_lists is None
+    assert analysis.preloads.parallel_fast_index_array is not None
+    assert analysis.preloads.parallel_fast_inverse_array is not None
+    assert analysis.preloads.serial_fast_index_array is None
+    assert analysis.preloads.serial_fast_inverse_array is None
 
     assert log_likelihood_via_fast == log_likelihood_via_default
 
+    parallel_serial_clocker_2d = copy.copy(parallel_serial_clocker_2d)
+    parallel_serial_clocker_2d.serial_fast_mode = True
+
+    analysis = ac.AnalysisImagingCI(
+        dataset=imaging_ci_7x7, clocker=parallel_serial_clocker_2d
+    )
+
+    log_likelihood_via_fast = analysis.log_likelihood_function(instance=instance)
+
+    assert analysis.preloads.parallel_fast_index_array is not None
+    assert analysis.preloads.parallel_fast_inverse_array is not None
+    assert analysis.preloads.serial_fast_index_array is not None
+    assert analysis.preloads.serial_fast_inverse_array is not None
+
+    assert log_likelihood_via_fast == pytest.approx(log_likelihood_via_default, 1.0e-6)
+
+
+def test__analysis_combined__log_likelihood_same_as_summed_analyses(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    imaging_ci_high_norm = ac.ImagingCI(
+        data=imaging_ci_7x7.data,
+        noise_map=imaging_ci_7x7.noise_map,
+        pre_cti_data=ac.Array2D.full(
+            fill_value=20.0, shape_native=(7, 7), pixel_scales=1.0
+        ),
+        layout=imaging_ci_7x7.layout,
+    )
+
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+    )
+
+    analysis_list = [
+        ac.AnalysisImagingCI(dataset=dataset, clocker=parallel_clocker_2d)
+        for dataset in [imaging_ci_7x7, imaging_ci_high_norm]
+    ]
+
+    instance = model.instance_from_unit_vector([])
+
+    log_likelihood_via_sum = sum(analysis_list).log_likelihood_function(
+        instance=instance
+    )
+
+    analysis = ac.AnalysisImagingCICombined(*analysis_list)
+
+    assert analysis.clocker is parallel_clocker_2d
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        log_likelihood_via_sum, 1.0e-8
+    )
+
+    analysis = analysis.modify_before_fit(paths=af.DirectoryPaths(), model=model)
+
+    assert isinstance(analysis, ac.AnalysisImagingCICombined)
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        log_likelihood_via_sum, 1.0e-8
+    )
+
+    analysis = ac.AnalysisImagingCICombined(*analysis_list, n_processes=2)
+
+    assert analysis.use_pool is True
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        log_likelihood_via_sum, 1.0e-8
+    )
+
+    analysis.close_pool()
+
+    analysis = ac.AnalysisImagingCICombined(
+        analysis_list[0],
+        ac.AnalysisImagingCI(
+            dataset=imaging_ci_high_norm,
+            clocker=ac.Clocker2D(parallel_express=3),
+        ),
+    )
+
+    assert analysis.clocker is None
+
+    for analysis_kwargs in [
+        {"emulator": ac.Emulator()},
+        {"profiler": ac.LikelihoodProfiler()},
+    ]:
+        analysis = ac.AnalysisImagingCICombined(
+            analysis_list[0],
+            ac.AnalysisImagingCI(
+                dataset=imaging_ci_high_norm,
+                clocker=parallel_clocker_2d,
+                **analysis_kwargs,
+            ),
+            n_processes=2,
+        )
+
+        assert analysis.clocker is None
+        assert analysis.use_pool is False
+        assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+            log_likelihood_via_sum, 1.0e-8
+        )
+        assert analysis.analysis_pool is None
+
+
+def test__log_likelihood_batch__matches_log_likelihood_function(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    parallel_clocker_2d = copy.copy(parallel_clocker_2d)
+    parallel_clocker_2d.n_threads = 2
+
+    for model in [
+        af.Collection(
+            cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+        ),
+        af.Collection(
+            cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+            hyper_noise=af.Model(ac.HyperCINoiseCollection),
+        ),
+    ]:
+        analysis = ac.AnalysisImagingCI(
+            dataset=imaging_ci_7x7, clocker=parallel_clocker_2d
+        )
+
+        instance = model.instance_from_unit_vector([])
+
+        log_likelihood = analysis.log_likelihood_function(instance=instance)
+
+        log_likelihood_list = analysis.log_likelihood_batch(
+            instances=[instance, instance, instance]
+        )
+
+        assert log_likelihood_list == pytest.approx([log_likelihood] * 3, 1.0e-8)
+
+    analysis = ac.AnalysisImagingCI(
+        dataset=imaging_ci_7x7,
+        clocker=parallel_clocker_2d,
+        settings_cti=ac.SettingsCTI2D(parallel_total_density_range=(-1.0, -0.5)),
+    )
+
+    log_likelihood_list = analysis.log_likelihood_batch(instances=[instance])
+
+    assert log_likelihood_list == [-np.inf]
+
+
+def test__log_likelihood_batch__rejected_instances_resampled(
+    imaging_ci_7x7, ccd, parallel_clocker_2d
+):
+    model = af.Collection(
+        cti=af.Model(
+            ac.CTI2D,
+            parallel_trap_list=[af.Model(ac.TrapInstantCapture)],
+            parallel_ccd=ccd,
+        ),
+    )
+
+    instance = model.instance_from_vector(vector=[1.0, 1.0])
+    instance_rejected = model.instance_from_vector(vector=[20.0, 1.0])
+
+    analysis = ac.AnalysisImagingCI(
+        dataset=imaging_ci_7x7,
+        clocker=parallel_clocker_2d,
+        settings_cti=ac.SettingsCTI2D(parallel_total_density_range=(0.0, 10.0)),
+    )
+
+    log_likelihood = analysis.log_likelihood_function(instance=instance)
+
+    with pytest.raises(exc.PriorException):
+        analysis.log_likelihood_function(instance=instance_rejected)
+
+    log_likelihood_list = analysis.log_likelihood_batch(
+        instances=[instance, instance_rejected, instance]
+    )
+
+    assert log_likelihood_list[0] == pytest.approx(log_likelihood, 1.0e-8)
+    assert log_likelihood_list[1] == -np.inf
+    assert log_likelihood_list[2] == pytest.approx(log_likelihood, 1.0e-8)
+
+
+def test__log_likelihood_batch__emulator_adaptive_express_or_profiler_raises(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    for kwargs in [
+        {"emulator": ac.Emulator()},
+        {"adaptive_express": ac.AdaptiveExpress(parallel_express=1)},
+        {"profiler": ac.LikelihoodProfiler()},
+    ]:
+        analysis = ac.AnalysisImagingCI(
+            dataset=imaging_ci_7x7, clocker=parallel_clocker_2d, **kwargs
+        )
+
+        with pytest.raises(exc.AnalysisException):
+            analysis.log_likelihood_batch(instances=[instance])
+
+
+def test__log_likelihood_via_analysis__window_from_mask_same_as_default(
+    imaging_ci_7x7, traps_x1, ccd
+):
+    mask = np.full(shape=(7, 7), fill_value=False)
+    mask[0:2, :] = True
+    mask[5:7, :] = True
+    mask[:, 4:7] = True
+
+    mask = ac.Mask2D(mask=mask, pixel_scales=1.0)
+
+    masked_dataset = imaging_ci_7x7.apply_mask(mask=mask)
+
+    model = af.Collection(
+        cti=af.Model(
+            ac.CTI2D,
+            parallel_trap_list=traps_x1,
+            parallel_ccd=ccd,
+            serial_trap_list=traps_x1,
+            serial_ccd=ccd,
+        ),
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    analysis = ac.AnalysisImagingCI(dataset=masked_dataset, clocker=ac.Clocker2D())
+
+    log_likelihood_via_default = analysis.log_likelihood_function(instance=instance)
+
+    analysis = ac.AnalysisImagingCI(
+        dataset=masked_dataset, clocker=ac.Clocker2D(window_from_mask=True)
+    )
+
+    assert (analysis.preloads.window_row_index_array == np.array([2, 3, 4])).all()
+    assert (analysis.preloads.window_column_index_array == np.array([0, 1, 2, 3])).all()
+
+    log_likelihood_via_window = analysis.log_likelihood_function(instance=instance)
+
+    assert log_likelihood_via_window == pytest.approx(
+        log_likelihood_via_default, 1.0e-8
+    )
+
+
+def test__log_likelihood_via_analysis__adaptive_express(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    analysis = ac.AnalysisImagingCI(dataset=imaging_ci_7x7, clocker=parallel_clocker_2d)
+
+    log_likelihood_via_exact = analysis.log_likelihood_function(instance=instance)
+
+    adaptive_express = ac.AdaptiveExpress(parallel_express=1)
+
+    analysis = ac.AnalysisImagingCI(
+        dataset=imaging_ci_7x7,
+        clocker=parallel_clocker_2d,
+        adaptive_express=adaptive_express,
+    )
+
+    assert analysis.clocker_coarse.parallel_express == 1
+
+    log_likelihood_via_adaptive = analysis.log_likelihood_function(instance=instance)
+
+    assert log_likelihood_via_adaptive == log_likelihood_via_exact
+    assert adaptive_express.total_coarse == 1
+    assert adaptive_express.total_exact == 1
+
+
+def test__log_likelihood_via_analysis__emulator(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    analysis = ac.AnalysisImagingCI(dataset=imaging_ci_7x7, clocker=parallel_clocker_2d)
+
+    log_likelihood_via_exact = analysis.log_likelihood_function(instance=instance)
+
+    emulator = ac.Emulator(
+        region_list=["parallel_fpr", "parallel_eper"], min_training_points=10
+    )
+
+    analysis = ac.AnalysisImagingCI(
+        dataset=imaging_ci_7x7,
+        clocker=parallel_clocker_2d,
+        emulator=emulator,
+    )
+
+    log_likelihood_via_emulator = analysis.log_likelihood_function(instance=instance)
+
+    assert log_likelihood_via_emulator == log_likelihood_via_exact
+    assert emulator.total_exact == 1
+    assert emulator.total_emulated == 0
+
+    post_cti_data = parallel_clocker_2d.add_cti(
+        data=imaging_ci_7x7.pre_cti_data, cti=instance.cti
+    )
+
+    assert emulator.profile_list[0] == pytest.approx(
+        analysis.emulator_profile_from(array=post_cti_data), 1.0e-4
+    )
+    assert emulator.profile_log_likelihood_list[0] <= 0.0
+
 
 def test__full_and_extracted_fits_from_instance_and_imaging_ci(
     imaging_ci_7x7, mask_2d_7x7_unmasked, traps_x1, ccd, parallel_clocker_2d
@@ -223,5 +706,3 @@ def test__full_and_extracted_fits_from_instance_and_imaging_ci(
 
     assert fit.data.shape == (7, 7)
     assert fit_full_analysis.log_likelihood == pytest.approx(fit.log_likelihood)
-
-
@@ -3,6 +3,9 @@ import pytest
 
 import autocti as ac
 from autocti.charge_injection.fit import hyper_noise_map_from
+from autocti.charge_injection.fit import noise_scaling_stack_from
+from autocti.charge_injection.fit import unmasked_arrays_from
+from autocti.preloads import Preloads
 
 
 def test__fit_figure_of_merit(imaging_ci_7x7):
@@ -30,6 +33,82 @@ def test__fit_figure_of_merit(imaging_ci_7x7):
     assert fit.log_likelihood == pytest.approx(-180.877585, 1.0e-4)
 
 
+def test__fit_figure_of_merit__unmasked_preloads_same_as_default(imaging_ci_7x7):
+    (
+        unmasked_index_array,
+        data_unmasked,
+        inverse_variance_unmasked,
+    ) = unmasked_arrays_from(
+        data=imaging_ci_7x7.data,
+        noise_map=imaging_ci_7x7.noise_map,
+        mask=imaging_ci_7x7.mask,
+    )
+
+    fit = ac.FitImagingCI(
+        dataset=imaging_ci_7x7,
+        post_cti_data=imaging_ci_7x7.pre_cti_data,
+        hyper_noise_scalar_dict=None,
+        preloads=Preloads(
+            unmasked_index_array=unmasked_index_array,
+            data_unmasked=data_unmasked,
+            inverse_variance_unmasked=inverse_variance_unmasked,
+        ),
+    )
+
+    assert fit.log_likelihood == pytest.approx(-575.11719997, 1e-4)
+
+
+def test__fit_figure_of_merit__hyper_noise_preloads_same_as_default(imaging_ci_7x7):
+    unmasked_index_array, data_unmasked, _ = unmasked_arrays_from(
+        data=imaging_ci_7x7.data,
+        noise_map=imaging_ci_7x7.noise_map,
+        mask=imaging_ci_7x7.mask,
+    )
+
+    noise_scaling_key_list, noise_scaling_stack = noise_scaling_stack_from(
+        noise_scaling_map_dict=imaging_ci_7x7.noise_scaling_map_dict,
+        unmasked_index_array=unmasked_index_array,
+    )
+
+    preloads = Preloads(
+        unmasked_index_array=unmasked_index_array,
+        data_unmasked=data_unmasked,
+        noise_map_unmasked=np.asarray(imaging_ci_7x7.noise_map.native).reshape(-1)[
+            unmasked_index_array
+        ],
+        noise_scaling_key_list=noise_scaling_key_list,
+        noise_scaling_stack=noise_scaling_stack,
+    )
+
+    for hyper_noise_scalar_dict in [
+        {"parallel_eper": ac.HyperCINoiseScalar(scale_factor=1.0)},
+        {
+            "parallel_eper": ac.HyperCINoiseScalar(scale_factor=1.0),
+            "serial_eper": ac.HyperCINoiseScalar(scale_factor=2.0),
+        },
+    ]:
+        fit = ac.FitImagingCI(
+            dataset=imaging_ci_7x7,
+            post_cti_data=imaging_ci_7x7.pre_cti_data,
+            hyper_noise_scalar_dict=hyper_noise_scalar_dict,
+        )
+
+        fit_via_preloads = ac.FitImagingCI(
+            dataset=imaging_ci_7x7,
+            post_cti_data=imaging_ci_7x7.pre_cti_data,
+            hyper_noise_scalar_dict=hyper_noise_scalar_dict,
+            preloads=preloads,
+        )
+
+        assert fit_via_preloads.use_hyper_noise_preloads
+        assert fit_via_preloads.chi_squared == pytest.approx(fit.chi_squared, 1.0e-8)
+        assert fit_via_preloads.noise_normalization == pytest.approx(
+            fit.noise_normalization, 1.0e-8
+        )
+
+    assert fit_via_preloads.log_likelihood == pytest.approx(-180.877585, 1.0e-4)
+
+
 def test__hyper_noise_map_from():
     noise_map = ac.Array2D.full(fill_value=2.0, shape_native=(2, 2), pixel_scales=1.0)
     noise_scaling_map_dict = {
@@ -0,0 +1,62 @@
+import copy
+import numpy as np
+
+import autocti as ac
+
+from autocti.clocker.cache import ClockerCache
+from autocti.clocker.cache import array_fingerprint_from
+from autocti.clocker.cache import canonical_hash_from
+
+
+def test__canonical_hash_from():
+    trap_0 = ac.TrapInstantCapture(density=1.0, release_timescale=2.0)
+    trap_1 = ac.TrapInstantCapture(density=np.float64(1.0), release_timescale=2.0)
+    trap_2 = ac.TrapInstantCapture(density=1.1, release_timescale=2.0)
+
+    assert canonical_hash_from([trap_0]) == canonical_hash_from([trap_1])
+    assert canonical_hash_from([trap_0]) != canonical_hash_from([trap_2])
+    assert canonical_hash_from([trap_0]) != canonical_hash_from([trap_0, trap_0])
+
+
+def test__array_fingerprint_from():
+    arr = np.ones((3, 3))
+
+    assert array_fingerprint_from(arr) == array_fingerprint_from(arr.copy())
+    assert array_fingerprint_from(arr) != array_fingerprint_from(arr[:, :2])
+    assert array_fingerprint_from(arr) != array_fingerprint_from(2.0 * arr)
+
+
+def test__clocker_cache__hits_misses_and_eviction():
+    cache = ClockerCache(max_bytes=200)
+
+    assert cache.get(key="a") is None
+    assert cache.misses == 1
+
+    cache.set(key="a", image=np.zeros(10))
+    cache.set(key="b", image=np.ones(10))
+
+    assert (cache.get(key="a") == np.zeros(10)).all()
+    assert cache.hits == 1
+    assert cache.total_bytes == 160
+
+    cache.set(key="c", image=np.zeros(10))
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.evictions == 1
+    assert cache.total_bytes == 160
+
+    cache.set(key="d", image=np.zeros(100))
+
+    assert "d" not in cache
+
+    cache_copy = copy.deepcopy(cache)
+
+    assert len(cache_copy) == 2
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.total_bytes == 0
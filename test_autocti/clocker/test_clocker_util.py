@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+import autocti as ac
+
+
+def test__fast_index_array_and_inverse_from():
+    arr = np.array(
+        [
+            [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0],
+            [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+            [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 0.0],
+        ]
+    )
+
+    (
+        fast_index_array,
+        fast_inverse_array,
+    ) = ac.util.clocker.fast_index_array_and_inverse_from(array=arr, for_parallel=True)
+
+    assert (fast_index_array == np.array([0, 1, 5, 6])).all()
+    assert (fast_inverse_array == np.array([0, 1, 1, 0, 0, 2, 3, 1])).all()
+    assert fast_index_array.dtype == np.int32
+    assert fast_inverse_array.dtype == np.int32
+
+    (
+        fast_index_array,
+        fast_inverse_array,
+    ) = ac.util.clocker.fast_index_array_and_inverse_from(
+        array=arr.T, for_parallel=False
+    )
+
+    assert (fast_index_array == np.array([0, 1, 5, 6])).all()
+    assert (fast_inverse_array == np.array([0, 1, 1, 0, 0, 2, 3, 1])).all()
+
+
+def test__fast_index_array_and_inverse_from__tolerance():
+    arr = np.array(
+        [
+            [100.0, 100.0 + 1.0e-12, 100.0 + 1.0e-6],
+            [1.0, 1.0 - 1.0e-12, 1.0],
+        ]
+    )
+
+    (
+        fast_index_array,
+        fast_inverse_array,
+    ) = ac.util.clocker.fast_index_array_and_inverse_from(array=arr, for_parallel=True)
+
+    assert (fast_index_array == np.array([0, 2])).all()
+    assert (fast_inverse_array == np.array([0, 0, 1])).all()
+
+
+def test__fast_index_array_and_inverse_from__large_and_non_finite_values():
+    arr = np.array([[1.0e12, 1.0e12 + 1.0, -1.0e11, 1.0e11, np.nan, np.nan, 1.0e12]])
+
+    (
+        fast_index_array,
+        fast_inverse_array,
+    ) = ac.util.clocker.fast_index_array_and_inverse_from(array=arr, for_parallel=True)
+
+    assert (fast_index_array == np.array([0, 1, 2, 3, 4, 5])).all()
+    assert (fast_inverse_array == np.array([0, 1, 2, 3, 4, 5, 0])).all()
+
+
+def test__fast_stripe_lists_from():
+    fast_stripe_lists = ac.util.clocker.fast_stripe_lists_from(
+        fast_inverse_array=np.array([0, 1, 1, 0, 0, 2, 3, 1]), total_unique=4
+    )
+
+    assert fast_stripe_lists == [[0, 3, 4], [1, 2, 7], [5], [6]]
+
+
+def test__poisson_density_array_from():
+    density_array = ac.util.clocker.poisson_density_array_from(
+        density_list=[10.0, 0.5], total_pixels=10, total_columns=3, seed=1
+    )
+
+    assert density_array.shape == (3, 2)
+    assert density_array == pytest.approx(
+        np.array([[10.6, 0.4], [9.9, 0.5], [9.2, 0.7]]), 1.0e-4
+    )
+
+    density_array_repeat = ac.util.clocker.poisson_density_array_from(
+        density_list=[10.0, 0.5], total_pixels=10, total_columns=3, seed=1
+    )
+
+    assert (density_array == density_array_repeat).all()
+
+
+def test__window_index_arrays_from():
+    mask = np.full(shape=(5, 4), fill_value=True)
+    mask[1, 2] = False
+    mask[3, 0] = False
+
+    (
+        window_row_index_array,
+        window_column_index_array,
+    ) = ac.util.clocker.window_index_arrays_from(mask=mask)
+
+    assert (window_row_index_array == np.array([1, 3])).all()
+    assert (window_column_index_array == np.array([0, 2])).all()
+    assert window_row_index_array.dtype == np.int32
@@ -59,3 +59,38 @@ def test__data_mapped_to_2d_and_then_1d():
     image_corrected = clocker_1d.remove_cti(data=image_via_clocker, cti=cti)
 
     assert (image_corrected[:] > image_via_clocker[:]).all()
+
+
+def test__add_cti_many__matches_add_cti_for_every_line():
+    roe = ac.ROE(
+        dwell_times=[1.0],
+        empty_traps_between_columns=True,
+        empty_traps_for_first_transfers=False,
+        force_release_away_from_readout=True,
+        use_integer_express_matrix=False,
+    )
+    ccd_phase = ac.CCDPhase(
+        full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0
+    )
+    traps = [ac.TrapInstantCapture(10.0, -1.0 / np.log(0.5))]
+
+    cti = ac.CTI1D(trap_list=traps, ccd=ccd_phase)
+
+    clocker_1d = ac.Clocker1D(express=3, roe=roe)
+
+    data_list = [
+        ac.Array1D.no_mask(values=[1.0, 2.0, 3.0, 4.0], pixel_scales=1.0),
+        ac.Array1D.no_mask(values=[0.0, 10.0, 0.0, 0.0], pixel_scales=1.0),
+        ac.Array1D.no_mask(values=[0.0, 100.0, 0.0], pixel_scales=1.0),
+        ac.Array1D.no_mask(values=[5.0, 0.0, 5.0, 0.0], pixel_scales=1.0),
+    ]
+
+    post_cti_data_list = clocker_1d.add_cti_many(data_list=data_list, cti=cti)
+
+    assert len(post_cti_data_list) == 4
+
+    for data, post_cti_data in zip(data_list, post_cti_data_list):
+        post_cti_data_via_add_cti = clocker_1d.add_cti(data=data, cti=cti)
+
+        assert post_cti_data.shape == data.shape
+        assert post_cti_data == pytest.approx(post_cti_data_via_add_cti, 1.0e-4)
@@ -8,6 +8,7 @@ from arcticpy import add_cti
 import autocti as ac
 
 from autocti import exc
+from autocti.preloads import Preloads
 
 path = "{}/".format(os.path.dirname(os.path.realpath(__file__)))
 
@@ -120,11 +121,51 @@ def test__add_cti_with_poisson_trap_densities():
 
     image_via_clocker = clocker.add_cti(data=arr, cti=cti)
 
-    assert image_via_clocker[0, 0] == pytest.approx(0.980298, 1.0e-4)
-    assert image_via_clocker[0, 1] == pytest.approx(0.9901042, 1.0e-4)
-    assert image_via_clocker[0, 2] == pytest.approx(0.9901981, 1.0e-4)
+    assert clocker.parallel_trap_column_list[:, 0] == pytest.approx(
+        np.array([10.6, 9.9, 9.2, 8.6]), 1.0e-4
+    )
     assert (image_via_clocker[:, 3] > 0.0).all()
 
+    clocker_threads = ac.Clocker2D(
+        parallel_poisson_traps=True,
+        poisson_seed=1,
+        parallel_express=3,
+        parallel_roe=roe,
+        serial_express=3,
+        serial_roe=roe,
+        n_threads=3,
+    )
+
+    image_via_clocker_threads = clocker_threads.add_cti(data=arr, cti=cti)
+
+    assert (
+        clocker.parallel_trap_column_list == clocker_threads.parallel_trap_column_list
+    ).all()
+    assert (image_via_clocker == image_via_clocker_threads).all()
+
+    cti = ac.CTI2D(parallel_trap_list=trap_list, parallel_ccd=ccd)
+
+    image_via_clocker = clocker.add_cti(data=arr, cti=cti)
+
+    for column in range(4):
+        trap_column_list = [
+            ac.TrapInstantCapture(
+                density=clocker.parallel_trap_column_list[column, 0],
+                release_timescale=-1.0 / np.log(0.5),
+            )
+        ]
+
+        image_column = ac.Clocker2D(parallel_express=3, parallel_roe=roe).add_cti(
+            data=ac.Array2D.no_mask(
+                values=arr[:, column : column + 1], pixel_scales=1.0
+            ).native,
+            cti=ac.CTI2D(parallel_trap_list=trap_column_list, parallel_ccd=ccd),
+        )
+
+        assert image_via_clocker[:, column] == pytest.approx(
+            np.asarray(image_column)[:, 0], 1.0e-8
+        )
+
 
 def test_fast_indexes_from():
     arr = np.array(
@@ -256,3 +297,535 @@ def test__add_cti_serial_fast():
     image_via_clocker_fast = clocker.add_cti(data=arr, cti=cti)
 
     assert image_via_clocker == pytest.approx(image_via_clocker_fast, 1.0e-6)
+
+
+def test__add_cti_parallel_serial_fast():
+    arr = np.array(
+        (
+            [
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 0.0],
+                [0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 0.0],
+                [0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 2.0, 2.0, 2.0, 2.0, 2.0, 0.0, 0.0],
+                [0.0, 2.0, 2.0, 2.0, 2.0, 2.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            ]
+        )
+    )
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(
+        parallel_trap_list=trap_list,
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    clocker = ac.Clocker2D()
+
+    image_via_clocker = clocker.add_cti(data=arr, cti=cti)
+
+    clocker = ac.Clocker2D(parallel_fast_mode=True, serial_fast_mode=True)
+
+    image_via_clocker_fast = clocker.add_cti(data=arr, cti=cti)
+
+    assert image_via_clocker == pytest.approx(image_via_clocker_fast, 1.0e-6)
+
+    cti = ac.CTI2D(serial_trap_list=trap_list, serial_ccd=ccd)
+
+    image_via_clocker = ac.Clocker2D().add_cti(data=arr, cti=cti)
+    image_via_clocker_fast = clocker.add_cti(data=arr, cti=cti)
+
+    assert image_via_clocker == pytest.approx(image_via_clocker_fast, 1.0e-6)
+
+
+def test__add_cti_parallel_fast__preloaded_index_and_inverse_arrays():
+    arr = np.array(
+        (
+            [
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0],
+                [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+                [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 0.0],
+            ]
+        )
+    )
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(parallel_trap_list=trap_list, parallel_ccd=ccd)
+
+    clocker = ac.Clocker2D(parallel_fast_mode=True)
+
+    image_via_clocker_fast = clocker.add_cti(data=arr, cti=cti)
+
+    (
+        fast_index_array,
+        fast_inverse_array,
+    ) = ac.util.clocker.fast_index_array_and_inverse_from(array=arr, for_parallel=True)
+
+    preloads = Preloads(
+        parallel_fast_index_array=fast_index_array,
+        parallel_fast_inverse_array=fast_inverse_array,
+    )
+
+    image_via_preloads = clocker.add_cti(data=arr, cti=cti, preloads=preloads)
+
+    assert (image_via_clocker_fast == image_via_preloads).all()
+
+
+def test__add_cti_fast_modes__window_not_passed_to_arctic():
+    arr = np.array(
+        (
+            [
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0],
+                [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+                [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 0.0],
+            ]
+        )
+    )
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(
+        parallel_trap_list=trap_list,
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+    cti_serial = ac.CTI2D(serial_trap_list=trap_list, serial_ccd=ccd)
+
+    window_dict = {
+        "parallel_window_start": 1,
+        "parallel_window_stop": 4,
+        "serial_window_start": 1,
+        "serial_window_stop": 6,
+    }
+
+    assert ac.Clocker2D().add_cti(data=arr, cti=cti) != pytest.approx(
+        ac.Clocker2D(**window_dict).add_cti(data=arr, cti=cti), 1.0e-6
+    )
+
+    for fast_mode_dict, cti in [
+        ({"parallel_fast_mode": True}, cti),
+        ({"serial_fast_mode": True}, cti_serial),
+        ({"parallel_fast_mode": True, "serial_fast_mode": True}, cti),
+    ]:
+        clocker = ac.Clocker2D(**fast_mode_dict, **window_dict)
+
+        assert clocker.add_cti(data=arr, cti=cti) == pytest.approx(
+            ac.Clocker2D().add_cti(data=arr, cti=cti), 1.0e-6
+        )
+
+
+def test__add_cti__n_threads_identical_to_single_thread():
+    arr = np.zeros((10, 9))
+    arr[1:4, 1:8] = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+    arr[6:8, 1:8] = 10.0
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(
+        parallel_trap_list=trap_list,
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    image_via_clocker = ac.Clocker2D(parallel_express=2, serial_express=2).add_cti(
+        data=arr, cti=cti
+    )
+
+    clocker = ac.Clocker2D(parallel_express=2, serial_express=2, n_threads=4)
+
+    image_via_clocker_threads = clocker.add_cti(data=arr, cti=cti)
+
+    assert (image_via_clocker == image_via_clocker_threads).all()
+
+    image_via_clocker = ac.Clocker2D(parallel_fast_mode=True).add_cti(data=arr, cti=cti)
+
+    clocker = ac.Clocker2D(parallel_fast_mode=True, n_threads=3)
+
+    image_via_clocker_threads = clocker.add_cti(data=arr, cti=cti)
+
+    assert (image_via_clocker == image_via_clocker_threads).all()
+
+    image_via_clocker = ac.Clocker2D(
+        parallel_express=2,
+        parallel_window_start=1,
+        parallel_window_stop=7,
+        serial_express=2,
+        serial_window_start=2,
+        serial_window_stop=6,
+    ).add_cti(data=arr, cti=cti)
+
+    clocker = ac.Clocker2D(
+        parallel_express=2,
+        parallel_window_start=1,
+        parallel_window_stop=7,
+        serial_express=2,
+        serial_window_start=2,
+        serial_window_stop=6,
+        n_threads=4,
+    )
+
+    image_via_clocker_threads = clocker.add_cti(data=arr, cti=cti)
+
+    assert (image_via_clocker == image_via_clocker_threads).all()
+
+
+def test__add_cti__cache():
+    arr = np.zeros((10, 5))
+    arr[1:4, 1:4] = 10.0
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(
+        parallel_trap_list=trap_list,
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    image_via_clocker = ac.Clocker2D(parallel_express=2, serial_express=2).add_cti(
+        data=arr, cti=cti
+    )
+
+    clocker = ac.Clocker2D(parallel_express=2, serial_express=2, cache_max_bytes=10**6)
+
+    image_via_cache_miss = clocker.add_cti(data=arr, cti=cti)
+
+    assert clocker.cache.misses == 2
+    assert clocker.cache.hits == 0
+
+    cti_copy = ac.CTI2D(
+        parallel_trap_list=[
+            ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+        ],
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    image_via_cache_hit = clocker.add_cti(data=arr, cti=cti_copy)
+
+    assert clocker.cache.hits == 1
+    assert (image_via_clocker == image_via_cache_miss).all()
+    assert (image_via_clocker == image_via_cache_hit).all()
+
+    cti = ac.CTI2D(
+        parallel_trap_list=[
+            ac.TrapInstantCapture(density=5.0, release_timescale=-1.0 / np.log(0.5))
+        ],
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    clocker.add_cti(data=arr, cti=cti)
+
+    assert clocker.cache.misses == 4
+
+    clocker.parallel_express = 3
+
+    clocker.add_cti(data=arr, cti=cti)
+
+    assert clocker.cache.misses == 6
+    assert len(clocker.cache) == 6
+
+    clocker = ac.Clocker2D(parallel_express=2, serial_express=2)
+
+    assert clocker.cache is None
+
+
+def test__add_cti__cache__serial_only_change_reuses_post_parallel_image():
+    arr = np.zeros((10, 5))
+    arr[1:4, 1:4] = 10.0
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    parallel_trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    for parallel_fast_mode, serial_fast_mode in [(False, False), (True, True)]:
+        clocker = ac.Clocker2D(
+            parallel_express=2,
+            serial_express=2,
+            parallel_fast_mode=parallel_fast_mode,
+            serial_fast_mode=serial_fast_mode,
+            cache_max_bytes=10**6,
+        )
+
+        for serial_density in [10.0, 5.0]:
+            cti = ac.CTI2D(
+                parallel_trap_list=parallel_trap_list,
+                parallel_ccd=ccd,
+                serial_trap_list=[
+                    ac.TrapInstantCapture(
+                        density=serial_density, release_timescale=-1.0 / np.log(0.5)
+                    )
+                ],
+                serial_ccd=ccd,
+            )
+
+            image_via_cache = clocker.add_cti(data=arr, cti=cti)
+
+            image_via_clocker = ac.Clocker2D(
+                parallel_express=2, serial_express=2
+            ).add_cti(data=arr, cti=cti)
+
+            assert image_via_cache == pytest.approx(
+                np.asarray(image_via_clocker), 1.0e-8
+            )
+
+        assert clocker.cache.misses == 3
+        assert clocker.cache.hits == 1
+
+
+def test__add_cti__cache__readout_offsets_and_windows_identical_to_no_cache():
+    arr = np.zeros((10, 5))
+    arr[1:4, 1:4] = 10.0
+
+    arr = ac.Array2D.no_mask(
+        values=arr,
+        pixel_scales=1.0,
+        header=ac.Header(
+            header_sci_obj=None, header_hdu_obj=None, readout_offsets=(3, 5)
+        ),
+    ).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(
+        parallel_trap_list=trap_list,
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    for clocker_dict in [
+        {},
+        {"parallel_fast_mode": True},
+        {"parallel_fast_mode": True, "serial_fast_mode": True},
+        {"parallel_window_start": 2, "serial_window_stop": 3},
+    ]:
+        image_via_clocker = ac.Clocker2D(
+            parallel_express=2, serial_express=2, **clocker_dict
+        ).add_cti(data=arr, cti=cti)
+
+        image_via_cache = ac.Clocker2D(
+            parallel_express=2, serial_express=2, cache_max_bytes=10**6, **clocker_dict
+        ).add_cti(data=arr, cti=cti)
+
+        assert image_via_cache == pytest.approx(np.asarray(image_via_clocker), 1.0e-8)
+
+
+def test__add_cti__cache__preloaded_data_fingerprint():
+    arr = np.zeros((10, 5))
+    arr[1:4, 1:4] = 10.0
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    cti = ac.CTI2D(
+        parallel_trap_list=[
+            ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+        ],
+        parallel_ccd=ccd,
+    )
+
+    clocker = ac.Clocker2D(parallel_express=2, cache_max_bytes=10**6)
+
+    preloads = Preloads(data_fingerprint="fingerprint")
+
+    assert (
+        clocker.cache_key_from(data=arr, cti=cti, preloads=preloads)[2] == "fingerprint"
+    )
+    assert clocker.cache_key_from(data=arr, cti=cti) == clocker.cache_key_from(
+        data=arr, cti=cti, preloads=Preloads()
+    )
+
+    image_via_cache = clocker.add_cti(data=arr, cti=cti, preloads=preloads)
+
+    assert clocker.add_cti(data=arr, cti=cti, preloads=preloads) == pytest.approx(
+        np.asarray(image_via_cache), 1.0e-8
+    )
+    assert clocker.cache.hits == 1
+
+
+def test__add_cti_batch():
+    arr = np.zeros((10, 5))
+    arr[1:4, 1:4] = 10.0
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    cti_list = [
+        ac.CTI2D(
+            parallel_trap_list=[
+                ac.TrapInstantCapture(
+                    density=density, release_timescale=-1.0 / np.log(0.5)
+                )
+            ],
+            parallel_ccd=ccd,
+            serial_trap_list=[
+                ac.TrapInstantCapture(
+                    density=density, release_timescale=-1.0 / np.log(0.5)
+                )
+            ],
+            serial_ccd=ccd,
+        )
+        for density in [1.0, 5.0, 10.0]
+    ]
+
+    for clocker in [
+        ac.Clocker2D(parallel_express=2, serial_express=2),
+        ac.Clocker2D(parallel_express=2, serial_express=2, n_threads=2),
+        ac.Clocker2D(parallel_fast_mode=True, serial_fast_mode=True, n_threads=3),
+    ]:
+        image_list = clocker.add_cti_batch(data=arr, cti_list=cti_list)
+
+        assert len(image_list) == 3
+
+        for image, cti in zip(image_list, cti_list):
+            assert image == pytest.approx(
+                np.asarray(clocker.add_cti(data=arr, cti=cti)), 1.0e-8
+            )
+
+
+def test__add_cti_stacked():
+    data_list = []
+
+    for norm in [10.0, 50.0, 100.0]:
+        arr = np.zeros((10, 5))
+        arr[1:4, 1:4] = norm
+
+        data_list.append(ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native)
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap = ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+
+    for cti in [
+        ac.CTI2D(parallel_trap_list=[trap], parallel_ccd=ccd),
+        ac.CTI2D(serial_trap_list=[trap], serial_ccd=ccd),
+        ac.CTI2D(
+            parallel_trap_list=[trap],
+            parallel_ccd=ccd,
+            serial_trap_list=[trap],
+            serial_ccd=ccd,
+        ),
+    ]:
+        for clocker in [
+            ac.Clocker2D(parallel_express=2, serial_express=2),
+            ac.Clocker2D(parallel_fast_mode=True, serial_fast_mode=True),
+        ]:
+            image_list = clocker.add_cti_stacked(data_list=data_list, cti=cti)
+
+            assert len(image_list) == 3
+
+            for image, data in zip(image_list, data_list):
+                assert image == pytest.approx(
+                    np.asarray(clocker.add_cti(data=data, cti=cti)), 1.0e-8
+                )
+
+
+def test__add_cti_windowed():
+    arr = np.zeros((12, 8))
+    arr[1:4, 1:7] = 10.0
+    arr[7:9, 1:7] = 10.0
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    mask = np.full(shape=(12, 8), fill_value=True)
+    mask[4:6, 2:4] = False
+    mask[2, 5] = False
+
+    (
+        window_row_index_array,
+        window_column_index_array,
+    ) = ac.util.clocker.window_index_arrays_from(mask=mask)
+
+    preloads = Preloads(
+        window_row_index_array=window_row_index_array,
+        window_column_index_array=window_column_index_array,
+    )
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    for cti in [
+        ac.CTI2D(parallel_trap_list=trap_list, parallel_ccd=ccd),
+        ac.CTI2D(serial_trap_list=trap_list, serial_ccd=ccd),
+        ac.CTI2D(
+            parallel_trap_list=trap_list,
+            parallel_ccd=ccd,
+            serial_trap_list=trap_list,
+            serial_ccd=ccd,
+        ),
+    ]:
+        image_via_clocker = ac.Clocker2D().add_cti(data=arr, cti=cti)
+
+        clocker = ac.Clocker2D(window_from_mask=True)
+
+        image_via_window = clocker.add_cti(data=arr, cti=cti, preloads=preloads)
+
+        assert np.asarray(image_via_window)[~mask] == pytest.approx(
+            np.asarray(image_via_clocker)[~mask], 1.0e-8
+        )
+        assert (np.asarray(image_via_window)[6:, :] == 0.0).all()
+
+        image_via_no_preloads = clocker.add_cti(data=arr, cti=cti)
+
+        assert (image_via_no_preloads == image_via_clocker).all()
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+import autocti as ac
+
+
+@pytest.fixture(name="pixel_line_dict_list")
+def make_pixel_line_dict_list():
+    return [
+        {
+            "location": [2, 4],
+            "flux": 1234.0,
+            "data": [5.0, 3.0, 2.0, 1.0],
+            "noise": [1.0, 1.0, 1.0, 1.0],
+        },
+        {
+            "location": [5.0, 1],
+            "flux": 100.0,
+            "data": [7.0, 6.0],
+            "noise": [2.0, 2.0],
+        },
+    ]
+
+
+@pytest.fixture(name="dataset_packed")
+def make_dataset_packed(pixel_line_dict_list):
+    return ac.Dataset1DPacked.from_pixel_line_dict_list(
+        pixel_line_dict_list=pixel_line_dict_list, size=10
+    )
+
+
+def test__from_pixel_line_dict_list(dataset_packed):
+    assert dataset_packed.total_lines == 2
+    assert dataset_packed.data == pytest.approx(
+        np.array([5.0, 3.0, 2.0, 1.0, 7.0, 6.0])
+    )
+    assert dataset_packed.noise_map == pytest.approx(
+        np.array([1.0, 1.0, 1.0, 1.0, 2.0, 2.0])
+    )
+    assert (dataset_packed.offset_array == np.array([0, 4, 6])).all()
+    assert (dataset_packed.row_start_array == np.array([2, 5])).all()
+    assert dataset_packed.flux_array == pytest.approx(np.array([1234.0, 100.0]))
+    assert (dataset_packed.mask == False).all()
+
+
+def test__gather_index_arrays(dataset_packed):
+    assert (dataset_packed.row_index_array == np.array([2, 3, 4, 5, 5, 6])).all()
+    assert (dataset_packed.column_index_array == np.array([0, 0, 0, 0, 1, 1])).all()
+    assert dataset_packed.row_stop == 7
+
+
+def test__pre_cti_image_2d_from(dataset_packed):
+    image = dataset_packed.pre_cti_image_2d_from()
+
+    assert image.shape == (7, 2)
+    assert image[2, 0] == 1234.0
+    assert image[5, 1] == 100.0
+    assert np.sum(image) == 1334.0
+
+    assert dataset_packed.pre_cti_image_2d_from(total_rows=10).shape == (10, 2)
+
+
+def test__model_data_from(dataset_packed):
+    image = np.arange(14.0).reshape(7, 2)
+
+    assert dataset_packed.model_data_from(image_post_cti=image) == pytest.approx(
+        np.array([4.0, 6.0, 8.0, 10.0, 11.0, 13.0])
+    )
+
+
+def test__dataset_1d_from__matches_from_pixel_line_dict(
+    dataset_packed, pixel_line_dict_list
+):
+    dataset_1d = dataset_packed.dataset_1d_from(index=1)
+
+    dataset_1d_via_dict = ac.Dataset1D.from_pixel_line_dict(
+        pixel_line_dict=pixel_line_dict_list[1], size=10
+    )
+
+    assert (dataset_1d.data == dataset_1d_via_dict.data).all()
+    assert (dataset_1d.noise_map == dataset_1d_via_dict.noise_map).all()
+    assert (dataset_1d.pre_cti_data == dataset_1d_via_dict.pre_cti_data).all()
@@ -1,8 +1,11 @@
+import numpy as np
 import pytest
 
 import autofit as af
 import autocti as ac
 
+from autocti import exc
+
 from autofit.non_linear.mock.mock_search import MockSearch
 from autocti.dataset_1d.model.result import ResultDataset1D
 
@@ -54,3 +57,93 @@ def test__extracted_fits_from_instance_and_line_ci(
 
     assert fit.dataset.data.shape == (7,)
     assert fit_analysis.log_likelihood == pytest.approx(fit.log_likelihood)
+
+
+def test__packed__log_likelihood_matches_sum_of_masked_lines(traps_x1, ccd):
+    pixel_line_dict_list = [
+        {
+            "location": [2, 4],
+            "flux": 1234.0,
+            "data": [1100.0, 30.0, 20.0, 10.0],
+            "noise": [1.0, 1.0, 1.0, 1.0],
+        },
+        {
+            "location": [5, 1],
+            "flux": 800.0,
+            "data": [700.0, 60.0],
+            "noise": [2.0, 2.0],
+        },
+    ]
+
+    model = af.Collection(cti=af.Model(ac.CTI1D, trap_list=traps_x1, ccd=ccd))
+
+    instance = model.instance_from_unit_vector([])
+
+    clocker = ac.Clocker1D(express=0)
+
+    dataset_packed = ac.Dataset1DPacked.from_pixel_line_dict_list(
+        pixel_line_dict_list=pixel_line_dict_list, size=10
+    )
+
+    analysis = ac.AnalysisDataset1DPacked(dataset=dataset_packed, clocker=clocker)
+
+    assert analysis.total_rows == 7
+
+    log_likelihood_via_packed = analysis.log_likelihood_function(instance=instance)
+
+    log_likelihood = 0.0
+
+    for pixel_line_dict in pixel_line_dict_list:
+        dataset_1d = ac.Dataset1D.from_pixel_line_dict(
+            pixel_line_dict=pixel_line_dict, size=10
+        )
+
+        row_start = pixel_line_dict["location"][0]
+
+        mask = np.full(shape=(10,), fill_value=True)
+        mask[row_start : row_start + len(pixel_line_dict["data"])] = False
+
+        dataset_1d = dataset_1d.apply_mask(mask=ac.Mask1D(mask=mask, pixel_scales=0.1))
+
+        analysis_1d = ac.AnalysisDataset1D(dataset=dataset_1d, clocker=clocker)
+
+        log_likelihood += analysis_1d.log_likelihood_function(instance=instance)
+
+    assert log_likelihood_via_packed == pytest.approx(log_likelihood, 1.0e-4)
+
+    analysis = ac.AnalysisDataset1DPacked(
+        dataset=dataset_packed, clocker=ac.Clocker1D(express=2)
+    )
+
+    assert analysis.total_rows == 10
+
+    profiler = ac.LikelihoodProfiler()
+
+    analysis = ac.AnalysisDataset1DPacked(
+        dataset=dataset_packed, clocker=clocker, profiler=profiler
+    )
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        log_likelihood, 1.0e-4
+    )
+    assert profiler.total_calls == 1
+
+    pre_check = ac.PreCheckPipeline(
+        pre_check_list=[
+            ac.PreCheckTrapTimescales(release_timescale_range=(1.0e6, 1.0e7)),
+        ]
+    )
+
+    analysis = ac.AnalysisDataset1DPacked(
+        dataset=dataset_packed, clocker=clocker, pre_check=pre_check
+    )
+
+    with pytest.raises(exc.PriorException):
+        analysis.log_likelihood_function(instance=instance)
+
+    dataset_packed = ac.Dataset1DPacked.from_pixel_line_dict_list(
+        pixel_line_dict_list=pixel_line_dict_list, size=6
+    )
+
+    with pytest.raises(exc.DatasetException):
+        ac.AnalysisDataset1DPacked(dataset=dataset_packed, clocker=clocker)
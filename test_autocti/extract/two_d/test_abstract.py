@@ -5,6 +5,7 @@ from typing import List, Optional, Tuple
 import autoarray as aa
 import autocti as ac
 
+from autocti import exc
 from autocti.extract.two_d.abstract import Extract2D
 
 
@@ -184,6 +185,79 @@ def test__array_2d_list_from__force_rows_same_size():
     assert (array_2d_list[1] == np.array([[5.0, 15.0]])).all()
 
 
+def test__plan_from(parallel_array):
+    extract = MockExtract2D(region_list=[(1, 3, 0, 3), (5, 8, 0, 3)])
+
+    plan = extract.plan_from(
+        array=parallel_array, settings=ac.SettingsExtract(pixels=(0, 2))
+    )
+
+    assert plan.index_array.shape == (2, 2, 3)
+    assert (plan.index_array[0] == np.array([[3, 4, 5], [6, 7, 8]])).all()
+    assert (plan.index_array[1] == np.array([[15, 16, 17], [18, 19, 20]])).all()
+
+    assert (
+        plan.values_from(array=parallel_array)[1]
+        == np.array([[5.0, 5.0, 5.0], [6.0, 6.0, 6.0]])
+    ).all()
+
+    extract = MockExtract2D(region_list=[(1, 3, 0, 3), (5, 8, 0, 3)])
+
+    assert (
+        extract.plan_from(
+            array=parallel_array, settings=ac.SettingsExtract(pixels=(0, 2))
+        )
+        is plan
+    )
+    assert (
+        extract.plan_from(
+            array=parallel_array, settings=ac.SettingsExtract(pixels=(0, 1))
+        )
+        is not plan
+    )
+
+
+def test__plan_from__least_recently_used_plan_removed(parallel_array, monkeypatch):
+    from collections import OrderedDict
+
+    from autocti.extract.two_d import plan as extract_plan
+
+    monkeypatch.setattr(extract_plan, "_extract_plan_2d_dict", OrderedDict())
+    monkeypatch.setattr(extract_plan, "_extract_plan_2d_max_size", 2)
+
+    extract = MockExtract2D(region_list=[(1, 3, 0, 3), (5, 8, 0, 3)])
+
+    plan_0 = extract.plan_from(
+        array=parallel_array, settings=ac.SettingsExtract(pixels=(0, 1))
+    )
+    plan_1 = extract.plan_from(
+        array=parallel_array, settings=ac.SettingsExtract(pixels=(0, 2))
+    )
+
+    assert (
+        extract.plan_from(
+            array=parallel_array, settings=ac.SettingsExtract(pixels=(0, 1))
+        )
+        is plan_0
+    )
+
+    extract.plan_from(array=parallel_array, settings=ac.SettingsExtract(pixels=(1, 2)))
+
+    assert len(extract_plan._extract_plan_2d_dict) == 2
+    assert (
+        extract.plan_from(
+            array=parallel_array, settings=ac.SettingsExtract(pixels=(0, 1))
+        )
+        is plan_0
+    )
+    assert (
+        extract.plan_from(
+            array=parallel_array, settings=ac.SettingsExtract(pixels=(0, 2))
+        )
+        is not plan_1
+    )
+
+
 def test__stacked_array_2d_from(parallel_array, parallel_masked_array):
     extract = MockExtract2D(region_list=[(1, 4, 0, 3), (5, 8, 0, 3)])
 
@@ -258,6 +332,45 @@ def test__stacked_array_2d_total_pixels_from(parallel_array, parallel_masked_arr
     ).all()
 
 
+def test__stacked_array_2d_from__force_rows_same_size():
+    serial_array = ac.Array2D.no_mask(
+        values=[
+            [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 1.0, 11.0, 21.0],
+            [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 2.0, 12.0, 22.0],
+            [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 3.0, 13.0, 23.0],
+            [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 4.0, 14.0, 24.0],
+            [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 5.0, 15.0, 25.0],
+            [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 6.0, 16.0, 26.0],
+        ],
+        pixel_scales=1.0,
+    )
+
+    extract = ac.Extract2DSerialOverscanNoEPER(
+        shape_2d=serial_array.shape_native,
+        region_list=[(0, 1, 0, 7), (2, 4, 0, 7)],
+        serial_overscan=(0, 5, 7, 10),
+    )
+
+    settings = ac.SettingsExtract(pixels=(0, 2), force_same_row_size=True)
+
+    stacked_array_2d = extract.stacked_array_2d_from(
+        array=serial_array, settings=settings
+    )
+
+    assert (stacked_array_2d == np.array([[3.5, 13.5]])).all()
+
+    stacked_total_pixels = extract.stacked_array_2d_total_pixels_from(
+        array=serial_array, settings=settings
+    )
+
+    assert (stacked_total_pixels == np.array([[2, 2]])).all()
+
+    with pytest.raises(exc.ExtractException):
+        extract.stacked_array_2d_from(
+            array=serial_array, settings=ac.SettingsExtract(pixels=(0, 2))
+        )
+
+
 def test__binned_array_1d_from(parallel_array, parallel_masked_array):
     extract = MockExtract2D(region_list=[(1, 3, 0, 3), (5, 8, 0, 3)])
 
@@ -312,6 +425,58 @@ def test__binned_array_1d_total_pixels_from(parallel_array, parallel_masked_arra
     assert (binned_array_1d_total_pixels == np.array([6, 5, 4])).all()
 
 
+def test__binned_array_1d_list_from(parallel_array, parallel_masked_array):
+    extract = MockExtract2D(region_list=[(1, 3, 0, 3), (5, 8, 0, 3)])
+
+    settings_list = [
+        ac.SettingsExtract(pixels=(0, 3)),
+        ac.SettingsExtract(pixels=(-1, 1)),
+    ]
+
+    array = ac.Array2D.no_mask(values=2.0 * parallel_array.native, pixel_scales=1.0)
+
+    noise_map = ac.Array2D.full(
+        fill_value=1.0, shape_native=parallel_array.shape_native, pixel_scales=1.0
+    )
+
+    binned_list = extract.binned_array_1d_list_from(
+        array_list=[parallel_masked_array, array, noise_map],
+        settings_list=settings_list,
+    )
+
+    for settings, (
+        binned_array_1d_list,
+        binned_total_pixels_list,
+        binned_quadrature_1d_list,
+    ) in zip(settings_list, binned_list):
+        assert binned_array_1d_list[0] == pytest.approx(
+            extract.binned_array_1d_from(
+                array=parallel_masked_array, settings=settings
+            ),
+            1.0e-4,
+        )
+        assert binned_array_1d_list[1] == pytest.approx(
+            extract.binned_array_1d_from(array=array, settings=settings), 1.0e-4
+        )
+        assert (
+            binned_total_pixels_list[0]
+            == extract.binned_array_1d_total_pixels_from(
+                array=parallel_masked_array, settings=settings
+            )
+        ).all()
+        assert (
+            binned_total_pixels_list[1]
+            == extract.binned_array_1d_total_pixels_from(array=array, settings=settings)
+        ).all()
+        assert binned_quadrature_1d_list[2] == pytest.approx(
+            1.0 / np.sqrt(binned_total_pixels_list[2]), 1.0e-4
+        )
+
+    assert (binned_list[0][0][0] == np.array([9.0 / 3.0, 14.0 / 3.0, 5.0])).all()
+    assert (binned_list[0][1][0] == np.array([6, 5, 4])).all()
+    assert (binned_list[0][1][1] == np.array([6, 6, 6])).all()
+
+
 def test__total_rows_minimum():
     extract = MockExtract2D(region_list=[(1, 2, 0, 1)])
 
@@ -360,6 +525,84 @@ def test__dataset_1d_from(imaging_ci_7x7):
     assert (dataset.pre_cti_data == np.array([10.0, 10.0])).all()
     assert dataset.layout.region_list == [(0, 2)]
 
+    dataset_list = extract.dataset_1d_list_from(
+        dataset_2d=imaging_ci_7x7,
+        settings_list=[
+            ac.SettingsExtract(pixels=(0, 2)),
+            ac.SettingsExtract(pixels=(0, 1)),
+        ],
+    )
+
+    assert (dataset_list[0].data == dataset.data).all()
+    assert (dataset_list[0].noise_map == dataset.noise_map).all()
+    assert (dataset_list[1].data == np.array([1.0])).all()
+    assert (dataset_list[1].noise_map == np.array([2.0 / np.sqrt(2)])).all()
+    assert (dataset_list[1].pre_cti_data == np.array([10.0])).all()
+
+
+def test__dataset_1d_from__quantities_binned_over_their_own_mask(imaging_ci_7x7):
+    extract = MockExtract2D(region_list=[(0, 3, 1, 3)])
+
+    settings = ac.SettingsExtract(pixels=(0, 2))
+
+    mask = np.full((7, 7), False)
+    mask[0, 1] = True
+
+    data = ac.Array2D(
+        values=np.arange(49.0).reshape(7, 7),
+        mask=ac.Mask2D(mask=mask, pixel_scales=1.0),
+    )
+    pre_cti_data = ac.Array2D.no_mask(
+        values=np.arange(49.0).reshape(7, 7) + 100.0, pixel_scales=1.0
+    )
+
+    dataset_2d = ac.ImagingCI(
+        data=data,
+        noise_map=imaging_ci_7x7.noise_map,
+        pre_cti_data=pre_cti_data,
+        layout=imaging_ci_7x7.layout,
+    )
+
+    dataset = extract.dataset_1d_from(dataset_2d=dataset_2d, settings=settings)
+
+    assert dataset.data == pytest.approx(
+        extract.binned_array_1d_from(array=data, settings=settings), 1.0e-4
+    )
+    assert dataset.pre_cti_data == pytest.approx(
+        extract.binned_array_1d_from(array=pre_cti_data, settings=settings), 1.0e-4
+    )
+    assert dataset.noise_map == pytest.approx(
+        extract.binned_array_1d_from(array=imaging_ci_7x7.noise_map, settings=settings)
+        / np.sqrt(
+            extract.binned_array_1d_total_pixels_from(
+                array=imaging_ci_7x7.noise_map, settings=settings
+            )
+        ),
+        1.0e-4,
+    )
+
+
+def test__dataset_1d_from__noise_map_propagated_in_quadrature(imaging_ci_7x7):
+    extract = MockExtract2D(region_list=[(0, 3, 1, 3)])
+
+    noise_map = np.ones((7, 7))
+    noise_map[:, 2] = 2.0
+
+    dataset_2d = ac.ImagingCI(
+        data=imaging_ci_7x7.data,
+        noise_map=ac.Array2D.no_mask(values=noise_map, pixel_scales=1.0),
+        pre_cti_data=imaging_ci_7x7.pre_cti_data,
+        layout=imaging_ci_7x7.layout,
+    )
+
+    dataset = extract.dataset_1d_from(
+        dataset_2d=dataset_2d, settings=ac.SettingsExtract(pixels=(0, 2))
+    )
+
+    assert dataset.noise_map == pytest.approx(
+        np.array([np.sqrt(5.0) / 2.0, np.sqrt(5.0) / 2.0]), 1.0e-4
+    )
+
 
 def test__add_gaussian_noise_to(parallel_array):
     extract = MockExtract2D(region_list=[(1, 4, 0, 3)])
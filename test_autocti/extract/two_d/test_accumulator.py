@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import autocti as ac
+
+
+def test__add__single_exposure_same_as_stacked_array_2d_from(
+    parallel_array, parallel_masked_array
+):
+    extract = ac.Extract2DParallelFPR(region_list=[(1, 4, 0, 3), (5, 8, 0, 3)])
+
+    settings = ac.SettingsExtract(pixels=(0, 3))
+
+    accumulator = ac.Extract2DAccumulator(extract=extract, settings=settings)
+
+    accumulator.add(array=parallel_masked_array)
+
+    assert accumulator.total_exposures == 1
+    assert accumulator.stacked_array_2d == pytest.approx(
+        extract.stacked_array_2d_from(array=parallel_masked_array, settings=settings),
+        1.0e-4,
+    )
+    assert (
+        accumulator.stacked_array_2d_total_pixels
+        == extract.stacked_array_2d_total_pixels_from(
+            array=parallel_masked_array, settings=settings
+        )
+    ).all()
+    assert accumulator.binned_array_1d == pytest.approx(
+        extract.binned_array_1d_from(array=parallel_masked_array, settings=settings),
+        1.0e-4,
+    )
+    assert (
+        accumulator.binned_array_1d_total_pixels
+        == extract.binned_array_1d_total_pixels_from(
+            array=parallel_masked_array, settings=settings
+        )
+    ).all()
+
+
+def test__add_and_merge__multiple_exposures(parallel_array):
+    extract = ac.Extract2DParallelFPR(region_list=[(1, 4, 0, 3), (5, 8, 0, 3)])
+
+    settings = ac.SettingsExtract(pixels=(0, 1))
+
+    array_0 = parallel_array
+    array_1 = ac.Array2D.no_mask(values=3.0 * parallel_array.native, pixel_scales=1.0)
+
+    accumulator = ac.Extract2DAccumulator(extract=extract, settings=settings)
+
+    accumulator.add(array=array_0)
+    accumulator.add(array=array_1)
+
+    # The stacked pixels are 1.0 and 5.0 (array_0) and 3.0 and 15.0 (array_1).
+
+    assert accumulator.stacked_array_2d == pytest.approx(
+        np.array([[6.0, 6.0, 6.0]]), 1.0e-4
+    )
+    assert accumulator.stacked_variance_2d == pytest.approx(
+        np.array([[29.0, 29.0, 29.0]]), 1.0e-4
+    )
+    assert accumulator.stacked_noise_map_2d == pytest.approx(
+        np.array([[np.sqrt(29.0 / 4.0)] * 3]), 1.0e-4
+    )
+
+    accumulator_0 = ac.Extract2DAccumulator(extract=extract, settings=settings)
+    accumulator_0.add(array=array_0)
+
+    accumulator_1 = ac.Extract2DAccumulator(extract=extract, settings=settings)
+    accumulator_1.add(array=array_1)
+
+    accumulator_merged = ac.Extract2DAccumulator(extract=extract, settings=settings)
+    accumulator_merged.merge(accumulator=accumulator_0)
+    accumulator_merged.merge(accumulator=accumulator_1)
+
+    assert accumulator_merged.total_exposures == 2
+    assert accumulator_merged.stacked_array_2d == pytest.approx(
+        accumulator.stacked_array_2d, 1.0e-4
+    )
+    assert accumulator_merged.stacked_variance_2d == pytest.approx(
+        accumulator.stacked_variance_2d, 1.0e-4
+    )
+    assert accumulator_0.total_exposures == 1
+
+
+def test__add_via_fits(parallel_array, tmp_path):
+    file_path = tmp_path / "array.fits"
+
+    parallel_array.output_to_fits(file_path=file_path, overwrite=True)
+
+    extract = ac.Extract2DParallelFPR(region_list=[(1, 4, 0, 3), (5, 8, 0, 3)])
+
+    settings = ac.SettingsExtract(pixels=(0, 3))
+
+    accumulator = ac.Extract2DAccumulator(extract=extract, settings=settings)
+
+    accumulator.add_via_fits(file_path=file_path, pixel_scales=1.0)
+    accumulator.add_via_fits(file_path=file_path, pixel_scales=1.0)
+
+    assert accumulator.total_exposures == 2
+    assert accumulator.stacked_array_2d == pytest.approx(
+        extract.stacked_array_2d_from(array=parallel_array, settings=settings),
+        1.0e-4,
+    )
+    assert (accumulator.stacked_array_2d_total_pixels == 4).all()
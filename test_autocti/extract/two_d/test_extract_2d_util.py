@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+import autoarray as aa
+import autocti as ac
+
+from autocti import exc
+
+
+def test__masked_column_value_list_from():
+    array_2d = np.array([[1.0, 4.0, 7.0], [2.0, 5.0, 8.0], [3.0, 6.0, 30.0]])
+    mask_2d = np.array(
+        [[False, True, False], [False, False, False], [True, True, False]]
+    )
+
+    assert ac.util.extract_2d.masked_column_value_list_from(
+        array_2d=array_2d, mask_2d=mask_2d, value_str="median"
+    ) == [1.5, 5.0, 8.0]
+
+    assert ac.util.extract_2d.masked_column_value_list_from(
+        array_2d=array_2d, mask_2d=mask_2d, value_str="mean"
+    ) == pytest.approx([1.5, 5.0, 15.0], 1.0e-4)
+
+    assert ac.util.extract_2d.masked_column_value_list_from(
+        array_2d=array_2d, mask_2d=mask_2d, value_str="std"
+    ) == pytest.approx([0.5, 0.0, np.std([7.0, 8.0, 30.0])], 1.0e-4)
+
+    mask_2d = np.full(shape=(3, 3), fill_value=True)
+
+    assert np.isnan(
+        ac.util.extract_2d.masked_column_value_list_from(
+            array_2d=array_2d, mask_2d=mask_2d
+        )
+    ).all()
+
+    with pytest.raises(exc.ExtractException):
+        ac.util.extract_2d.masked_column_value_list_from(
+            array_2d=array_2d, mask_2d=mask_2d, value_str="mode"
+        )
+
+
+def test__region_column_median_list_from():
+    array_2d = np.array(
+        [
+            [0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 4.0, 7.0, 0.0],
+            [0.0, 2.0, 5.0, 8.0, 0.0],
+            [0.0, 3.0, 6.0, 9.0, 0.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0],
+        ]
+    )
+    mask_2d = np.full(shape=(5, 5), fill_value=False)
+
+    region_list = [
+        aa.Region2D(region=(2, 4, 1, 3)),
+        aa.Region2D(region=(1, 4, 3, 4)),
+        aa.Region2D(region=(2, 4, 3, 4)),
+    ]
+
+    assert ac.util.extract_2d.region_column_median_list_from(
+        array_2d=array_2d, mask_2d=mask_2d, region_list=region_list
+    ) == [2.5, 5.5, 8.0, 8.5]
+
+    mask_2d[2, 1] = True
+
+    assert ac.util.extract_2d.region_column_median_list_from(
+        array_2d=array_2d, mask_2d=mask_2d, region_list=region_list
+    ) == [3.0, 5.5, 8.0, 8.5]
@@ -0,0 +1,60 @@
+import autocti as ac
+
+
+def test__log_likelihood_from():
+    adaptive_express = ac.AdaptiveExpress(
+        log_likelihood_window=10.0, log_likelihood_error_bound=1.0
+    )
+
+    log_likelihood = adaptive_express.log_likelihood_from(
+        log_likelihood_coarse_func=lambda: -100.5,
+        log_likelihood_exact_func=lambda: -100.0,
+    )
+
+    assert log_likelihood == -100.0
+    assert adaptive_express.best_log_likelihood == -100.0
+    assert adaptive_express.total_exact == 1
+    assert adaptive_express.log_likelihood_error_list == [0.5]
+    assert adaptive_express.is_exact is False
+
+    log_likelihood = adaptive_express.log_likelihood_from(
+        log_likelihood_coarse_func=lambda: -200.0,
+        log_likelihood_exact_func=lambda: -199.0,
+    )
+
+    assert log_likelihood == -200.0
+    assert adaptive_express.total_coarse == 2
+    assert adaptive_express.total_exact == 1
+
+    log_likelihood = adaptive_express.log_likelihood_from(
+        log_likelihood_coarse_func=lambda: -95.0,
+        log_likelihood_exact_func=lambda: -97.0,
+    )
+
+    assert log_likelihood == -97.0
+    assert adaptive_express.best_log_likelihood == -97.0
+    assert adaptive_express.is_exact is True
+
+    log_likelihood = adaptive_express.log_likelihood_from(
+        log_likelihood_coarse_func=lambda: -300.0,
+        log_likelihood_exact_func=lambda: -299.0,
+    )
+
+    assert log_likelihood == -299.0
+    assert adaptive_express.total_coarse == 3
+
+
+def test__clocker_from():
+    adaptive_express = ac.AdaptiveExpress(parallel_express=1, serial_express=2)
+
+    clocker = ac.Clocker2D(parallel_express=5, serial_express=5)
+
+    clocker_coarse = adaptive_express.clocker_from(clocker=clocker)
+
+    assert clocker_coarse.parallel_express == 1
+    assert clocker_coarse.serial_express == 2
+    assert clocker.parallel_express == 5
+
+    clocker_coarse = adaptive_express.clocker_from(clocker=ac.Clocker1D(express=5))
+
+    assert clocker_coarse.express == 1
@@ -0,0 +1,57 @@
+import numpy as np
+import pickle
+
+from autocti.model.analysis_pool import SharedMemoryAnalysisPool
+from autocti.model.analysis_pool import shared_memory_dumps
+
+
+class MockAnalysis:
+    def __init__(self, norm):
+        self.data = norm * np.ones(shape=(100, 100))
+        self.data_view = self.data
+        self.small_array = np.ones(shape=(2,))
+
+    def log_likelihood_function(self, instance):
+        return float(instance * np.sum(self.data))
+
+
+def test__shared_memory_dumps():
+    shared_memory_list = []
+
+    analysis = MockAnalysis(norm=2.0)
+
+    analysis_bytes = shared_memory_dumps(
+        obj=analysis, shared_memory_list=shared_memory_list, min_bytes=1024
+    )
+
+    assert len(shared_memory_list) == 1
+    assert len(analysis_bytes) < analysis.data.nbytes
+
+    analysis_shared = pickle.loads(analysis_bytes)
+
+    assert (analysis_shared.data == analysis.data).all()
+    assert (analysis_shared.small_array == analysis.small_array).all()
+    assert analysis_shared.data_view is analysis_shared.data
+
+    np.ndarray(shape=(100, 100), dtype="float", buffer=shared_memory_list[0].buf)[
+        0, 0
+    ] = 5.0
+
+    assert analysis_shared.data[0, 0] == 5.0
+
+    for memory in shared_memory_list:
+        memory.close()
+        memory.unlink()
+
+
+def test__shared_memory_analysis_pool():
+    analyses = [MockAnalysis(norm=1.0), MockAnalysis(norm=2.0)]
+
+    pool = SharedMemoryAnalysisPool(analyses=analyses, n_processes=2, min_bytes=1024)
+
+    assert pool.log_likelihood_list_from(instance=3.0) == [30000.0, 60000.0]
+    assert pool(instance=3.0) == 90000.0
+
+    pool.close()
+
+    assert pool.shared_memory_list == []
@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+
+import autocti as ac
+
+from autocti import exc
+from autocti.model.emulator import parameter_vector_from
+
+
+def test__parameter_vector_from():
+    cti = ac.CTI2D(
+        parallel_trap_list=[
+            ac.TrapInstantCapture(density=1.0, release_timescale=2.0),
+            ac.TrapInstantCapture(density=3.0, release_timescale=4.0),
+        ],
+        parallel_ccd=ac.CCDPhase(
+            full_well_depth=1e4, well_notch_depth=0.0, well_fill_power=0.5
+        ),
+    )
+
+    assert parameter_vector_from(cti=cti) == pytest.approx(
+        np.array([1.0, 2.0, 3.0, 4.0, 1e4, 0.0, 0.5])
+    )
+
+
+def test__profile_from():
+    emulator = ac.Emulator(min_training_points=1, total_neighbors=10)
+
+    for x in np.linspace(0.0, 1.0, 11):
+        emulator.add_training_point(
+            parameter_vector=np.array([x]),
+            profile=np.array([x, 2.0 * x]),
+            log_likelihood=-x,
+            profile_log_likelihood=-x,
+        )
+
+    profile, variance = emulator.profile_from(parameter_vector=np.array([0.5]))
+
+    assert profile == pytest.approx(np.array([0.5, 1.0]), 1.0e-4)
+    assert variance == pytest.approx(0.0, abs=1.0e-4)
+
+    profile, variance = emulator.profile_from(parameter_vector=np.array([0.55]))
+
+    assert profile == pytest.approx(np.array([0.55, 1.1]), 1.0e-2)
+    assert variance < 0.01
+
+
+def test__log_likelihood_from():
+    data = np.array([1.0, 0.5, 0.25])
+
+    def profile_from(x):
+        return np.array([x, 0.5 * x, 0.25 * x])
+
+    def profile_log_likelihood_func(profile):
+        return float(-0.5 * np.sum((data - profile) ** 2.0))
+
+    emulator = ac.Emulator(
+        log_likelihood_window=1.0,
+        min_training_points=5,
+        validation_fraction=0.0,
+    )
+
+    exact_calls = []
+
+    def log_likelihood_from(x):
+        def log_likelihood_exact_func():
+            exact_calls.append(x)
+            profile = profile_from(x)
+            return 2.0 * profile_log_likelihood_func(profile) + 1.0, profile
+
+        return emulator.log_likelihood_from(
+            parameter_vector=np.array([x]),
+            profile_log_likelihood_func=profile_log_likelihood_func,
+            log_likelihood_exact_func=log_likelihood_exact_func,
+        )
+
+    for x in np.linspace(0.0, 10.0, 5):
+        log_likelihood_from(x)
+
+    assert emulator.total_exact == 5
+    assert emulator.total_emulated == 0
+    assert emulator.best_profile_log_likelihood == pytest.approx(
+        profile_log_likelihood_func(profile_from(0.0)), 1.0e-4
+    )
+
+    with pytest.raises(exc.PriorException):
+        log_likelihood_from(9.0)
+
+    assert emulator.total_exact == 5
+    assert emulator.total_emulated == 1
+
+    log_likelihood = log_likelihood_from(1.0)
+
+    assert log_likelihood == pytest.approx(
+        2.0 * profile_log_likelihood_func(profile_from(1.0)) + 1.0, 1.0e-8
+    )
+
+    assert emulator.total_exact == 6
+    assert exact_calls[-1] == 1.0
+    assert len(emulator.profile_log_likelihood_error_list) == 1
+
+    summary_dict = emulator.summary_dict()
+
+    assert summary_dict["total_exact"] == 6
+    assert summary_dict["total_emulated"] == 1
+    assert summary_dict["total_training_points"] == 6
+    assert "profile_log_likelihood_error_p95" in summary_dict
+
+
+def test__log_likelihood_from__validated_rejections_are_still_rejected():
+    emulator = ac.Emulator(
+        log_likelihood_window=1.0, min_training_points=2, validation_fraction=1.0
+    )
+
+    for x in [0.0, 10.0]:
+        emulator.log_likelihood_from(
+            parameter_vector=np.array([x]),
+            profile_log_likelihood_func=lambda profile: -float(profile[0]),
+            log_likelihood_exact_func=lambda: (-x, np.array([x])),
+        )
+
+    with pytest.raises(exc.PriorException):
+        emulator.log_likelihood_from(
+            parameter_vector=np.array([9.0]),
+            profile_log_likelihood_func=lambda profile: -float(profile[0]),
+            log_likelihood_exact_func=lambda: (-9.0, np.array([9.0])),
+        )
+
+    assert emulator.total_exact == 3
+    assert emulator.total_emulated == 1
+    assert emulator.total_validated == 1
+    assert emulator.total_false_rejections == 0
+    assert emulator.total_training_points == 3
+
+
+def test__log_likelihood_from__max_training_points():
+    emulator = ac.Emulator(min_training_points=100, max_training_points=3)
+
+    for x in range(5):
+        emulator.log_likelihood_from(
+            parameter_vector=np.array([float(x)]),
+            profile_log_likelihood_func=lambda profile: -float(profile[0]),
+            log_likelihood_exact_func=lambda: (-float(x), np.array([float(x)])),
+        )
+
+    assert emulator.total_training_points == 3
+    assert emulator.parameter_list[0] == pytest.approx(np.array([2.0]))
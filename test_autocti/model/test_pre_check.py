@@ -0,0 +1,131 @@
+import pytest
+
+import autocti as ac
+
+from autocti import exc
+
+
+def test__pre_check_ccd_well_fill():
+    pre_check = ac.PreCheckCCDWellFill()
+
+    cti = ac.CTI2D(
+        parallel_ccd=ac.CCDPhase(
+            full_well_depth=1e4, well_notch_depth=0.0, well_fill_power=0.5
+        )
+    )
+
+    assert pre_check.is_valid_from(cti=cti) is True
+
+    cti = ac.CTI2D(
+        parallel_ccd=ac.CCDPhase(
+            full_well_depth=1e4, well_notch_depth=0.0, well_fill_power=0.5
+        ),
+        serial_ccd=ac.CCDPhase(
+            full_well_depth=1e4, well_notch_depth=0.0, well_fill_power=1.5
+        ),
+    )
+
+    assert pre_check.is_valid_from(cti=cti) is False
+
+    cti = ac.CTI1D(
+        ccd=ac.CCDPhase(full_well_depth=1e4, well_notch_depth=2e4, well_fill_power=0.5)
+    )
+
+    assert pre_check.is_valid_from(cti=cti) is False
+
+
+def test__pre_check_trap_timescales():
+    pre_check = ac.PreCheckTrapTimescales.from_roe(
+        roe=ac.ROE(dwell_times=[1.0]), total_pixels=100
+    )
+
+    assert pre_check.release_timescale_range == (0.0, 100.0)
+
+    cti = ac.CTI2D(
+        parallel_trap_list=[ac.TrapInstantCapture(density=1.0, release_timescale=5.0)],
+        serial_trap_list=[ac.TrapInstantCapture(density=1.0, release_timescale=50.0)],
+    )
+
+    assert pre_check.is_valid_from(cti=cti) is True
+
+    cti = ac.CTI2D(
+        parallel_trap_list=[ac.TrapInstantCapture(density=1.0, release_timescale=5.0)],
+        serial_trap_list=[ac.TrapInstantCapture(density=1.0, release_timescale=500.0)],
+    )
+
+    assert pre_check.is_valid_from(cti=cti) is False
+
+    pre_check = ac.PreCheckTrapTimescales(release_timescale_range=(1.0, 100.0))
+
+    cti = ac.CTI2D(
+        parallel_trap_list=[ac.TrapInstantCapture(density=1.0, release_timescale=5.0)],
+        serial_trap_list=[ac.TrapInstantCapture(density=1.0, release_timescale=0.5)],
+    )
+
+    assert pre_check.is_valid_from(cti=cti) is False
+
+
+def test__pre_check_trap_timescales__fast_trap_which_trails_not_rejected():
+    roe = ac.ROE(dwell_times=[1.0])
+
+    pre_check = ac.PreCheckTrapTimescales.from_roe(roe=roe, total_pixels=10)
+
+    cti = ac.CTI1D(
+        trap_list=[ac.TrapInstantCapture(density=10.0, release_timescale=0.5)],
+        ccd=ac.CCDPhase(full_well_depth=1e4, well_notch_depth=0.0, well_fill_power=0.5),
+    )
+
+    data = ac.Array1D.no_mask(
+        values=[0.0, 0.0, 1000.0, 1000.0, 1000.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        pixel_scales=1.0,
+    )
+
+    post_cti_data = ac.Clocker1D(express=0, roe=roe).add_cti(data=data, cti=cti)
+
+    assert post_cti_data[5] > 1.0e-2
+    assert pre_check.is_valid_from(cti=cti) is True
+
+
+def test__pre_check_pipeline__counts_rejections():
+    pre_check = ac.PreCheckPipeline(
+        pre_check_list=[
+            ac.PreCheckCCDWellFill(),
+            ac.PreCheckTrapTimescales(release_timescale_range=(1.0, 100.0)),
+        ]
+    )
+
+    ccd = ac.CCDPhase(full_well_depth=1e4, well_notch_depth=0.0, well_fill_power=0.5)
+
+    pre_check.check(
+        cti=ac.CTI2D(
+            parallel_trap_list=[
+                ac.TrapInstantCapture(density=1.0, release_timescale=5.0)
+            ],
+            parallel_ccd=ccd,
+        )
+    )
+
+    with pytest.raises(exc.PriorException):
+        pre_check.check(
+            cti=ac.CTI2D(
+                parallel_trap_list=[
+                    ac.TrapInstantCapture(density=1.0, release_timescale=500.0)
+                ],
+                parallel_ccd=ccd,
+            )
+        )
+
+    with pytest.raises(exc.PriorException):
+        pre_check.check(
+            cti=ac.CTI2D(
+                parallel_ccd=ac.CCDPhase(
+                    full_well_depth=1e4, well_notch_depth=0.0, well_fill_power=-0.5
+                ),
+            )
+        )
+
+    assert pre_check.summary_dict() == {
+        "total_checked": 3,
+        "total_rejected": 2,
+        "rejection_count_dict": {"ccd_well_fill": 1, "trap_timescales": 1},
+    }
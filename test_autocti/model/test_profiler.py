@@ -0,0 +1,66 @@
+import json
+
+import autocti as ac
+
+from autocti import exc
+
+
+def test__call_and_stage__times_summed_per_call():
+    profiler = ac.LikelihoodProfiler()
+
+    for _ in range(3):
+        with profiler.call():
+            with profiler.stage(name="arctic_parallel"):
+                pass
+
+            with profiler.stage(name="arctic_parallel"):
+                pass
+
+            with profiler.stage(name="chi_squared"):
+                pass
+
+    assert profiler.total_calls == 3
+    assert len(profiler.time_array_dict["arctic_parallel"]) == 3
+    assert len(profiler.time_array_dict["chi_squared"]) == 3
+
+    for total, arctic_parallel in zip(
+        profiler.time_array_dict["total"], profiler.time_array_dict["arctic_parallel"]
+    ):
+        assert total >= arctic_parallel
+
+
+def test__call__recorded_if_exception_raised():
+    profiler = ac.LikelihoodProfiler()
+
+    try:
+        with profiler.call():
+            with profiler.stage(name="density_check"):
+                raise exc.PriorException
+    except exc.PriorException:
+        pass
+
+    assert profiler.total_calls == 1
+    assert len(profiler.time_array_dict["density_check"]) == 1
+
+
+def test__summary_dict_and_output_to_json(tmp_path):
+    profiler = ac.LikelihoodProfiler()
+
+    for time_seconds in [1.0, 2.0, 3.0, 4.0]:
+        profiler._add(name="chi_squared", time_seconds=time_seconds)
+
+    summary_dict = profiler.summary_dict()
+
+    assert summary_dict["chi_squared"]["calls"] == 4
+    assert summary_dict["chi_squared"]["total"] == 10.0
+    assert summary_dict["chi_squared"]["mean"] == 2.5
+    assert summary_dict["chi_squared"]["p50"] == 2.5
+    assert summary_dict["chi_squared"]["max"] == 4.0
+    assert 3.0 < summary_dict["chi_squared"]["p95"] <= 4.0
+
+    file_path = tmp_path / "likelihood_profile.json"
+
+    profiler.output_to_json(file_path=file_path)
+
+    with open(file_path) as f:
+        assert json.load(f) == summary_dict